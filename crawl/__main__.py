@@ -0,0 +1,10 @@
+"""`python -m crawl` 진입점 - 일괄 크롤링 CLI (cli.py) 실행"""
+import os
+import sys
+
+# 모듈들이 crawl/ 기준 경로(utils.*)로 import하므로 패키지 디렉터리를 경로에 추가
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from cli import main  # noqa: E402
+
+sys.exit(main())
@@ -0,0 +1,98 @@
+"""브라우저 프로필별 화면 전환 시간 및 메모리(RSS) 비교 벤치마크
+
+사용법:
+    python bench_browser_profile.py --profiles default lean --keywords VR 메타버스
+"""
+import argparse
+import asyncio
+import json
+import logging
+import time
+from datetime import datetime
+
+from dotenv import load_dotenv
+
+from utils.crawler_core import BidCrawlerTest
+from utils.browser_profile import get_browser_profile, release_user_data_dir
+from utils.driver_lifecycle import get_browser_rss
+
+logger = logging.getLogger(__name__)
+
+
+async def run_profile(profile_name: str, keywords: list, user_data_dir: str = None) -> dict:
+    """프로필 하나로 목록 이동 + 키워드 검색을 수행하고 측정값 반환"""
+    profile = get_browser_profile(profile_name)
+    crawler = BidCrawlerTest(user_data_dir=user_data_dir)
+    result = {"profile": profile.name, "keywords": keywords}
+    rss_samples = []
+
+    try:
+        start_time = time.monotonic()
+        crawler.setup_driver(profile)
+        result["driver_startup_seconds"] = round(time.monotonic() - start_time, 3)
+
+        start_time = time.monotonic()
+        await crawler.navigate_to_bid_list()
+        result["navigate_seconds"] = round(time.monotonic() - start_time, 3)
+        rss_samples.append(get_browser_rss(crawler.driver))
+
+        search_seconds = []
+        for keyword in keywords:
+            start_time = time.monotonic()
+            await crawler.perform_search(keyword)
+            search_seconds.append(round(time.monotonic() - start_time, 3))
+            rss_samples.append(get_browser_rss(crawler.driver))
+        result["search_seconds"] = search_seconds
+        result["startup"] = crawler.startup_stats
+        result["page_waits"] = crawler.waiter.get_stats()
+        result["rss_peak_mb"] = round(max(rss_samples) / 1024 / 1024, 1)
+        result["rss_last_mb"] = round(rss_samples[-1] / 1024 / 1024, 1)
+
+    finally:
+        if crawler.driver:
+            crawler._persist_cookies()
+            crawler.driver.quit()
+        release_user_data_dir(crawler.user_data_dir)
+
+    return result
+
+
+async def main():
+    parser = argparse.ArgumentParser(description="브라우저 프로필 벤치마크")
+    parser.add_argument("--profiles", nargs="+", default=["default", "lean"])
+    parser.add_argument("--keywords", nargs="+", default=["VR", "메타버스"])
+    parser.add_argument("--output", default=None, help="결과 JSON 저장 경로")
+    parser.add_argument("--user-data-dir", default=None,
+                        help="재사용할 Chrome 사용자 데이터 경로 (지정 시 두 번째 실행부터 캐시/쿠키 재사용)")
+    parser.add_argument("--repeat", type=int, default=1, help="프로필별 반복 실행 횟수 (cold/warm 비교)")
+    args = parser.parse_args()
+
+    results = []
+    for profile_name in args.profiles:
+        for run in range(args.repeat):
+            logger.info(f"\n{'='*30}\n프로필 '{profile_name}' 측정 시작 ({run + 1}/{args.repeat})\n{'='*30}")
+            result = await run_profile(profile_name, args.keywords, args.user_data_dir)
+            result["run"] = run + 1
+            results.append(result)
+
+    print(f"\n{'프로필':<10}{'회차':>6}{'시작(s)':>10}{'목록이동(s)':>14}{'검색 평균(s)':>14}{'RSS 최대(MB)':>14}")
+    for result in results:
+        searches = result.get("search_seconds") or [0]
+        print(
+            f"{result['profile']:<10}"
+            f"{result['run']:>6}"
+            f"{result.get('driver_startup_seconds', 0):>10.2f}"
+            f"{result.get('navigate_seconds', 0):>14.2f}"
+            f"{sum(searches) / len(searches):>14.2f}"
+            f"{result.get('rss_peak_mb', 0):>14.1f}"
+        )
+
+    output = args.output or f"bench_browser_profile_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json"
+    with open(output, 'w', encoding='utf-8') as f:
+        json.dump(results, f, ensure_ascii=False, indent=2)
+    logger.info(f"벤치마크 결과 저장 완료: {output}")
+
+
+if __name__ == "__main__":
+    load_dotenv()
+    asyncio.run(main())
@@ -0,0 +1,182 @@
+"""DataProcessor.process_crawling_results 벤치마크 (레코드별 정규식 루프 vs 컬럼 단위 추출)
+
+사용법:
+    python bench_data_processor.py --records 100000
+    python bench_data_processor.py --records 200000 --workers 4 8 16 --chunk-sizes 2000 5000 10000
+"""
+import argparse
+import logging
+import random
+import re
+import tempfile
+import time
+
+import pandas as pd
+
+from data_processor import DataProcessor
+from utils.parallel_processing import clean_results, tune_chunk_size
+from utils.constants import SEARCH_KEYWORDS
+
+logger = logging.getLogger(__name__)
+
+PERIOD_LABELS = ["사업기간", "계약기간", "수행기간", "용역기간"]
+METHODS = ["전자입찰", "직접제출", "수기 제출", "전자 제출(나라장터)", ""]
+
+
+def make_records(count: int, seed: int = 0) -> list:
+    """크롤링 결과(basic_info/detail_info) 형태의 합성 레코드 생성"""
+    rng = random.Random(seed)
+    records = []
+    for i in range(count):
+        month = rng.randint(1, 12)
+        day = rng.randint(1, 28)
+        labels = rng.sample(PERIOD_LABELS, rng.randint(0, 2))
+        notice_lines = ["1. 입찰에 부치는 사항", f"가. 공고명: 교육 플랫폼 구축 {i}"]
+        notice_lines += [f"나. {label}: 계약일로부터 {rng.randint(30, 365)}일" for label in labels]
+        notice_lines += ["\n\n2. 입찰참가자격", "가. 소프트웨어사업자 " * rng.randint(1, 20)]
+        progress_lines = [f"입찰서제출 개시 2025/{month:02d}/{day:02d} 10:00"]
+        progress_lines += [f"입찰서제출 마감 2025/{month:02d}/{day:02d} 18:00 ({rng.choice(METHODS)})"]
+        progress_lines += ["개찰 일시 2025/12/31 11:00"]
+        records.append({
+            "search_keyword": rng.choice(SEARCH_KEYWORDS),
+            "basic_info": {
+                "bid_number": f"R25BK{i:08d}-000",
+                "title": f"  교육 플랫폼 구축 용역 {i}\n\n",
+                "announce_agency": rng.choice(["조달청", "한국교육학술정보원", "부천대학"]),
+            },
+            "detail_info": {
+                "general_notice": "\n".join(notice_lines),
+                "bid_progress": "\n".join(progress_lines),
+            },
+        })
+    return records
+
+
+def attach_api_detail(records: list, seed: int = 0):
+    """selectPicInfo.do 응답 형태의 구조화 필드 추가 (본문 정규식 대신 API 값을 쓰는 경로 측정용)"""
+    rng = random.Random(seed)
+    for record in records:
+        month = rng.randint(1, 12)
+        record["api_detail"] = {
+            "result": {
+                "asignBdgtAmt": f"{rng.randint(10, 900) * 1000000:,}",
+                "bidClseDt": f"2025/{month:02d}/{rng.randint(1, 28):02d} 18:00",
+                "elctrnBidYn": rng.choice(["Y", "N"]),
+                "cntrctPrd": f"계약일로부터 {rng.randint(30, 365)}일",
+            },
+            "ErrorMsg": "정상적으로 조회되었습니다.",
+            "ErrorCode": 0,
+        }
+
+
+def legacy_process(processor: DataProcessor, results: list) -> pd.DataFrame:
+    """레코드별 정규식 루프 (이전 구현)"""
+    processed_data = []
+    for item in results:
+        basic_info = item.get('basic_info', {})
+        detail_info = item.get('detail_info', {})
+        general_notice = detail_info.get('general_notice', '')
+        bid_progress = detail_info.get('bid_progress', '')
+        bid_end_date = ""
+        if bid_progress:
+            matches = re.findall(r'입찰서제출.*?(\d{4}/\d{2}/\d{2}\s+\d{2}:\d{2})', bid_progress)
+            if matches:
+                bid_end_date = matches[-1]
+        processed_item = {
+            '키워드목록': ', '.join(SEARCH_KEYWORDS),
+            '검색키워드': item.get('search_keyword', ''),
+            '공고검색일': time.strftime('%Y-%m-%d'),
+            '공고명': basic_info.get('title', ''),
+            '공고기관': basic_info.get('announce_agency', ''),
+            '사업기간': processor.extract_project_period(general_notice),
+            '금액(VAT포함)': '',
+            '입찰마감일': bid_end_date,
+            '제안서 제출 방식': processor.extract_submission_method(bid_progress),
+            '정량평가점수': '',
+            '내용': general_notice
+        }
+        for key, value in processed_item.items():
+            if isinstance(value, str):
+                processed_item[key] = re.sub(r'\n+', '\n', value).strip()
+        processed_data.append(processed_item)
+    return pd.DataFrame(processed_data)
+
+
+def measure(func, *args) -> tuple:
+    start_time = time.perf_counter()
+    result = func(*args)
+    return result, time.perf_counter() - start_time
+
+
+def main():
+    parser = argparse.ArgumentParser(description="DataProcessor 처리 속도 비교")
+    parser.add_argument("--records", type=int, default=100000, help="합성 레코드 수")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--with-api-detail", action="store_true", help="상세 API 구조화 필드가 있는 경우도 측정")
+    parser.add_argument("--workers", type=int, nargs="*", default=[], help="병렬 가공 측정할 프로세스 수 (예: 2 4 8 16)")
+    parser.add_argument("--chunk-sizes", type=int, nargs="*", default=[], help="측정할 청크 크기 (기본: 자동)")
+    args = parser.parse_args()
+
+    records = make_records(args.records, args.seed)
+    processor = DataProcessor(export_path=tempfile.gettempdir(), workers=1)
+
+    legacy_df, legacy_seconds = measure(legacy_process, processor, records)
+    vectorized_df, vectorized_seconds = measure(processor.process_crawling_results, records)
+
+    # 두 구현의 결과가 같은지 확인
+    pd.testing.assert_frame_equal(
+        legacy_df.astype(str).reset_index(drop=True),
+        vectorized_df.astype(str).reset_index(drop=True)
+    )
+
+    print(f"{'구현':<12}{'레코드':>10}{'시간(s)':>10}{'레코드/s':>12}")
+    for name, seconds in (("legacy", legacy_seconds), ("vectorized", vectorized_seconds)):
+        print(f"{name:<12}{args.records:>10}{seconds:>10.2f}{args.records / seconds:>12.0f}")
+    print(f"속도 향상: {legacy_seconds / vectorized_seconds:.1f}배 (결과 동일)")
+
+    if args.with_api_detail:
+        attach_api_detail(records, args.seed)
+        _, api_seconds = measure(processor.process_crawling_results, records)
+        print(f"{'api_detail':<12}{args.records:>10}{api_seconds:>10.2f}{args.records / api_seconds:>12.0f}"
+              f"  (구조화 필드 우선, 본문 정규식은 API 값이 없는 행만)")
+
+    if args.workers:
+        bench_parallel(records, vectorized_df if not args.with_api_detail else None, args.workers, args.chunk_sizes)
+
+
+def process_frames(processor: DataProcessor, records: list, chunk_size: int = None) -> pd.DataFrame:
+    """분석표 내보내기와 같은 경로(iter_processed_frames)로 청크별 가공 후 합친 DataFrame"""
+    chunk_size = chunk_size or tune_chunk_size(len(records), processor.workers)
+    return pd.concat(processor.iter_processed_frames(records, chunk_size), ignore_index=True)
+
+
+def bench_parallel(records: list, expected_df, workers_list: list, chunk_sizes: list):
+    """작업 프로세스 수 x 청크 크기별 가공(iter_processed_frames)/정제(clean_results) 시간 측정
+
+    청크 크기를 주지 않으면 tune_chunk_size 기본값(프로세스마다 청크 4개)을 측정한다.
+    """
+    count = len(records)
+    serial_df, serial_seconds = measure(process_frames, DataProcessor(export_path=tempfile.gettempdir(), workers=1),
+                                        records)
+    serial_clean, serial_clean_seconds = measure(clean_results, records, 1)
+    if expected_df is not None:
+        pd.testing.assert_frame_equal(expected_df.reset_index(drop=True), serial_df)
+
+    print(f"\n{'프로세스':<8}{'청크':>8}{'가공(s)':>10}{'배율':>8}{'정제(s)':>10}{'배율':>8}")
+    print(f"{1:<8}{'-':>8}{serial_seconds:>10.2f}{1.0:>8.1f}{serial_clean_seconds:>10.2f}{1.0:>8.1f}")
+    for workers in workers_list:
+        for chunk_size in chunk_sizes or [None]:
+            size = tune_chunk_size(count, workers, chunk_size)
+            processor = DataProcessor(export_path=tempfile.gettempdir(), workers=workers)
+            df, seconds = measure(process_frames, processor, records, size)
+            cleaned, clean_seconds = measure(clean_results, records, workers, size)
+            # 병합 순서가 입력 순서와 같은지 확인
+            pd.testing.assert_frame_equal(serial_df, df)
+            assert cleaned == serial_clean
+            print(f"{workers:<8}{size:>8}{seconds:>10.2f}{serial_seconds / seconds:>8.1f}"
+                  f"{clean_seconds:>10.2f}{serial_clean_seconds / clean_seconds:>8.1f}")
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO)
+    main()
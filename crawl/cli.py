@@ -0,0 +1,312 @@
+"""무인 일괄 크롤링 실행 (cron/컨테이너용)
+
+사용법:
+    python -m crawl --keywords VR 메타버스 --start-date 2025-01-01 --end-date 2025-02-01 \
+        --engine xhr --workers 4 --output results.jsonl --time-budget 1800
+
+종료 코드:
+    0  모든 키워드 처리 완료
+    1  실행 실패 (결과 없음)
+    2  잘못된 인자
+    3  일부만 처리 (시간 예산 초과, 중지 신호, 키워드 처리 실패)
+    130 Ctrl+C (처음 누르면 부분 결과를 저장하고 종료, 한 번 더 누르면 즉시 종료)
+
+마지막 줄에 처리량 요약을 JSON 한 줄로 표준 출력에 출력한다 (로그는 표준 에러).
+"""
+import argparse
+import asyncio
+import functools
+import json
+import logging
+import os
+import signal
+import sys
+import time
+from datetime import date, datetime
+from typing import Dict, List, Optional, Tuple
+
+from dotenv import load_dotenv
+
+from data_processor import DataProcessor
+from utils.bid_record import as_dict
+from utils.browser_profile import BROWSER_PROFILES, get_browser_profile
+from utils.cancellation import CancellationToken, CrawlCancelled
+from utils.constants import SEARCH_KEYWORDS
+from utils.crawler_core import BidCrawlerTest
+from utils.parallel_processing import clean_results
+
+logger = logging.getLogger(__name__)
+
+EXIT_OK = 0
+EXIT_FAILED = 1
+EXIT_USAGE = 2
+EXIT_PARTIAL = 3
+EXIT_INTERRUPTED = 130
+
+
+def _parse_date(value: str) -> date:
+    try:
+        return datetime.strptime(value, "%Y-%m-%d").date()
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"날짜 형식 오류 (YYYY-MM-DD): {value}")
+
+
+def _post_date(record: Dict) -> Optional[date]:
+    """basic_info.post_date("2025/02/10 16:14\n(...)")의 날짜 부분"""
+    raw = (record.get('basic_info') or {}).get('post_date') or ""
+    try:
+        return datetime.strptime(raw.split()[0].replace("/", "-"), "%Y-%m-%d").date()
+    except (ValueError, IndexError):
+        return None
+
+
+def filter_by_date(records: List[Dict], start_date: Optional[date], end_date: Optional[date]) -> List[Dict]:
+    """게시일이 기간 안에 있는 결과만 남김 (게시일을 읽을 수 없는 결과는 유지)"""
+    if not start_date and not end_date:
+        return records
+    filtered = []
+    for record in records:
+        posted = _post_date(record)
+        if posted and ((start_date and posted < start_date) or (end_date and posted > end_date)):
+            continue
+        filtered.append(record)
+    return filtered
+
+
+def write_json(records: List[Dict], path: str, summary: Dict):
+    """cleanup()과 같은 정제된 구조로 저장"""
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump({
+            "timestamp": datetime.now().strftime('%Y%m%d_%H%M%S'),
+            "summary": summary,
+            "results": clean_results(records)
+        }, f, ensure_ascii=False, indent=2)
+
+
+def write_xlsx(records: List[Dict], path: str, summary: Dict):
+    """가공된 분석표(입찰공고 시트)를 constant_memory 모드로 저장"""
+    processor = DataProcessor(export_path=os.path.dirname(path) or ".")
+    processor.export_results_to_excel(records, os.path.basename(path))
+
+
+def write_parquet(records: List[Dict], path: str, summary: Dict, partition_by_month: bool = False):
+    """가공된 분석표를 타입이 지정된 Parquet으로 저장 (partition_by_month면 path는 디렉터리)"""
+    processor = DataProcessor(export_path=os.path.dirname(path) or ".")
+    processor.export_results_to_parquet(records, os.path.basename(path), partition_by_month=partition_by_month)
+
+
+def write_csv(records: List[Dict], path: str, summary: Dict, partition_by_month: bool = False):
+    """가공된 분석표를 CSV로 이어 쓰며 저장 (partition_by_month면 path는 디렉터리)"""
+    processor = DataProcessor(export_path=os.path.dirname(path) or ".")
+    processor.export_results_to_csv(records, os.path.basename(path), partition_by_month=partition_by_month)
+
+
+def write_jsonl(records: List[Dict], path: str, summary: Dict):
+    """원본 결과를 한 줄에 한 건씩 저장"""
+    with open(path, 'w', encoding='utf-8') as f:
+        for record in records:
+            f.write(json.dumps(as_dict(record), ensure_ascii=False))
+            f.write("\n")
+
+
+# 출력 형식 -> 저장 함수 (확장자로 형식 추정)
+OUTPUT_WRITERS = {
+    "json": write_json,
+    "jsonl": write_jsonl,
+    "xlsx": write_xlsx,
+    "parquet": write_parquet,
+    "csv": write_csv,
+}
+# 게시월 파티션 저장을 지원하는 형식
+PARTITIONED_FORMATS = {"parquet", "csv"}
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(prog="python -m crawl", description="나라장터 입찰공고 일괄 크롤링")
+    parser.add_argument("--keywords", nargs="+", default=None, help="검색 키워드 (기본: constants.SEARCH_KEYWORDS)")
+    parser.add_argument("--keywords-file", default=None, help="한 줄에 키워드 하나씩 적힌 파일")
+    parser.add_argument("--start-date", type=_parse_date, default=None, help="게시일 시작 (YYYY-MM-DD)")
+    parser.add_argument("--end-date", type=_parse_date, default=None, help="게시일 종료 (YYYY-MM-DD)")
+    parser.add_argument("--engine", choices=["dom", "xhr"], default="dom",
+                        help="목록/상세 추출 방식: dom(화면) 또는 xhr(응답 JSON 캡처)")
+    parser.add_argument("--profile", choices=sorted(BROWSER_PROFILES), default=None,
+                        help="브라우저 프로필 (기본: CHROME_PROFILE 환경변수)")
+    parser.add_argument("--workers", type=int, default=3, help="API 상세 보강 동시 작업 수")
+    parser.add_argument("--detail-tabs", type=int, default=None, help="상세 페이지 탭 수 (0이면 클릭 후 뒤로가기)")
+    parser.add_argument("--list-only", action="store_true",
+                        help="목록 값만 수집 (상세 페이지/API 상세 생략, hydrated=false로 표시)")
+    parser.add_argument("--output", default=None,
+                        help="결과 저장 경로 (기본: your_data_path/batch_results_<시각>.json)")
+    parser.add_argument("--format", choices=sorted(OUTPUT_WRITERS), default=None,
+                        help="출력 형식 (기본: 출력 경로 확장자)")
+    parser.add_argument("--partition-by-month", action="store_true",
+                        help="parquet/csv 출력을 게시월별 디렉터리(게시월=YYYY-MM)로 나누어 저장")
+    parser.add_argument("--collapse-synonyms", action="store_true",
+                        help="띄어쓰기/표기 변형과 동의어 묶음(VR/가상현실 등)도 한 번만 검색 (기본: KEYWORD_COLLAPSE_SYNONYMS 환경변수)")
+    parser.add_argument("--time-budget", type=float, default=None,
+                        help="전체 시간 예산(초), 초과 시 부분 결과 저장 후 종료 코드 3")
+    parser.add_argument("--summary-file", default=None, help="처리량 요약 JSON 저장 경로 (표준 출력과 별도)")
+    return parser
+
+
+def resolve_keywords(args) -> List[str]:
+    keywords = list(args.keywords or [])
+    if args.keywords_file:
+        with open(args.keywords_file, 'r', encoding='utf-8') as f:
+            keywords.extend(line.strip() for line in f if line.strip())
+    return keywords or list(SEARCH_KEYWORDS)
+
+
+def resolve_output(args) -> Tuple[str, str]:
+    path = args.output or os.path.join(
+        "your_data_path", f"batch_results_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json"
+    )
+    output_format = args.format or os.path.splitext(path)[1].lstrip(".").lower()
+    if output_format not in OUTPUT_WRITERS:
+        raise ValueError(f"지원하지 않는 출력 형식: {output_format} (지원: {', '.join(sorted(OUTPUT_WRITERS))})")
+    if args.partition_by_month and output_format not in PARTITIONED_FORMATS:
+        raise ValueError(f"--partition-by-month는 {', '.join(sorted(PARTITIONED_FORMATS))} 형식에서만 사용할 수 있습니다.")
+    return path, output_format
+
+
+def _on_interrupt(cancel_token: CancellationToken):
+    """Ctrl+C: 처음에는 부분 결과를 저장하고 끝나도록 토큰 취소, 이미 취소 중이면 즉시 중단"""
+    if cancel_token.cancelled:
+        raise KeyboardInterrupt
+    cancel_token.cancel("interrupt")
+
+
+def _install_signal_handlers(cancel_token: CancellationToken):
+    """SIGTERM(컨테이너 종료)/SIGINT(Ctrl+C) 시 부분 결과를 저장하고 끝나도록 토큰 취소"""
+    loop = asyncio.get_running_loop()
+    handlers = (
+        (signal.SIGTERM, functools.partial(cancel_token.cancel, "signal")),
+        (signal.SIGINT, functools.partial(_on_interrupt, cancel_token)),
+    )
+    for sig, handler in handlers:
+        try:
+            loop.add_signal_handler(sig, handler)
+        except (NotImplementedError, RuntimeError):
+            # Windows 이벤트 루프는 시그널 핸들러를 지원하지 않음 (Ctrl+C는 KeyboardInterrupt로 처리)
+            pass
+
+
+async def run_batch(args) -> Tuple[int, Dict]:
+    """크롤링 실행 후 (종료 코드, 처리량 요약) 반환"""
+    keywords = resolve_keywords(args)
+    output_path, output_format = resolve_output(args)
+    cancel_token = CancellationToken.from_env(args.time_budget)
+    _install_signal_handlers(cancel_token)
+
+    crawler = BidCrawlerTest(capture_xhr=args.engine == "xhr", detail_tabs=args.detail_tabs,
+                             list_only=args.list_only)
+    crawler.use_cancel_token(cancel_token)
+    start_time = time.monotonic()
+    results: List[Dict] = []
+    error = None
+
+    try:
+        crawler.setup_driver(get_browser_profile(args.profile))
+        await cancel_token.run(crawler.navigate_to_bid_list())
+        results = await crawler.run_pipeline(keywords, enricher_count=args.workers, cancel_token=cancel_token,
+                                             collapse_synonyms=args.collapse_synonyms or None)
+    except CrawlCancelled as e:
+        logger.warning(f"일괄 크롤링 중단 ({e.reason})")
+    except Exception as e:
+        error = str(e)
+        logger.error(f"일괄 크롤링 실패: {error}")
+    finally:
+        if not results and crawler.pipeline:
+            results = crawler.pipeline.results
+        # 결과는 아래에서 직접 내보내므로 수집 결과 저장소는 내보낸 뒤 닫음
+        await crawler.cleanup(save_results=False, keep_records=True)
+
+    elapsed = time.monotonic() - start_time
+    results = filter_by_date(results, args.start_date, args.end_date)
+    processed = [keyword for keyword in keywords if keyword in crawler.processed_keywords]
+    summary = {
+        "status": "ok",
+        "keywords_total": len(keywords),
+        "keywords_processed": len(processed),
+        "results": len(results),
+        "elapsed_seconds": round(elapsed, 3),
+        "results_per_minute": round(len(results) / elapsed * 60, 2) if elapsed else 0.0,
+        "keywords_per_minute": round(len(processed) / elapsed * 60, 2) if elapsed else 0.0,
+        "cancelled": cancel_token.reason,
+        "error": error,
+        "engine": args.engine,
+        "list_only": args.list_only,
+        "workers": args.workers,
+        "driver_restarts": crawler.watchdog.stats["restarts"] + len(crawler.lifecycle.recycles),
+        "output": None,
+        "output_format": output_format,
+        "pipeline": crawler.pipeline.get_stats() if crawler.pipeline else {},
+        "keyword_plan": crawler.keyword_plan.get_stats() if crawler.keyword_plan else {}
+    }
+
+    if results:
+        try:
+            os.makedirs(os.path.dirname(output_path) or ".", exist_ok=True)
+            writer = OUTPUT_WRITERS[output_format]
+            if args.partition_by_month:
+                writer = functools.partial(writer, partition_by_month=True)
+            writer(results, output_path, {
+                "total_keywords": len(keywords),
+                "total_results": len(results),
+                "processed_count": len(processed)
+            })
+            summary["output"] = output_path
+            logger.info(f"결과 저장 완료: {output_path} ({len(results)}건)")
+        except Exception as e:
+            error = error or f"결과 저장 실패: {str(e)}"
+            summary["error"] = error
+            logger.error(error)
+    crawler.close_records()
+
+    if cancel_token.reason == "interrupt":
+        summary["status"] = "partial"
+        return EXIT_INTERRUPTED, summary
+    if error and not summary["output"]:
+        summary["status"] = "failed"
+        return EXIT_FAILED, summary
+    if error or cancel_token.cancelled or len(processed) < len(keywords):
+        summary["status"] = "partial"
+        return EXIT_PARTIAL, summary
+    return EXIT_OK, summary
+
+
+def emit_summary(summary: Dict, exit_code: int, summary_file: Optional[str] = None):
+    """처리량 요약을 JSON 한 줄로 표준 출력(과 summary_file)에 출력"""
+    summary["exit_code"] = exit_code
+    line = json.dumps(summary, ensure_ascii=False)
+    if summary_file:
+        with open(summary_file, 'w', encoding='utf-8') as f:
+            f.write(line + "\n")
+    print(line)
+
+
+def main(argv: List[str] = None) -> int:
+    load_dotenv()
+    parser = build_parser()
+    args = parser.parse_args(argv)
+    if args.workers < 1:
+        parser.error("--workers는 1 이상이어야 합니다.")
+    if args.keywords_file and not os.path.isfile(args.keywords_file):
+        parser.error(f"키워드 파일을 찾을 수 없습니다: {args.keywords_file}")
+
+    try:
+        exit_code, summary = asyncio.run(run_batch(args))
+    except ValueError as e:
+        print(str(e), file=sys.stderr)
+        return EXIT_USAGE
+    except KeyboardInterrupt:
+        # 부분 결과 저장 전에 중단된 경우 (Ctrl+C 두 번, 시그널 핸들러 미지원 환경)
+        emit_summary({"status": "interrupted", "output": None}, EXIT_INTERRUPTED, args.summary_file)
+        return EXIT_INTERRUPTED
+
+    emit_summary(summary, exit_code, args.summary_file)
+    return exit_code
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,17 +1,164 @@
-from typing import List, Dict
+from typing import List, Dict, Iterable, Iterator
+import numpy as np
 import pandas as pd
 import os
+import json
 from datetime import datetime
 import logging
 import re
+from functools import lru_cache
+import xlsxwriter
 from utils.constants import SEARCH_KEYWORDS
+from utils.detail_fields import detail_result, extract_detail_frame, format_periods
+from utils.parallel_processing import (
+    imap_ordered, iter_chunks, process_chunk, process_export_chunk, resolve_workers
+)
 
 
 logger = logging.getLogger(__name__)
 
+RESULT_COLUMNS = [
+    '키워드목록', '검색키워드', '공고검색일', '공고명', '공고기관', '사업기간',
+    '금액(VAT포함)', '입찰마감일', '제안서 제출 방식', '정량평가점수', '내용'
+]
+CLEANUP_COLUMNS = ['검색키워드', '공고명', '공고기관', '사업기간', '입찰마감일', '내용']
+EXCEL_COLUMN_WIDTHS = {
+    '키워드목록': 15,
+    '검색키워드': 12,
+    '공고검색일': 12,
+    '공고명': 40,
+    '공고기관': 20,
+    '사업기간': 15,
+    '금액(VAT포함)': 15,
+    '입찰마감일': 12,
+    '제안서 제출 방식': 15,
+    '정량평가점수': 12,
+    '내용': 50
+}
+# 내보내기 시 한 번에 가공하는 결과 건수
+EXPORT_CHUNK_SIZE = 5000
+
+# Parquet/CSV 내보내기용 추가 컬럼과 타입
+EXPORT_COLUMNS = ['공고번호', '게시일', '추정가격', '개찰일시', '계약방법', '사업시작일', '사업종료일']
+TYPED_COLUMNS = RESULT_COLUMNS + EXPORT_COLUMNS + ['게시월']
+# Parquet 컬럼 타입 (pyarrow 타입 별칭 - 스키마는 Parquet 저장 시 parquet_schema()로 생성)
+PARQUET_FIELDS = [
+    ('키워드목록', 'string'),
+    ('검색키워드', 'string'),
+    ('공고검색일', 'date32'),
+    ('공고명', 'string'),
+    ('공고기관', 'string'),
+    ('사업기간', 'string'),
+    ('금액(VAT포함)', 'int64'),
+    ('입찰마감일', 'timestamp[s]'),
+    ('제안서 제출 방식', 'string'),
+    ('정량평가점수', 'float64'),
+    ('내용', 'string'),
+    ('공고번호', 'string'),
+    ('게시일', 'date32'),
+    ('추정가격', 'int64'),
+    ('개찰일시', 'timestamp[s]'),
+    ('계약방법', 'string'),
+    ('사업시작일', 'date32'),
+    ('사업종료일', 'date32'),
+    ('게시월', 'string'),
+]
+PARQUET_COMPRESSION = 'zstd'
+
+
+def _import_pyarrow():
+    """Parquet 저장에만 쓰는 pyarrow를 필요할 때 import (없어도 Excel/CSV/JSON 저장은 동작)"""
+    try:
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+    except ImportError as e:
+        raise ImportError("Parquet 저장에는 pyarrow가 필요합니다: pip install pyarrow") from e
+    return pa, pq
+
+
+@lru_cache(maxsize=1)
+def parquet_schema():
+    pa, _ = _import_pyarrow()
+    return pa.schema([(name, pa.type_for_alias(alias)) for name, alias in PARQUET_FIELDS])
+
+
+# 사업기간 패턴 (우선순위 순서) - 한 패턴이 일치하면 그 뒤 패턴은 보지 않음
+PERIOD_PATTERNS = [
+    re.compile(rf"{label}기간[:\s]*([\d\s~년월일]+)")
+    for label in ("사업", "계약", "수행", "용역")
+]
+# re.findall(r'입찰서제출.*?(일시)')[-1]과 같은 결과 - 탐욕적 .*로 마지막 '입찰서제출'부터 같은 줄의 일시를 찾음
+BID_END_PATTERN = re.compile(r"^.*입찰서제출[^\n]*?(\d{4}/\d{2}/\d{2}\s+\d{2}:\d{2})", re.DOTALL)
+NEWLINES_PATTERN = re.compile(r"\n{2,}")
+# 본문에 적힌 정량평가 배점 ("정량평가(20점)", "정량적 평가 : 30 점") - 대부분은 제안요청서 첨부파일에만 있음
+QUANTITATIVE_SCORE_PATTERN = re.compile(r"정량적?\s*평가[^\d\n]{0,10}?(\d+(?:\.\d+)?)\s*점")
+
+
+def _contains(series: pd.Series, text: str) -> np.ndarray:
+    """리터럴 포함 여부 (정규식 엔진을 거치지 않는 빠른 사전 필터, 문자열이 아닌 값(NaN 등)은 False)"""
+    return np.fromiter((isinstance(value, str) and text in value for value in series),
+                       dtype=bool, count=len(series))
+
+
+def _clean_text(series: pd.Series) -> pd.Series:
+    """여러 개의 개행문자를 하나로 통일하고 앞뒤 공백 제거 (연속 개행이 있는 행만 치환)"""
+    mask = _contains(series, "\n\n")
+    if mask.any():
+        series = series.copy()
+        series[mask] = series[mask].str.replace(NEWLINES_PATTERN, "\n", regex=True)
+    return series.str.strip()
+
+
+def to_raw_record(record: Dict) -> Dict:
+    """정제본(keyword/bid_info/details, cleanup() 저장 형식)을 원본 형식(basic_info/detail_info)으로 변환
+
+    정제본에는 입찰진행(bid_progress)이 없으므로 입찰마감일/제출방식은 비어 있게 된다.
+    """
+    if 'basic_info' in record or 'bid_info' not in record:
+        return record
+    bid_info = record.get('bid_info') or {}
+    details = record.get('details') or {}
+    return {
+        'search_keyword': record.get('keyword', ''),
+        'hydrated': record.get('hydrated', True),
+        'basic_info': {
+            'bid_number': bid_info.get('number', ''),
+            'title': bid_info.get('title', ''),
+            'announce_agency': bid_info.get('agency', ''),
+            'post_date': bid_info.get('date', ''),
+            'progress_stage': bid_info.get('stage', '-'),
+            'process_status': bid_info.get('status', '-')
+        },
+        'detail_info': {
+            'general_notice': details.get('notice', ''),
+            'bid_qualification': details.get('qualification', ''),
+            'bid_notice_files': details.get('files', [])
+        }
+    }
+
+
+def iter_result_file(path: str) -> Iterator[Dict]:
+    """저장된 결과 파일에서 원본 결과(basic_info/detail_info)를 한 건씩 읽음
+
+    .jsonl(배치 실행 출력)은 한 줄씩 읽고, .json은 파일의 "results" 목록을 사용한다.
+    정제본으로 저장된 결과는 원본 형식으로 바꾸어 반환한다.
+    """
+    if path.endswith('.jsonl'):
+        with open(path, 'r', encoding='utf-8') as f:
+            for line in f:
+                if line.strip():
+                    yield to_raw_record(json.loads(line))
+    else:
+        with open(path, 'r', encoding='utf-8') as f:
+            for record in json.load(f).get('results', []):
+                yield to_raw_record(record)
+
+
 class DataProcessor:
-    def __init__(self):
-        self.export_path = "E:/smh/crawl/exports"
+    def __init__(self, export_path: str = "E:/smh/crawl/exports", workers: int = None):
+        self.export_path = export_path
+        # 가공 작업 프로세스 수 (기본 1 = 현재 프로세스에서 처리, 병렬 가공은 POSTPROCESS_WORKERS로 켤 때만)
+        self.workers = resolve_workers(workers)
         os.makedirs(self.export_path, exist_ok=True)
         
     def extract_project_period(self, notice_text: str) -> str:
@@ -19,15 +166,8 @@ class DataProcessor:
         if not notice_text:
             return ""
         
-        patterns = [
-            r"사업기간[:\s]*([\d\s~년월일]+)",
-            r"계약기간[:\s]*([\d\s~년월일]+)",
-            r"수행기간[:\s]*([\d\s~년월일]+)",
-            r"용역기간[:\s]*([\d\s~년월일]+)",
-        ]
-        
-        for pattern in patterns:
-            match = re.search(pattern, notice_text)
+        for pattern in PERIOD_PATTERNS:
+            match = pattern.search(notice_text)
             if match:
                 return match.group(1).strip()
         return ""
@@ -57,79 +197,155 @@ class DataProcessor:
             return "직접제출"
         return ""
 
-    def process_crawling_results(self, results: List[Dict]) -> pd.DataFrame:
-        """크롤링 결과를 DataFrame으로 변환"""
-        processed_data = []
-        
+    @staticmethod
+    def _structured_columns(fields: pd.DataFrame) -> pd.DataFrame:
+        """상세 API 구조화 필드를 분석표 컬럼 값으로 변환 (값이 없으면 빈 문자열, 전자입찰은 True/False/None)"""
+        def amount(series: pd.Series) -> pd.Series:
+            return series.astype(object).where(series.notna(), '')
+
+        def stamp(series: pd.Series, fmt: str) -> pd.Series:
+            text = pd.Series('', index=series.index, dtype=object)
+            present = series.dropna()
+            if len(present):
+                text[present.index] = present.dt.strftime(fmt)
+            return text
+
+        return pd.DataFrame({
+            '금액(VAT포함)': amount(fields['budget_amount']),
+            '입찰마감일': stamp(fields['bid_deadline'], '%Y/%m/%d %H:%M'),
+            '전자입찰': fields['electronic_bid'],
+            '사업기간': format_periods(fields),
+            '추정가격': amount(fields['estimated_price']),
+            '개찰일시': stamp(fields['opening'], '%Y/%m/%d %H:%M'),
+            '계약방법': fields['contract_method'].fillna('').astype(object),
+            '사업시작일': stamp(fields['period_start'], '%Y-%m-%d'),
+            '사업종료일': stamp(fields['period_end'], '%Y-%m-%d')
+        }, index=fields.index)
+
+    def process_crawling_results(self, results: List[Dict], export_columns: bool = False) -> pd.DataFrame:
+        """크롤링 결과를 DataFrame으로 변환 (export_columns=True면 공고번호/게시일 컬럼 추가)
+
+        금액/입찰마감일/제출방식/사업기간은 상세 API 응답(api_detail)의 구조화 필드를 먼저 사용하고,
+        API 값이 없는 행만 본문(general_notice/bid_progress)에서 컬럼 단위 .str.extract로 추출한다.
+        구조화 추출은 result가 있는 응답에만 적용한다 (조회 실패/목록 전용 결과는 바로 본문 추출).
+        정규식은 리터럴 사전 필터('기간', '입찰서제출', 연속 개행)를 통과한 행에만 적용한다.
+        """
+        rows = []
+        api_details = []
         for item in results:
             try:
-                basic_info = item.get('basic_info', {})
-                detail_info = item.get('detail_info', {})
-                
-                # 공고 내용과 사업기간
-                general_notice = detail_info.get('general_notice', '')
-                project_period = self.extract_project_period(general_notice)
-                
-                # 제안서 제출 방식
-                bid_progress = detail_info.get('bid_progress', '')
-                submission_method = self.extract_submission_method(bid_progress)
-                
-                # 입찰 마감일
-                bid_end_date = ""
-                if bid_progress:
-                    matches = re.findall(r'입찰서제출.*?(\d{4}/\d{2}/\d{2}\s+\d{2}:\d{2})', bid_progress)
-                    if matches:
-                        bid_end_date = matches[-1]  # 가장 마지막 날짜 사용
-                
-                processed_item = {
-                    '키워드목록': ', '.join(SEARCH_KEYWORDS),  # constants.py에서 가져온 전체 키워드 목록
-                    '검색키워드': item.get('search_keyword', ''),
-                    '공고검색일': datetime.now().strftime('%Y-%m-%d'),
-                    '공고명': basic_info.get('title', ''),
-                    '공고기관': basic_info.get('announce_agency', ''),
-                    '사업기간': project_period,
-                    '금액(VAT포함)': '',  # 제안요청서에서 추출 필요
-                    '입찰마감일': bid_end_date,
-                    '제안서 제출 방식': submission_method,
-                    '정량평가점수': '',  # 제안요청서에서 추출 필요
-                    '내용': general_notice
-                }
-                
-                # 특수문자 및 개행문자 정리
-                for key, value in processed_item.items():
-                    if isinstance(value, str):
-                        # 여러 개의 개행문자를 하나로 통일
-                        value = re.sub(r'\n+', '\n', value)
-                        # 앞뒤 공백 제거
-                        value = value.strip()
-                        processed_item[key] = value
-                
-                processed_data.append(processed_item)
-                
+                basic_info = item.get('basic_info') or {}
+                detail_info = item.get('detail_info') or {}
+                rows.append((
+                    item.get('search_keyword', ''),
+                    basic_info.get('title', ''),
+                    basic_info.get('announce_agency', ''),
+                    detail_info.get('general_notice', ''),
+                    detail_info.get('bid_progress', ''),
+                    basic_info.get('bid_number', ''),
+                    basic_info.get('post_date', '')
+                ))
+                api_details.append(item.get('api_detail'))
             except Exception as e:
                 logger.error(f"데이터 처리 중 오류: {str(e)}")
                 continue
 
-        df = pd.DataFrame(processed_data)
+        columns = RESULT_COLUMNS + EXPORT_COLUMNS if export_columns else RESULT_COLUMNS
+        if not rows:
+            return pd.DataFrame(columns=columns)
+
+        raw = pd.DataFrame(rows, columns=['검색키워드', '공고명', '공고기관', '내용', 'bid_progress', '공고번호', '게시일'],
+                           dtype=object)
+        raw = raw.fillna('').astype(object)
+        with_api = [index for index, api_detail in enumerate(api_details) if detail_result(api_detail) is not None]
+        api = self._structured_columns(
+            extract_detail_frame([api_details[index] for index in with_api]).set_axis(with_api)
+        )
+        if len(with_api) < len(raw):
+            api = api.reindex(raw.index).fillna({column: '' for column in api.columns if column != '전자입찰'})
+        notice = raw['내용']
+        progress = raw['bid_progress']
+
+        # 사업기간: API 값이 없는 행만 패턴 우선순위(사업 > 계약 > 수행 > 용역)대로, 아직 못 찾은 행에 다음 패턴 적용
+        project_period = api['사업기간'].copy()
+        pending = (project_period == '').to_numpy() & _contains(notice, "기간")
+        for pattern in PERIOD_PATTERNS:
+            if not pending.any():
+                break
+            found = notice[pending].str.extract(pattern)[0].dropna()
+            project_period[found.index] = found.str.strip()
+            pending[found.index] = False
+
+        # 입찰마감일: API 값이 없으면 마지막 '입찰서제출' 뒤의 일시
+        bid_end_date = api['입찰마감일'].copy()
+        has_submission = (bid_end_date == '').to_numpy() & _contains(progress, "입찰서제출")
+        if has_submission.any():
+            bid_end_date[has_submission] = progress[has_submission].str.extract(BID_END_PATTERN)[0].fillna('')
+
+        # 제안서 제출 방식: API 전자입찰 여부(Y/N), 없으면 '전자'가 있으면 전자제출, 없고 '직접'/'수기'가 있으면 직접제출
+        electronic = api['전자입찰'].to_numpy()
+        submission_method = np.select(
+            [electronic == True, electronic == False,  # 값이 없는(None) 행은 두 조건 모두 거짓
+             _contains(progress, "전자"), _contains(progress, "직접") | _contains(progress, "수기")],
+            ["전자제출", "직접제출", "전자제출", "직접제출"],
+            default=""
+        )
+
+        # 정량평가점수: 본문에 배점이 적힌 행만
+        quantitative_score = pd.Series('', index=raw.index, dtype=object)
+        has_score = _contains(notice, "정량")
+        if has_score.any():
+            quantitative_score[has_score] = notice[has_score].str.extract(QUANTITATIVE_SCORE_PATTERN)[0].fillna('')
+
+        df = pd.DataFrame({
+            '키워드목록': ', '.join(SEARCH_KEYWORDS),  # constants.py에서 가져온 전체 키워드 목록
+            '검색키워드': raw['검색키워드'],
+            '공고검색일': datetime.now().strftime('%Y-%m-%d'),
+            '공고명': raw['공고명'],
+            '공고기관': raw['공고기관'],
+            '사업기간': project_period,
+            '금액(VAT포함)': api['금액(VAT포함)'],  # 상세 API 배정예산 (없으면 빈 값)
+            '입찰마감일': bid_end_date,
+            '제안서 제출 방식': submission_method,
+            '정량평가점수': quantitative_score,
+            '내용': notice,
+            '공고번호': raw['공고번호'],
+            '게시일': raw['게시일'],
+            '추정가격': api['추정가격'],
+            '개찰일시': api['개찰일시'],
+            '계약방법': api['계약방법'],
+            '사업시작일': api['사업시작일'],
+            '사업종료일': api['사업종료일']
+        }, columns=columns)
+
+        # 특수문자 및 개행문자 정리
+        for column in CLEANUP_COLUMNS:
+            df[column] = _clean_text(df[column])
+
         return df
 
-    def export_to_excel(self, df: pd.DataFrame, filename: str = None) -> str:
-        """DataFrame을 Excel 파일로 저장"""
-        if filename is None:
-            filename = f"입찰공고분석_{datetime.now().strftime('%Y%m%d_%H%M')}.xlsx"
-            
-        file_path = os.path.join(self.export_path, filename)
-        
+    def iter_processed_frames(self, results: Iterable[Dict], chunk_size: int = EXPORT_CHUNK_SIZE) -> Iterator[pd.DataFrame]:
+        """결과를 chunk_size건씩 나누어 가공한 DataFrame을 차례로 반환 (전체 결과를 한 번에 올리지 않음)
+
+        workers가 2 이상이면 청크를 프로세스 풀에서 가공하고 입력 순서대로 반환한다.
+        """
+        if self.workers > 1:
+            yield from imap_ordered(process_chunk, iter_chunks(results, chunk_size), self.workers)
+            return
+        for chunk in iter_chunks(results, chunk_size):
+            yield self.process_crawling_results(chunk)
+
+    def _write_excel(self, file_path: str, frames: Iterable[pd.DataFrame]) -> int:
+        """가공된 DataFrame들을 xlsxwriter constant_memory 모드로 한 행씩 기록 - 기록한 행 수 반환
+
+        constant_memory 모드는 다음 행으로 넘어갈 때 이전 행을 디스크로 내보내므로
+        행은 위에서부터 순서대로 써야 하고, 열 너비/헤더 행 높이는 먼저 지정한다.
+        """
+        workbook = xlsxwriter.Workbook(file_path, {'constant_memory': True})
         try:
-            # Excel 스타일 설정
-            writer = pd.ExcelWriter(file_path, engine='xlsxwriter')
-            df.to_excel(writer, sheet_name='입찰공고', index=False)
-            
-            # 워크북과 워크시트 가져오기
-            workbook = writer.book
-            worksheet = writer.sheets['입찰공고']
-            
-            # 헤더 포맷
+            worksheet = workbook.add_worksheet('입찰공고')
+
+            # 헤더/내용 셀 포맷은 한 번만 만들어 모든 행에서 재사용
             header_format = workbook.add_format({
                 'bold': True,
                 'bg_color': '#4472C4',
@@ -139,48 +355,182 @@ class DataProcessor:
                 'valign': 'vcenter',
                 'align': 'center'
             })
-            
-            # 내용 셀 포맷
             content_format = workbook.add_format({
                 'text_wrap': True,
                 'valign': 'top',
                 'align': 'left',
                 'border': 1
             })
-            
-            # 컬럼 너비 설정
-            column_widths = {
-                '키워드목록': 15,
-                '검색키워드': 12,
-                '공고검색일': 12,
-                '공고명': 40,
-                '공고기관': 20,
-                '사업기간': 15,
-                '금액(VAT포함)': 15,
-                '입찰마감일': 12,
-                '제안서 제출 방식': 15,
-                '정량평가점수': 12,
-                '내용': 50
-            }
-            
-            # 포맷 적용
-            for idx, (col, width) in enumerate(column_widths.items()):
-                worksheet.set_column(idx, idx, width)
-                worksheet.write(0, idx, col, header_format)
-                
-                # 내용 컬럼에 대해 모든 행에 content_format 적용
-                if col == '내용':
-                    for row in range(1, len(df) + 1):
-                        worksheet.write(row, idx, df.iloc[row-1][col], content_format)
-            
-            # 행 높이 설정
+
+            # 컬럼 너비 및 행 높이 설정
+            for idx, col in enumerate(RESULT_COLUMNS):
+                worksheet.set_column(idx, idx, EXCEL_COLUMN_WIDTHS[col])
             worksheet.set_default_row(30)  # 기본 행 높이
             worksheet.set_row(0, 40)  # 헤더 행 높이
+            worksheet.write_row(0, 0, RESULT_COLUMNS, header_format)
+
+            content_idx = RESULT_COLUMNS.index('내용')
+            row = 0
+            for df in frames:
+                for values in df[RESULT_COLUMNS].itertuples(index=False, name=None):
+                    row += 1
+                    worksheet.write_row(row, 0, values[:content_idx])
+                    worksheet.write_string(row, content_idx, values[content_idx], content_format)
+        finally:
+            workbook.close()
+        return row
+
+    def export_to_excel(self, df: pd.DataFrame, filename: str = None) -> str:
+        """DataFrame을 Excel 파일로 저장"""
+        if filename is None:
+            filename = f"입찰공고분석_{datetime.now().strftime('%Y%m%d_%H%M')}.xlsx"
             
-            writer.close()
-            logger.info(f"Excel 파일 저장 완료: {file_path}")
+        file_path = os.path.join(self.export_path, filename)
+        
+        try:
+            rows = self._write_excel(file_path, [df])
+            logger.info(f"Excel 파일 저장 완료: {file_path} ({rows}행)")
             return file_path
             
         except Exception as e:
             logger.error(f"Excel 파일 저장 중 오류: {str(e)}")
-            raise
\ No newline at end of file
+            raise
+
+    def export_results_to_excel(self, results: Iterable[Dict], filename: str = None,
+                                chunk_size: int = EXPORT_CHUNK_SIZE) -> str:
+        """크롤링 결과(리스트, 제너레이터, iter_result_file)를 가공하면서 바로 Excel로 저장
+
+        결과를 chunk_size건씩 가공해 바로 기록하므로 전체 DataFrame을 만들지 않고,
+        메모리 사용량은 결과 건수와 관계없이 chunk 하나 크기로 유지된다.
+        """
+        if filename is None:
+            filename = f"입찰공고분석_{datetime.now().strftime('%Y%m%d_%H%M')}.xlsx"
+
+        file_path = os.path.join(self.export_path, filename)
+
+        try:
+            rows = self._write_excel(file_path, self.iter_processed_frames(results, chunk_size))
+            logger.info(f"Excel 파일 저장 완료: {file_path} ({rows}행)")
+            return file_path
+
+        except Exception as e:
+            logger.error(f"Excel 파일 저장 중 오류: {str(e)}")
+            raise
+
+    def to_typed_frame(self, df: pd.DataFrame) -> pd.DataFrame:
+        """export_columns=True로 가공한 DataFrame의 컬럼을 분석용 타입으로 변환
+
+        날짜는 date/datetime, 금액은 정수(Int64), 점수는 실수로 바꾸고 읽을 수 없는 값은 결측으로 둔다.
+        게시일 기준 월(YYYY-MM, 게시일이 없으면 'unknown')을 게시월 컬럼으로 추가한다.
+        """
+        typed = df.copy()
+        typed['공고검색일'] = pd.to_datetime(typed['공고검색일'], format='%Y-%m-%d', errors='coerce').dt.date
+        # post_date 예: "2025/02/10 16:14\n(2025/02/10 16:14)"
+        post_date = pd.to_datetime(
+            typed['게시일'].astype(str).str.slice(0, 10).str.replace('-', '/', regex=False),
+            format='%Y/%m/%d', errors='coerce'
+        )
+        typed['게시일'] = post_date.dt.date
+        typed['게시월'] = post_date.dt.strftime('%Y-%m').fillna('unknown')
+        typed['입찰마감일'] = pd.to_datetime(typed['입찰마감일'], format='%Y/%m/%d %H:%M', errors='coerce')
+        typed['금액(VAT포함)'] = pd.to_numeric(
+            typed['금액(VAT포함)'].astype(str).str.replace(r'[^\d]', '', regex=True), errors='coerce'
+        ).astype('Int64')
+        typed['정량평가점수'] = pd.to_numeric(typed['정량평가점수'], errors='coerce').astype('float64')
+        typed['추정가격'] = pd.to_numeric(typed['추정가격'], errors='coerce').astype('Int64')
+        typed['개찰일시'] = pd.to_datetime(typed['개찰일시'], format='%Y/%m/%d %H:%M', errors='coerce')
+        for column in ('사업시작일', '사업종료일'):
+            typed[column] = pd.to_datetime(typed[column], format='%Y-%m-%d', errors='coerce').dt.date
+        return typed[TYPED_COLUMNS]
+
+    def iter_typed_frames(self, results: Iterable[Dict], chunk_size: int = EXPORT_CHUNK_SIZE) -> Iterator[pd.DataFrame]:
+        """결과를 chunk_size건씩 가공/타입 변환한 DataFrame을 차례로 반환 (workers가 2 이상이면 프로세스 풀 사용)"""
+        if self.workers > 1:
+            yield from imap_ordered(process_export_chunk, iter_chunks(results, chunk_size), self.workers)
+            return
+        for chunk in iter_chunks(results, chunk_size):
+            yield self.to_typed_frame(self.process_crawling_results(chunk, export_columns=True))
+
+    def export_results_to_parquet(self, results: Iterable[Dict], filename: str = None,
+                                  partition_by_month: bool = False, chunk_size: int = EXPORT_CHUNK_SIZE) -> str:
+        """크롤링 결과를 타입이 지정된 Parquet으로 저장 (chunk마다 row group 하나)
+
+        partition_by_month=True면 filename을 디렉터리로 보고 게시월=YYYY-MM/ 아래에 나누어 저장한다.
+        """
+        if filename is None:
+            filename = f"입찰공고분석_{datetime.now().strftime('%Y%m%d_%H%M')}" + ("" if partition_by_month else ".parquet")
+
+        file_path = os.path.join(self.export_path, filename)
+        pa, pq = _import_pyarrow()
+        schema = parquet_schema()
+
+        try:
+            rows = 0
+            writer = None
+            try:
+                for index, df in enumerate(self.iter_typed_frames(results, chunk_size)):
+                    table = pa.Table.from_pandas(df, schema=schema, preserve_index=False)
+                    if partition_by_month:
+                        pq.write_to_dataset(
+                            table, root_path=file_path, partition_cols=['게시월'],
+                            basename_template=f"chunk{index:05d}-{{i}}.parquet",
+                            existing_data_behavior='overwrite_or_ignore', compression=PARQUET_COMPRESSION
+                        )
+                    else:
+                        if writer is None:
+                            writer = pq.ParquetWriter(file_path, schema, compression=PARQUET_COMPRESSION)
+                        writer.write_table(table)
+                    rows += len(df)
+                if writer is None and not partition_by_month:
+                    # 결과가 없어도 스키마만 있는 파일 생성
+                    pq.write_table(schema.empty_table(), file_path, compression=PARQUET_COMPRESSION)
+            finally:
+                if writer is not None:
+                    writer.close()
+            logger.info(f"Parquet 저장 완료: {file_path} ({rows}행)")
+            return file_path
+
+        except Exception as e:
+            logger.error(f"Parquet 저장 중 오류: {str(e)}")
+            raise
+
+    def export_results_to_csv(self, results: Iterable[Dict], filename: str = None,
+                              partition_by_month: bool = False, chunk_size: int = EXPORT_CHUNK_SIZE) -> str:
+        """크롤링 결과를 chunk 단위로 이어 쓰는 CSV로 저장 (Excel에서 열 수 있도록 UTF-8 BOM)
+
+        partition_by_month=True면 filename을 디렉터리로 보고 게시월=YYYY-MM/part.csv로 나누어 저장한다.
+        """
+        if filename is None:
+            filename = f"입찰공고분석_{datetime.now().strftime('%Y%m%d_%H%M')}" + ("" if partition_by_month else ".csv")
+
+        file_path = os.path.join(self.export_path, filename)
+        columns = [col for col in TYPED_COLUMNS if not (partition_by_month and col == '게시월')]
+        handles = {}
+
+        def open_csv(path: str):
+            os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+            handle = open(path, 'w', encoding='utf-8-sig', newline='')
+            pd.DataFrame(columns=columns).to_csv(handle, index=False)
+            return handle
+
+        try:
+            rows = 0
+            try:
+                if not partition_by_month:
+                    handles[None] = open_csv(file_path)
+                for df in self.iter_typed_frames(results, chunk_size):
+                    groups = df.groupby('게시월', sort=False) if partition_by_month else [(None, df)]
+                    for month, group in groups:
+                        if month not in handles:
+                            handles[month] = open_csv(os.path.join(file_path, f"게시월={month}", "part.csv"))
+                        group[columns].to_csv(handles[month], header=False, index=False)
+                    rows += len(df)
+            finally:
+                for handle in handles.values():
+                    handle.close()
+            logger.info(f"CSV 저장 완료: {file_path} ({rows}행)")
+            return file_path
+
+        except Exception as e:
+            logger.error(f"CSV 저장 중 오류: {str(e)}")
+            raise
@@ -17,6 +17,13 @@ from utils.constants import SEARCH_KEYWORDS
 from utils.error_handler import ErrorHandler, CrawlerException
 from utils.http_client import http_client
 from utils.crawler_core import BidCrawlerTest, SearchValidator, NaraMarketCrawler
+from utils.rate_limiter import rate_limiter
+from utils.cancellation import CancellationToken, CrawlCancelled
+from utils.hydration import detail_hydrator
+from utils.excel_export import excel_export_cache
+from utils.detail_fields import detail_result
+from utils.detail_projection import api_detail_projector
+from utils.keyword_normalizer import plan_keyword_crawls
 
 from dotenv import load_dotenv
 import os
@@ -48,6 +55,8 @@ async def lifespan(app: FastAPI):
     logger.info("크롤링 서버 오픈완료")
     yield
     # 종료할 때 실행될 코드
+    await detail_hydrator.close()
+    excel_export_cache.close()
     logger.info("크롤링 서버가 종료됨됨")
 
 app = FastAPI(lifespan=lifespan)
@@ -73,6 +82,8 @@ class SearchModel(BaseModel):
     keywords: List[str] = Field(..., min_items=1)
     startDate: date
     endDate: date
+    timeBudget: Optional[float] = None  # 작업 전체 시간 예산(초), 미지정 시 CRAWL_JOB_BUDGET_SECONDS
+    listOnly: bool = False  # True면 목록 값만 수집 (상세는 /api/bids/{bid_number}/hydrate로 조회)
     
     class Config:
         json_schema_extra = {
@@ -105,9 +116,9 @@ class BasicInfo(BaseModel):
     bid_progress: str = "-"
 
 class ApiDetail(BaseModel):
-    result: dict = {}
-    ErrorMsg: str
-    ErrorCode: int
+    result: dict = {}  # 수집 시 필요한 필드만 남김 (utils.detail_projection)
+    ErrorMsg: Optional[str] = None
+    ErrorCode: Optional[int] = None
 
 class DetailInfo(BaseModel):
     general_notice: Optional[str] = None
@@ -148,42 +159,50 @@ class CrawlingState:
         self.next_crawl_time = None
         # 필요하다면 processed_keywords 추가
         self.processed_keywords = set()  # 처리된 키워드 추적용
+        self.crawler = None  # 실행 중인 크롤러 (파이프라인/요청 속도 통계 조회용)
+        self.cancel_token = None  # 실행 중인 일괄 크롤링(/api/start)의 취소 토큰 (/api/stop에서 취소)
+        self.search_tokens = set()  # 진행 중인 /api/search 요청별 취소 토큰 (/api/stop에서 함께 취소)
 
 
 # 크롤링 상태 인스턴스
 crawling_state = CrawlingState()
 
-async def perform_crawling(start_date: str, end_date: str):
+async def perform_crawling(start_date: str, end_date: str, time_budget: Optional[float] = None,
+                           list_only: bool = False):
     """일괄 크롤링 수행"""
-    crawler = BidCrawlerTest()
+    crawler = BidCrawlerTest(list_only=list_only)
+    cancel_token = CancellationToken.from_env(time_budget)
+    crawler.use_cancel_token(cancel_token)
+    crawling_state.crawler = crawler
+    crawling_state.cancel_token = cancel_token
     results = []  # 결과 변수를 먼저 초기화
     
+    async def on_keyword(keyword: str, index: int):
+        crawling_state.current_keyword = keyword
+        
+        # WebSocket 메시지 전송
+        for connection in crawling_state.active_connections:
+            await connection.send_json({
+                "type": "crawling_status",
+                "current_keyword": keyword,
+                "processed_count": len(crawler.pipeline.results) if crawler.pipeline else 0,
+                "total_keywords": len(SEARCH_KEYWORDS)
+            })
+    
     try:
         crawler.setup_driver()
         await crawler.navigate_to_bid_list()  # initialize() 대신 navigate_to_bid_list() 사용
         
-        for keyword in SEARCH_KEYWORDS:
-            if not crawling_state.is_running:
-                break
-                
-            crawling_state.current_keyword = keyword
-            
-            # WebSocket 메시지 전송
-            for connection in crawling_state.active_connections:
-                await connection.send_json({
-                    "type": "crawling_status",
-                    "current_keyword": keyword,
-                    "processed_count": len(results),
-                    "total_keywords": len(SEARCH_KEYWORDS)
-                })
-            
-            # 검색 수행
-            keyword_results = await crawler.perform_search(keyword)
-            if keyword_results:
-                results.extend(keyword_results)
-            
-            await asyncio.sleep(1)  # 과도한 요청 방지
+        # 목록 수집/상세 보강/저장 단계를 겹쳐 실행 (요청 간격은 rate_limiter가 조절)
+        results = await crawler.run_pipeline(
+            SEARCH_KEYWORDS,
+            should_stop=lambda: not crawling_state.is_running,
+            on_keyword=on_keyword,
+            cancel_token=cancel_token
+        )
 
+    except CrawlCancelled as e:
+        logger.info(f"크롤링 중단 ({e.reason})")
     except Exception as e:
         logger.error(f"크롤링 중 오류: {e}")
         # WebSocket 메시지 전송
@@ -193,9 +212,16 @@ async def perform_crawling(start_date: str, end_date: str):
                 "message": str(e)
             })
     finally:
+        if not results and crawler.pipeline:  # 중간 오류 시 파이프라인에서 수집된 결과 사용
+            results = crawler.pipeline.results
         if results:  # 결과가 있을 경우에만 저장
             crawler.save_all_crawling_results(results)
         await crawler.cleanup()
+        # 끝난 작업이 실행 중으로 보이지 않도록 상태 초기화 (그 사이 새 작업이 시작됐으면 유지)
+        if crawling_state.crawler is crawler:
+            crawling_state.crawler = None
+            crawling_state.cancel_token = None
+            crawling_state.is_running = False
 
 
 # WebSocket 엔드포인트
@@ -213,30 +239,84 @@ async def websocket_endpoint(websocket: WebSocket):
 class CrawlStartParams(BaseModel):
     startDate: str
     endDate: str
+    timeBudget: Optional[float] = None  # 작업 전체 시간 예산(초)
+    listOnly: bool = False  # True면 목록 값만 수집
 
 # API 엔드포인트
 @app.post("/api/start")
 async def start_crawling(params: CrawlStartParams):
     if not crawling_state.is_running:
         crawling_state.is_running = True
-        asyncio.create_task(perform_crawling(params.startDate, params.endDate))
+        asyncio.create_task(perform_crawling(params.startDate, params.endDate, params.timeBudget, params.listOnly))
     return {"status": "started"}
 
 @app.post("/api/stop")
 async def stop_crawling():
     crawling_state.is_running = False
+    # 진행 중인 검색/행 수집/상세 조회까지 중단하고 부분 결과 반환
+    if crawling_state.cancel_token:
+        crawling_state.cancel_token.cancel("stop")
+    for cancel_token in list(crawling_state.search_tokens):
+        cancel_token.cancel("stop")
     return {"status": "stopped"}
 
+@app.get("/api/crawl-stats")
+async def get_crawl_stats():
+    """실행 중인 크롤링의 파이프라인 큐 깊이/단계 사용률, 요청 속도, 대기 시간 통계"""
+    crawler = crawling_state.crawler
+    return {
+        "is_running": crawling_state.is_running,
+        "current_keyword": crawling_state.current_keyword,
+        "cancellation": crawling_state.cancel_token.get_stats() if crawling_state.cancel_token else {},
+        "active_searches": len(crawling_state.search_tokens),
+        "pipeline": crawler.pipeline.get_stats() if crawler and crawler.pipeline else {},
+        "keyword_plan": crawler.keyword_plan.get_stats() if crawler and crawler.keyword_plan else {},
+        "page_waits": crawler.waiter.get_stats() if crawler and crawler.waiter else {},
+        "page_state": crawler.state_machine.get_stats() if crawler and crawler.state_machine else {},
+        "startup": crawler.startup_stats if crawler else {},
+        "driver_lifecycle": crawler.lifecycle.get_stats() if crawler else {},
+        "watchdog": crawler.watchdog.get_stats() if crawler else {},
+        "record_store": crawler.record_store.get_stats() if crawler else {},
+        "hydration": detail_hydrator.get_stats(),
+        "api_detail_projection": api_detail_projector.get_stats(),
+        "excel_export": excel_export_cache.get_stats(),
+        "rate_limits": rate_limiter.get_stats()
+    }
+
+@app.get("/api/bids/{bid_number}/hydrate")
+async def hydrate_bid(bid_number: str, detail_page: bool = True):
+    """목록 전용으로 수집된 공고의 상세 정보(detail_info/api_detail)를 조회 (결과는 캐시)"""
+    entry = await detail_hydrator.hydrate(bid_number, detail_page=detail_page)
+    if detail_result(entry.get("api_detail")) is None and not entry.get("detail_info"):
+        raise HTTPException(status_code=502, detail=f"상세 정보 조회 실패: {bid_number}")
+
+    # 실행 중인 크롤러의 결과에도 반영
+    crawler = crawling_state.crawler
+    if crawler:
+        for record in crawler.all_results:
+            if record.bid_number == bid_number:
+                detail_hydrator.apply(record, entry)
+    return entry
+
 @app.get("/api/download-excel/{filename}")
 async def download_excel(filename: str):
-    file_path = f"file_path_downloaded_documents"
-    if os.path.exists(file_path):
-        return FileResponse(
-            file_path,
-            media_type="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",
-            filename=filename
-        )
-    raise HTTPException(status_code=404, detail="파일을 찾을 수 없습니다.")
+    """결과 스냅샷(/api/crawl-results의 file_info.filename)을 분석표 Excel로 내려받기
+
+    생성은 프로세스 풀에서 하고 스냅샷 내용 해시로 캐시하므로 같은 스냅샷은 한 번만 만든다.
+    """
+    snapshot_path = excel_export_cache.resolve_snapshot(filename)
+    if snapshot_path is None:
+        raise HTTPException(status_code=404, detail="파일을 찾을 수 없습니다.")
+    try:
+        file_path = await excel_export_cache.get_or_build(snapshot_path)
+    except Exception as e:
+        logger.error(f"Excel 생성 중 오류: {str(e)}")
+        raise HTTPException(status_code=500, detail="Excel 생성 중 오류가 발생했습니다.")
+    return FileResponse(
+        file_path,
+        media_type="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",
+        filename=f"{os.path.splitext(os.path.basename(snapshot_path))[0]}.xlsx"
+    )
 
 # main.py의 search 엔드포인트
 @app.post("/api/search", response_model=SearchResponse)
@@ -244,13 +324,20 @@ async def search(params: SearchModel):
    try:
        logger.info(f"검색 요청 수신 - 키워드: {params.keywords}, 시작일: {params.startDate}, 종료일: {params.endDate}")
        
-       crawler = BidCrawlerTest()
+       crawler = BidCrawlerTest(list_only=params.listOnly)
+       cancel_token = CancellationToken.from_env(params.timeBudget)
+       crawler.use_cancel_token(cancel_token)
+       # 요청별 토큰으로 관리 (실행 중인 /api/start 작업의 토큰을 덮어쓰지 않음)
+       crawling_state.search_tokens.add(cancel_token)
        all_results = []
        total_processed = 0
        
        try:
-           crawler.setup_driver()
-           await crawler.navigate_to_bid_list()
+           try:
+               crawler.setup_driver()
+               await cancel_token.run(crawler.navigate_to_bid_list())
+           except CrawlCancelled as e:
+               logger.info(f"검색 중단 ({e.reason}): 목록 화면 진입 전")
            
            # WebSocket 클라이언트들에게 검색 시작 알림
            for connection in crawling_state.active_connections:
@@ -259,7 +346,11 @@ async def search(params: SearchModel):
                    "total_keywords": len(params.keywords)
                })
            
-           for keyword in params.keywords:
+           # 대소문자/전각만 다른 검색어는 한 번만 검색
+           keyword_plan = plan_keyword_crawls(params.keywords)
+           for keyword in keyword_plan.searches:
+               if cancel_token.cancelled:
+                   break
                crawling_state.current_keyword = keyword
                
                # 검색 진행상황 전송
@@ -267,11 +358,16 @@ async def search(params: SearchModel):
                    await connection.send_json({
                        "type": "search_progress",
                        "keyword": keyword,
-                       "progress": f"{total_processed + 1}/{len(params.keywords)}"
+                       "progress": f"{total_processed + 1}/{len(keyword_plan.searches)}"
                    })
                
-               # 검색 수행 및 결과 수집
-               results = await crawler.perform_search(keyword)
+               # 검색 수행 및 결과 수집 (중지 요청/시간 예산 초과 시 지금까지 수집된 행으로 응답)
+               try:
+                   results = await cancel_token.run(crawler.perform_search(keyword, cancel_token=cancel_token))
+               except CrawlCancelled as e:
+                   logger.info(f"검색 중단 ({e.reason}): 키워드 '{keyword}' 처리 중")
+                   all_results = list(crawler.all_results)
+                   break
                if results:
                    # 각 결과에 검색 키워드 정보 추가
                    for result in results:
@@ -280,7 +376,6 @@ async def search(params: SearchModel):
                    logger.info(f"키워드 '{keyword}' 검색 결과: {len(results)}건 추가")
                
                total_processed += 1
-               await asyncio.sleep(1)
            
            # 전체 결과 저장
            if all_results:
@@ -320,6 +415,7 @@ async def search(params: SearchModel):
                })
            raise HTTPException(status_code=500, detail=str(e))
        finally:
+           crawling_state.search_tokens.discard(cancel_token)
            if not all_results:  # 결과가 없는 경우에만 여기서 cleanup 호출
                await crawler.cleanup()
            
@@ -0,0 +1,5 @@
+import os
+import sys
+
+# crawl/ 디렉터리 기준 import (from utils... / from data_processor ...)
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
@@ -0,0 +1,74 @@
+import sys
+
+import pytest
+
+from utils.bid_record import BidRecord, RecordBlobStore, as_dict, to_dicts
+
+
+@pytest.fixture
+def store(tmp_path):
+    store = RecordBlobStore(str(tmp_path))
+    yield store
+    store.close()
+
+
+def make_record():
+    return {
+        "search_keyword": "VR",
+        "basic_info": {"bid_number": "R25BK00630352-000", "title": "VR 콘텐츠 개발", "agency": "조달청", "memo": "추가"},
+        "detail_info": {"general_notice": "사업기간: 2025년 1월 ~ 3월"},
+        "api_detail": {"result": {"bidPbancNo": "R25BK00630352"}},
+        "source": "xhr"
+    }
+
+
+def test_round_trip_keeps_dict_shape(store):
+    original = make_record()
+    record = BidRecord.from_dict(original, store)
+    assert record.to_dict() == original
+    assert as_dict(record) == original
+    assert to_dicts([record, original]) == [original, original]
+    assert record.bid_number == "R25BK00630352-000"
+    assert len(record) == len(original)
+
+
+def test_blob_fields_live_in_store(store):
+    record = BidRecord.from_dict(make_record(), store)
+    assert store.stats["writes"] == 2
+    assert record["detail_info"]["general_notice"].startswith("사업기간")
+    assert store.stats["reads"] == 1
+    record["api_detail"] = {"result": {}}
+    assert record.get("api_detail") == {"result": {}}
+
+
+def test_mapping_operations(store):
+    record = BidRecord(store, "VR", {"bid_number": "1"})
+    assert "api_detail" not in record
+    assert record.get("api_detail") is None
+    record["hydrated"] = False
+    assert record["hydrated"] is False
+    del record["hydrated"]
+    assert "hydrated" not in record
+    with pytest.raises(KeyError):
+        del record["basic_info"]
+    # basic_info는 매번 새 dict이므로 전체를 다시 대입해야 바뀜
+    record["basic_info"]["title"] = "무시됨"
+    assert "title" not in record["basic_info"]
+    record["basic_info"] = {**record["basic_info"], "title": "VR"}
+    assert record["basic_info"] == {"bid_number": "1", "title": "VR"}
+
+
+def test_repeated_strings_are_interned(store):
+    agency = "".join(["조달", "청"])
+    first = BidRecord(store, "VR", {"agency": agency})
+    second = BidRecord(store, "VR", {"agency": "".join(["조", "달청"])})
+    assert first["basic_info"]["agency"] is second["basic_info"]["agency"]
+    assert first["basic_info"]["agency"] is sys.intern("조달청")
+
+
+def test_closed_store_cannot_be_read(tmp_path):
+    store = RecordBlobStore(str(tmp_path))
+    record = BidRecord.from_dict(make_record(), store)
+    store.close()
+    with pytest.raises(ValueError):
+        record["detail_info"]
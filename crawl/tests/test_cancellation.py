@@ -0,0 +1,56 @@
+import asyncio
+
+import pytest
+
+from utils.cancellation import CancellationToken, CrawlCancelled
+
+
+def test_cancel_keeps_first_reason():
+    token = CancellationToken()
+    assert not token.cancelled
+    token.cancel("stop")
+    token.cancel("deadline")
+    assert token.cancelled
+    assert token.reason == "stop"
+    with pytest.raises(CrawlCancelled) as excinfo:
+        token.raise_if_cancelled()
+    assert excinfo.value.reason == "stop"
+
+
+def test_budget_expiry_cancels_with_deadline_reason():
+    token = CancellationToken(budget_seconds=0.01)
+    assert token.remaining() <= 0.01
+    asyncio.run(asyncio.sleep(0.02))
+    assert token.cancelled
+    assert token.reason == "deadline"
+    assert token.remaining() == 0.0
+
+
+def test_no_budget_means_no_deadline(monkeypatch):
+    monkeypatch.setenv("CRAWL_JOB_BUDGET_SECONDS", "0")
+    token = CancellationToken.from_env()
+    assert token.deadline is None
+    assert token.remaining() is None
+
+
+def test_run_returns_result_when_not_cancelled():
+    async def work():
+        return "done"
+
+    assert asyncio.run(CancellationToken().run(work())) == "done"
+
+
+def test_run_interrupts_blocked_work():
+    async def scenario():
+        token = CancellationToken()
+
+        async def blocked():
+            await asyncio.sleep(10)
+
+        asyncio.get_running_loop().call_later(0.05, token.cancel, "stop")
+        with pytest.raises(CrawlCancelled):
+            await token.run(blocked())
+        return token.get_stats()
+
+    stats = asyncio.run(scenario())
+    assert stats["cancelled"] and stats["reason"] == "stop"
@@ -0,0 +1,60 @@
+import json
+from datetime import date
+
+import pytest
+
+import cli
+from utils.cancellation import CancellationToken
+
+
+def record(post_date):
+    return {"basic_info": {"bid_number": post_date, "post_date": post_date}}
+
+
+def test_filter_by_date_keeps_records_in_range():
+    records = [record("2025/01/31 10:00\n(2025/02/10 10:00)"), record("2025/02/10 16:14"), record("2025/03/01")]
+    filtered = cli.filter_by_date(records, date(2025, 2, 1), date(2025, 2, 28))
+    assert [r["basic_info"]["bid_number"] for r in filtered] == ["2025/02/10 16:14"]
+
+
+def test_filter_by_date_keeps_unreadable_dates():
+    records = [record(""), record("미정"), {"basic_info": {}}]
+    assert cli.filter_by_date(records, date(2025, 2, 1), None) == records
+
+
+def test_filter_by_date_without_range_returns_input():
+    records = [record("2020/01/01")]
+    assert cli.filter_by_date(records, None, None) is records
+
+
+def test_missing_keywords_file_is_usage_error(tmp_path, capsys):
+    with pytest.raises(SystemExit) as excinfo:
+        cli.main(["--keywords-file", str(tmp_path / "missing.txt")])
+    assert excinfo.value.code == cli.EXIT_USAGE
+    assert "missing.txt" in capsys.readouterr().err
+
+
+def test_interrupt_prints_summary(monkeypatch, capsys):
+    async def interrupted(args):
+        raise KeyboardInterrupt
+
+    monkeypatch.setattr(cli, "run_batch", interrupted)
+    assert cli.main(["--keywords", "VR"]) == cli.EXIT_INTERRUPTED
+    summary = json.loads(capsys.readouterr().out.strip().splitlines()[-1])
+    assert summary["status"] == "interrupted"
+    assert summary["exit_code"] == cli.EXIT_INTERRUPTED
+
+
+def test_first_interrupt_cancels_second_aborts():
+    token = CancellationToken()
+    cli._on_interrupt(token)
+    assert token.reason == "interrupt"
+    with pytest.raises(KeyboardInterrupt):
+        cli._on_interrupt(token)
+
+
+def test_non_positive_workers_is_usage_error(capsys):
+    with pytest.raises(SystemExit) as excinfo:
+        cli.main(["--workers", "0"])
+    assert excinfo.value.code == cli.EXIT_USAGE
+    assert "--workers" in capsys.readouterr().err
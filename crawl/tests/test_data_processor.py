@@ -0,0 +1,49 @@
+import sys
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from data_processor import DataProcessor, _contains
+
+
+def test_contains_ignores_non_string_cells():
+    series = pd.Series(["전자입찰", np.nan, None, 3, ""], dtype=object)
+    assert _contains(series, "전자").tolist() == [True, False, False, False, False]
+
+
+def test_extract_project_period_follows_pattern_priority(tmp_path):
+    processor = DataProcessor(export_path=str(tmp_path), workers=1)
+    text = "용역기간: 2025년 3월 1일 ~ 2025년 6월 30일\n사업기간: 2025년 1월 ~ 2025년 12월"
+    assert processor.extract_project_period(text) == "2025년 1월 ~ 2025년 12월"
+    assert processor.extract_project_period("수행기간 : 2025년 4월 ~ 5월") == "2025년 4월 ~ 5월"
+    assert processor.extract_project_period("") == ""
+
+
+def test_parquet_export_without_pyarrow_raises_clear_error(tmp_path, monkeypatch):
+    monkeypatch.setitem(sys.modules, "pyarrow", None)
+    processor = DataProcessor(export_path=str(tmp_path), workers=1)
+    with pytest.raises(ImportError, match="pyarrow"):
+        processor.export_results_to_parquet([], "empty.parquet")
+
+
+def test_api_detail_fills_columns_and_failed_responses_fall_back_to_text(tmp_path):
+    processor = DataProcessor(export_path=str(tmp_path), workers=1)
+    results = [
+        {"search_keyword": "VR", "basic_info": {"title": "API"},
+         "api_detail": {"result": {"asignBdgtAmt": "1,100,000", "bidClseDt": "2025-02-11 11:00:00", "elctrnBidYn": "N"}}},
+        {"search_keyword": "VR", "basic_info": {"title": "실패"},
+         "api_detail": {"ErrorCode": "1", "ErrorMsg": "조회 실패", "result": {}},
+         "detail_info": {"bid_progress": "입찰서제출 마감 2025/02/10 10:00 전자입찰"}},
+    ]
+    df = processor.process_crawling_results(results)
+    assert df["금액(VAT포함)"].tolist() == [1100000, ""]
+    assert df["입찰마감일"].tolist() == ["2025/02/11 11:00", "2025/02/10 10:00"]
+    assert df["제안서 제출 방식"].tolist() == ["직접제출", "전자제출"]
+
+
+def test_quantitative_score_from_notice(tmp_path):
+    processor = DataProcessor(export_path=str(tmp_path), workers=1)
+    notices = ["정량평가(20점), 정성평가(80점)", "정량적 평가 : 30.5 점", "정량평가표 첨부"]
+    results = [{"basic_info": {}, "detail_info": {"general_notice": notice}} for notice in notices]
+    assert processor.process_crawling_results(results)["정량평가점수"].tolist() == ["20", "30.5", ""]
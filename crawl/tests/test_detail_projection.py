@@ -0,0 +1,61 @@
+import gzip
+import json
+
+from utils.detail_projection import ApiDetailProjector
+
+PAYLOAD = {
+    "ErrorCode": 0,
+    "ErrorMsg": "정상적으로 조회되었습니다.",
+    "result": {"bidPbancNo": "R25BK00630352", "asignBdgtAmt": 1100000, "unusedHtml": "<p>" + "x" * 500 + "</p>"}
+}
+
+
+def test_project_keeps_mapped_fields_and_status(monkeypatch):
+    monkeypatch.delenv("API_DETAIL_FIELDS", raising=False)
+    monkeypatch.delenv("API_DETAIL_ARCHIVE_DIR", raising=False)
+    projected = ApiDetailProjector().project("R25BK00630352-000", PAYLOAD)
+    assert projected == {
+        "ErrorCode": 0,
+        "ErrorMsg": "정상적으로 조회되었습니다.",
+        "result": {"bidPbancNo": "R25BK00630352", "asignBdgtAmt": 1100000}
+    }
+
+
+def test_failed_response_keeps_error_fields():
+    failed = {"ErrorCode": 500, "ErrorMsg": "조회 실패", "result": {}}
+    assert ApiDetailProjector(fields=[]).project("1", failed) == failed
+    projector = ApiDetailProjector(fields=[])
+    assert projector.project("1", {}) == {}
+    assert projector.project("1", None) is None
+
+
+def test_settings_are_read_on_first_use(monkeypatch):
+    projector = ApiDetailProjector()
+    # 생성 후(import 이후 load_dotenv) 설정한 값도 반영
+    monkeypatch.setenv("API_DETAIL_FIELDS", "unusedHtml")
+    monkeypatch.delenv("API_DETAIL_ARCHIVE_DIR", raising=False)
+    assert "unusedHtml" in projector.project("1", PAYLOAD)["result"]
+
+    monkeypatch.setenv("API_DETAIL_FIELDS", "*")
+    assert ApiDetailProjector().project("1", PAYLOAD) is PAYLOAD
+
+
+def test_size_stats_are_sampled():
+    projector = ApiDetailProjector(fields=[], archive_dir="", stats_every=10)
+    for _ in range(25):
+        projector.project("1", PAYLOAD)
+    stats = projector.get_stats()
+    assert stats["projected"] == 25
+    assert stats["sampled"] == 3
+    assert 0 < stats["reduction"] < 1
+
+
+def test_archive_writes_raw_payload(tmp_path):
+    projector = ApiDetailProjector(fields=[], archive_dir=str(tmp_path))
+    projector.project("R25BK00630352-000", PAYLOAD)
+    (archive,) = tmp_path.glob("api_detail_*.jsonl.gz")
+    with gzip.open(archive, "rt", encoding="utf-8") as f:
+        line = json.loads(f.readline())
+    assert line["bid_number"] == "R25BK00630352-000"
+    assert line["api_detail"] == PAYLOAD
+    assert projector.stats["archived"] == 1
@@ -0,0 +1,73 @@
+import asyncio
+import json
+from datetime import date
+
+import pytest
+
+from utils import excel_export
+from utils.excel_export import ExcelExportCache
+
+
+class FakeDate(date):
+    current = date(2025, 2, 13)
+
+    @classmethod
+    def today(cls):
+        return cls.current
+
+
+@pytest.fixture
+def cache(tmp_path, monkeypatch):
+    snapshot_dir = tmp_path / "data"
+    snapshot_dir.mkdir()
+    (snapshot_dir / "all_crawling_results_20250213_163411.json").write_text(
+        json.dumps({"results": []}), encoding="utf-8"
+    )
+    cache = ExcelExportCache(cache_dir=str(tmp_path / "cache"), snapshot_dir=str(snapshot_dir))
+    builds = []
+
+    async def fake_build(snapshot_path, output_path):
+        builds.append(output_path)
+        with open(output_path, "wb") as f:
+            f.write(b"xlsx")
+        return output_path
+
+    monkeypatch.setattr(cache, "_build", fake_build)
+    monkeypatch.setattr(excel_export, "date", FakeDate)
+    cache.builds = builds
+    return cache
+
+
+def test_resolve_snapshot_accepts_only_result_files(cache):
+    assert cache.resolve_snapshot("all_crawling_results_20250213_163411.xlsx").endswith(".json")
+    assert cache.resolve_snapshot("../all_crawling_results_20250213_163411.json").endswith(".json")
+    assert cache.resolve_snapshot("secrets.json") is None
+    assert cache.resolve_snapshot("batch_results_missing.json") is None
+
+
+def test_same_snapshot_same_day_is_cached(cache):
+    snapshot = cache.resolve_snapshot("all_crawling_results_20250213_163411.json")
+    first = asyncio.run(cache.get_or_build(snapshot))
+    second = asyncio.run(cache.get_or_build(snapshot))
+    assert first == second
+    assert len(cache.builds) == 1
+    assert cache.stats["hits"] == 1
+
+
+def test_new_day_rebuilds_for_search_date_column(cache):
+    snapshot = cache.resolve_snapshot("all_crawling_results_20250213_163411.json")
+    first = asyncio.run(cache.get_or_build(snapshot))
+    FakeDate.current = date(2025, 2, 14)
+    try:
+        second = asyncio.run(cache.get_or_build(snapshot))
+    finally:
+        FakeDate.current = date(2025, 2, 13)
+    assert first != second
+    assert len(cache.builds) == 2
+
+
+def test_workers_read_from_env_on_first_use(monkeypatch):
+    cache = ExcelExportCache()
+    monkeypatch.setenv("EXCEL_EXPORT_WORKERS", "5")
+    assert cache.workers == 5
+    assert ExcelExportCache(max_workers=3).workers == 3
@@ -0,0 +1,33 @@
+import asyncio
+
+from utils.hydration import DetailHydrator
+
+FAILED = {"ErrorCode": 500, "ErrorMsg": "조회 실패", "result": {}}
+DETAIL = {"ErrorCode": 0, "result": {"bidPbancNm": "교육콘텐츠 개발"}}
+
+
+def test_failed_api_detail_is_not_cached(tmp_path, monkeypatch):
+    hydrator = DetailHydrator(cache_dir=str(tmp_path))
+
+    async def fetch_api_detail(bid_number):
+        return None
+
+    monkeypatch.setattr(hydrator, "_fetch_api_detail", fetch_api_detail)
+    entry = asyncio.run(hydrator.hydrate("R25BK00000001-000", detail_page=False))
+    assert "api_detail" not in entry
+    assert hydrator.stats["failed"] == 1
+    assert not hydrator.cache and not list(tmp_path.iterdir())
+
+
+def test_cached_error_entry_is_fetched_again(tmp_path, monkeypatch):
+    hydrator = DetailHydrator(cache_dir=str(tmp_path))
+    hydrator._remember("R25BK00000001-000", {"bid_number": "R25BK00000001-000", "api_detail": FAILED})
+
+    async def fetch_api_detail(bid_number):
+        return DETAIL
+
+    monkeypatch.setattr(hydrator, "_fetch_api_detail", fetch_api_detail)
+    entry = asyncio.run(hydrator.hydrate("R25BK00000001-000", detail_page=False))
+    assert entry["cached"] is False
+    assert entry["api_detail"] == DETAIL
+    assert DetailHydrator.apply({}, {"api_detail": FAILED}) == {"hydrated": False}
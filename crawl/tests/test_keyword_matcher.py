@@ -0,0 +1,52 @@
+import pytest
+
+from utils.keyword_matcher import KeywordMatcher, _trie_regex, get_keyword_matcher
+
+
+@pytest.mark.parametrize("text", [
+    "Data Room",
+    "Demineralization cartridge 20\" 외 1종",
+    "Echocardiography System",
+    "2025년 공간정보시스템 ArcGIS 유지관리",
+    "Potato Dextrose Agar(PDA) 배지",
+])
+def test_ascii_acronym_needs_word_boundary(text):
+    assert KeywordMatcher(["AR"]).match(text) == {}
+    assert KeywordMatcher(["증강현실"]).match(text) == {}
+
+
+def test_ascii_acronym_matches_as_word():
+    matcher = KeywordMatcher(["AR", "VR"])
+    assert matcher.match("AR 글라스") == {"AR": [(0, 2)]}
+    assert matcher.match("온라인전시(VR) 콘텐츠") == {"VR": [(6, 8)]}
+    assert matcher.match("VR콘텐츠, ＶＲ360") == {"VR": [(0, 2), (7, 9)]}
+
+
+def test_synonyms_match_both_ways():
+    matcher = KeywordMatcher(["가상현실", "AR"])
+    assert matcher.match("찾아가는 VR 체험") == {"가상현실": [(5, 7)]}
+    assert matcher.match("송배전계통 증강현실 플랫폼") == {"AR": [(6, 10)]}
+
+
+def test_whitespace_gap_only_between_hangul():
+    assert _trie_regex(["ar", "교육"]) == r"(?:ar|교\s*육)"
+    matcher = KeywordMatcher(["교육콘텐츠", "학습관리 시스템"])
+    assert matcher.match("평생교육 콘텐츠 개발") == {"교육콘텐츠": [(2, 8)]}
+    assert (0, 7) in matcher.match("학습관리시스템 구축")["학습관리 시스템"]
+
+
+def test_multi_word_keyword_matches_each_word():
+    matcher = KeywordMatcher(["콘텐츠 개발"])
+    assert matcher.match("교재 개발") == {"콘텐츠 개발": [(3, 5)]}
+    assert "콘텐츠 개발" in matcher
+
+
+def test_overlapping_matches_from_same_start():
+    matcher = KeywordMatcher(["콘텐츠", "콘텐츠 개발"])
+    hits = matcher.match("VR 콘텐츠개발")
+    assert hits["콘텐츠"] == [(3, 6)]
+    assert (3, 8) in hits["콘텐츠 개발"]
+
+
+def test_matcher_is_cached_per_keyword_set():
+    assert get_keyword_matcher(("VR", "AR")) is get_keyword_matcher(("VR", "AR"))
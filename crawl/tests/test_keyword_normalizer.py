@@ -0,0 +1,39 @@
+from utils.keyword_normalizer import (
+    canonical_keyword, fold_text, keyword_forms, normalize_keyword, plan_keyword_crawls
+)
+
+
+def test_normalize_keyword_folds_spacing_width_and_spelling():
+    assert fold_text("ＶＲ Ａｐｐ") == "vr app"
+    assert normalize_keyword("교육 컨텐츠") == "교육콘텐츠"
+    assert normalize_keyword("ＶＲ") == "vr"
+    assert normalize_keyword("메타벌스") == "메타버스"
+
+
+def test_canonical_keyword_uses_synonym_group_representative():
+    assert canonical_keyword("VR") == "가상현실"
+    assert canonical_keyword("lms") == "학습관리시스템"
+    assert canonical_keyword("VR", synonyms=False) == "vr"
+    assert canonical_keyword("메타버스") == "메타버스"
+
+
+def test_keyword_forms_include_synonyms_and_variants():
+    assert set(keyword_forms("VR")) == {"vr", "가상현실"}
+    assert set(keyword_forms("교육콘텐츠")) == {"교육콘텐츠", "교육컨텐츠"}
+
+
+def test_plan_merges_only_case_and_width_duplicates_by_default(monkeypatch):
+    monkeypatch.delenv("KEYWORD_COLLAPSE_SYNONYMS", raising=False)
+    plan = plan_keyword_crawls(["교육콘텐츠", "교육 컨텐츠", "VR", "가상현실", "ＶＲ", " vr "])
+    # G2B 검색은 글자 그대로 일치하므로 띄어쓰기/표기 변형과 동의어는 따로 검색
+    assert plan.searches == ["교육콘텐츠", "교육 컨텐츠", "VR", "가상현실"]
+    assert plan.groups["VR"] == ["VR", "ＶＲ", " vr "]
+    assert plan.covered(["VR"]) == ["VR", "ＶＲ", " vr "]
+    assert plan.get_stats()["saved"] == 2
+
+
+def test_plan_collapses_variants_and_synonyms_when_requested():
+    plan = plan_keyword_crawls(["VR", "가상현실", "AR", "교육콘텐츠", "교육 컨텐츠"], collapse_synonyms=True)
+    assert plan.searches == ["VR", "AR", "교육콘텐츠"]
+    assert plan.groups["VR"] == ["VR", "가상현실"]
+    assert plan.groups["교육콘텐츠"] == ["교육콘텐츠", "교육 컨텐츠"]
@@ -0,0 +1,65 @@
+import asyncio
+
+from utils.page_state import PageState, PageStateMachine
+
+
+class FakeCrawler:
+    driver = None
+
+
+class ScriptedMachine(PageStateMachine):
+    """detect/_run_action을 정해진 순서로 흉내내는 상태 기계"""
+
+    def __init__(self, states, results=None):
+        super().__init__(FakeCrawler())
+        self.states = list(states)
+        self.results = dict(results or {})
+        self.actions = []
+
+    def detect(self):
+        return self.states[0] if len(self.states) == 1 else self.states.pop(0)
+
+    async def _run_action(self, action, keyword):
+        self.actions.append(action)
+        return self.results.get(action, True)
+
+
+def test_plan_prefers_cheapest_path():
+    machine = PageStateMachine(FakeCrawler())
+    # 팝업 닫기(0.3) + 뒤로가기(1.5)가 바로가기(3.0)보다 싸다
+    assert machine.plan(PageState.POPUP, PageState.LIST) == [
+        (PageState.DETAIL, "close_popup"),
+        (PageState.LIST_RESULTS, "back"),
+    ]
+    assert machine.plan(PageState.HOME, PageState.LIST) == [(PageState.LIST, "deep_link")]
+
+
+def test_plan_treats_results_screen_as_list():
+    machine = PageStateMachine(FakeCrawler())
+    assert machine.plan(PageState.LIST_RESULTS, PageState.LIST) == []
+
+
+def test_plan_skips_excluded_edges_and_reports_no_path():
+    machine = PageStateMachine(FakeCrawler())
+    path = machine.plan(PageState.HOME, PageState.LIST, excluded={(PageState.HOME, "deep_link")})
+    assert path == [(PageState.LIST, "menu")]
+    assert machine.plan(PageState.LIST, PageState.HOME) is None
+
+
+def test_observed_costs_change_the_plan():
+    machine = PageStateMachine(FakeCrawler())
+    for _ in range(10):
+        machine._record_transition(PageState.DETAIL, "back", 20.0, True)
+    assert machine.plan(PageState.DETAIL, PageState.LIST) == [(PageState.LIST, "deep_link")]
+
+
+def test_recover_excludes_failed_action_and_retries():
+    machine = ScriptedMachine(
+        [PageState.HOME, PageState.HOME, PageState.LIST],
+        results={"deep_link": False}
+    )
+    assert asyncio.run(machine.recover(PageState.LIST)) is True
+    assert machine.actions == ["deep_link", "menu"]
+    stats = machine.get_stats()
+    assert stats["recoveries"]["succeeded"] == 1
+    assert stats["transitions"]["home:deep_link"]["failures"] == 1
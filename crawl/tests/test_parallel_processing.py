@@ -0,0 +1,46 @@
+from utils.parallel_processing import (
+    MAX_CHUNK_SIZE, MIN_CHUNK_SIZE, clean_results, imap_ordered, iter_chunks, resolve_workers, tune_chunk_size
+)
+
+
+def square_all(chunk):
+    return [value * value for value in chunk]
+
+
+def test_resolve_workers_defaults_to_serial(monkeypatch):
+    monkeypatch.delenv("POSTPROCESS_WORKERS", raising=False)
+    assert resolve_workers() == 1
+    monkeypatch.setenv("POSTPROCESS_WORKERS", "3")
+    assert resolve_workers() == 3
+    assert resolve_workers(2) == 2
+    assert resolve_workers(0) >= 1
+
+
+def test_tune_chunk_size_bounds(monkeypatch):
+    monkeypatch.delenv("POSTPROCESS_CHUNK_SIZE", raising=False)
+    assert tune_chunk_size(100, 4) == MIN_CHUNK_SIZE
+    assert tune_chunk_size(10_000_000, 2) == MAX_CHUNK_SIZE
+    assert tune_chunk_size(80_000, 4) == 5000
+    assert tune_chunk_size(80_000, 4, chunk_size=123) == 123
+
+
+def test_iter_chunks_splits_stream():
+    chunks = list(iter_chunks(iter(range(7)), 3))
+    assert chunks == [[0, 1, 2], [3, 4, 5], [6]]
+
+
+def test_imap_ordered_keeps_input_order():
+    chunks = [list(range(start, start + 5)) for start in range(0, 50, 5)]
+    expected = [square_all(chunk) for chunk in chunks]
+    assert list(imap_ordered(square_all, iter(chunks), workers=1)) == expected
+    assert list(imap_ordered(square_all, iter(chunks), workers=2, window=3)) == expected
+
+
+def test_clean_results_small_input_stays_serial():
+    records = [{
+        "search_keyword": "VR",
+        "basic_info": {"bid_number": f"R25BK{index:08d}-000", "title": f"VR 콘텐츠 {index}"},
+        "detail_info": {}
+    } for index in range(3)]
+    cleaned = clean_results(records, workers=4)
+    assert [record["bid_info"]["number"] for record in cleaned] == [r["basic_info"]["bid_number"] for r in records]
@@ -0,0 +1,78 @@
+import asyncio
+
+import pytest
+
+from utils.rate_limiter import AdaptiveRateLimiter, TokenBucket
+
+LIMITS = {
+    "default": {"rate": 1.0, "min_rate": 0.25, "max_rate": 2.0, "burst": 2, "target_latency": 1.0},
+}
+
+
+def make_bucket(**overrides):
+    return TokenBucket("test", {**LIMITS["default"], **overrides})
+
+
+def test_reserve_allows_burst_then_waits():
+    bucket = make_bucket()
+    assert bucket.reserve() == 0.0
+    assert bucket.reserve() == 0.0
+    # 버킷이 비면 다음 토큰까지 1/rate초 대기
+    assert bucket.reserve() == pytest.approx(1.0, abs=0.05)
+
+
+def test_success_increases_rate_additively_up_to_max():
+    bucket = make_bucket()
+    for _ in range(100):
+        bucket.adapt(latency=0.1, success=True, throttled=False)
+    assert bucket.rate == pytest.approx(2.0)
+
+
+def test_error_halves_rate_down_to_min():
+    bucket = make_bucket()
+    bucket.adapt(latency=None, success=False, throttled=False)
+    assert bucket.rate == pytest.approx(0.5)
+    bucket.adapt(latency=None, success=False, throttled=False)
+    bucket.adapt(latency=None, success=False, throttled=False)
+    assert bucket.rate == pytest.approx(0.25)
+    assert bucket.stats["errors"] == 3
+
+
+def test_slow_responses_decrease_rate():
+    bucket = make_bucket()
+    bucket.adapt(latency=3.0, success=True, throttled=False)
+    assert bucket.rate == pytest.approx(0.8)
+
+
+def test_throttle_drops_to_min_rate_and_empties_bucket():
+    bucket = make_bucket()
+    bucket.adapt(latency=0.1, success=False, throttled=True)
+    assert bucket.rate == pytest.approx(0.25)
+    assert bucket.tokens <= 0.0
+    assert bucket.stats["throttled"] == 1
+
+
+def test_limiter_record_uses_status_code_and_default_bucket():
+    limiter = AdaptiveRateLimiter(LIMITS)
+    limiter.record("unknown_endpoint", latency=0.2, status_code=429)
+    stats = limiter.get_stats()["unknown_endpoint"]
+    assert stats["throttled"] == 1
+    assert stats["rate"] == 0.25
+
+
+def test_acquire_sleeps_only_when_bucket_is_empty(monkeypatch):
+    sleeps = []
+
+    async def fake_sleep(delay):
+        sleeps.append(delay)
+
+    monkeypatch.setattr("utils.rate_limiter.asyncio.sleep", fake_sleep)
+    limiter = AdaptiveRateLimiter(LIMITS)
+
+    async def run():
+        for _ in range(3):
+            await limiter.acquire("default")
+
+    asyncio.run(run())
+    assert len(sleeps) == 1
+    assert limiter.get_stats()["default"]["requests"] == 3
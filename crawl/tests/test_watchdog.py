@@ -0,0 +1,23 @@
+import time
+
+from utils.watchdog import DriverWatchdog
+
+
+def test_guard_expires_after_deadline():
+    watchdog = DriverWatchdog()
+    with watchdog.guard("detail", timeout=0.01):
+        time.sleep(0.02)
+        assert watchdog._expired()[0] == "detail"
+    assert watchdog._expired() is None
+
+
+def test_suspend_excludes_wait_from_deadline():
+    watchdog = DriverWatchdog()
+    with watchdog.guard("detail", timeout=0.05):
+        with watchdog.suspend():
+            time.sleep(0.1)
+            # 대기 중에는 마감을 검사하지 않음
+            assert watchdog._expired() is None
+        # 대기한 시간만큼 마감이 늦춰져 아직 남아 있음
+        assert watchdog._expired() is None
+
@@ -0,0 +1,34 @@
+from utils.xhr_capture import XhrCapture
+
+
+class StubDriver:
+    def execute_cdp_cmd(self, command, params):
+        return {}
+
+
+LIST_ITEM = {"bidPbancNo": "R25BK00630352", "bidPbancOrd": "000", "bidPbancNm": "VR 콘텐츠 개발"}
+
+
+def test_extract_list_rows_skips_malformed_bodies():
+    capture = XhrCapture(StubDriver())
+    captured = [
+        {"kind": "list", "data": None},
+        {"kind": "list", "data": ["unexpected"]},
+        {"kind": "list", "data": "error"},
+        {"kind": "list", "data": {"result": "none"}},
+        {"kind": "list", "data": {"result": [LIST_ITEM, None]}},
+    ]
+    rows = capture.extract_list_rows(captured)
+    assert [row["bid_number"] for row in rows] == ["R25BK00630352-000"]
+
+
+def test_extract_details_skips_malformed_bodies():
+    capture = XhrCapture(StubDriver())
+    detail = {"result": {"bidPbancNo": "R25BK00630352", "bidPbancOrd": "000"}}
+    captured = [
+        {"kind": "detail", "data": []},
+        {"kind": "detail", "data": None},
+        {"kind": "detail", "data": {"result": ["x"]}},
+        {"kind": "detail", "data": detail},
+    ]
+    assert capture.extract_details(captured) == {"R25BK00630352-000": detail}
@@ -0,0 +1,210 @@
+import json
+import logging
+import os
+import sys
+import tempfile
+import threading
+from collections.abc import MutableMapping
+from typing import Dict, Iterable, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+# basic_info 필드 순서 (_extract_row_data 셀 이름, G2B_LIST_FIELD_MAP과 같은 이름)
+BASIC_FIELDS = (
+    'no', 'business_type', 'business_status', 'bid_category', 'bid_number', 'title',
+    'announce_agency', 'agency', 'post_date', 'progress_stage', 'detail_process',
+    'process_status', 'bid_progress'
+)
+_BASIC_INDEX = {name: index for index, name in enumerate(BASIC_FIELDS)}
+# 값 종류가 적고 결과마다 반복되는 필드 - sys.intern으로 같은 문자열 객체를 공유
+INTERNED_FIELDS = frozenset((
+    'business_type', 'business_status', 'bid_category', 'announce_agency', 'agency',
+    'progress_stage', 'detail_process', 'process_status', 'bid_progress'
+))
+# 저장소(파일)에 두고 접근할 때 읽는 큰 필드
+BLOB_FIELDS = ('detail_info', 'api_detail')
+
+
+class _Absent:
+    """basic_info에 없는 필드 표시 (None 값과 구분)"""
+    __slots__ = ()
+
+    def __repr__(self):
+        return '<absent>'
+
+
+_ABSENT = _Absent()
+
+
+def _intern(value):
+    return sys.intern(value) if isinstance(value, str) else value
+
+
+class RecordBlobStore:
+    """결과의 큰 필드(detail_info/api_detail)를 JSON으로 이어 쓰는 임시 파일 저장소
+
+    결과에는 (오프셋, 길이)만 남기고 필드를 읽을 때마다 파일에서 불러온다.
+    파일은 저장소가 닫히거나 더 이상 참조되지 않으면 삭제된다.
+    """
+
+    def __init__(self, directory: Optional[str] = None):
+        directory = directory or os.getenv('RECORD_STORE_DIR') or None
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        self.file = tempfile.TemporaryFile(prefix="bid_records_", suffix=".jsonl", dir=directory)
+        self.size = 0
+        self.stats = {"writes": 0, "reads": 0}
+        self._lock = threading.Lock()
+
+    def put(self, value) -> Tuple[int, int]:
+        """값을 저장하고 (오프셋, 길이) 반환"""
+        data = json.dumps(value, ensure_ascii=False).encode('utf-8')
+        with self._lock:
+            offset = self.size
+            self.file.seek(offset)
+            self.file.write(data)
+            self.size += len(data)
+            self.stats["writes"] += 1
+        return offset, len(data)
+
+    def get(self, ref: Tuple[int, int]):
+        offset, length = ref
+        with self._lock:
+            self.file.seek(offset)
+            data = self.file.read(length)
+            self.stats["reads"] += 1
+        return json.loads(data.decode('utf-8'))
+
+    def close(self):
+        with self._lock:
+            self.file.close()
+
+    def get_stats(self) -> Dict:
+        return {**self.stats, "bytes": self.size}
+
+
+class BidRecord(MutableMapping):
+    """수집 결과 한 건의 메모리 절약형 표현
+
+    - basic_info는 BASIC_FIELDS 순서의 튜플로 두고, 기관/단계 등 반복 문자열과 검색 키워드는 intern한다.
+    - detail_info/api_detail은 RecordBlobStore에 두고 접근할 때 읽는다.
+    - 기존 dict 구조(record['basic_info'], record.get('api_detail'), record['search_keyword'] = ...)로
+      그대로 읽고 쓸 수 있으며, API 응답/파일 저장/프로세스 간 전달 시에는 to_dict()로 바꾼다.
+
+    record['basic_info']는 매번 새로 만든 dict이므로 값을 바꾸려면 basic_info 전체를 다시 대입한다.
+    """
+
+    __slots__ = ('search_keyword', 'basic', 'basic_extra', 'blobs', 'extra', 'store')
+
+    def __init__(self, store: RecordBlobStore, search_keyword: str = '', basic_info: Dict = None):
+        self.store = store
+        self.search_keyword = _intern(search_keyword)
+        self.basic: Tuple = ()
+        self.basic_extra: Optional[Dict] = None
+        self.blobs: Optional[Dict[str, Tuple[int, int]]] = None
+        self.extra: Optional[Dict] = None
+        if basic_info is not None:
+            self._set_basic_info(basic_info)
+
+    @classmethod
+    def from_dict(cls, record: Dict, store: RecordBlobStore) -> 'BidRecord':
+        """dict 결과를 변환 (이미 BidRecord면 그대로 반환)"""
+        if isinstance(record, BidRecord):
+            return record
+        compact = cls(store)
+        for key, value in record.items():
+            compact[key] = value
+        return compact
+
+    def _set_basic_info(self, basic_info: Dict):
+        values = [_ABSENT] * len(BASIC_FIELDS)
+        extra = None
+        for name, value in basic_info.items():
+            index = _BASIC_INDEX.get(name)
+            if index is None:
+                extra = extra or {}
+                extra[name] = value
+            else:
+                values[index] = _intern(value) if name in INTERNED_FIELDS else value
+        self.basic = tuple(values)
+        self.basic_extra = extra
+
+    def _basic_info(self) -> Dict:
+        basic_info = {name: value for name, value in zip(BASIC_FIELDS, self.basic) if value is not _ABSENT}
+        if self.basic_extra:
+            basic_info.update(self.basic_extra)
+        return basic_info
+
+    @property
+    def bid_number(self) -> Optional[str]:
+        value = self.basic[_BASIC_INDEX['bid_number']] if self.basic else None
+        return None if value is _ABSENT else value
+
+    def __getitem__(self, key):
+        if key == 'search_keyword':
+            return self.search_keyword
+        if key == 'basic_info':
+            return self._basic_info()
+        if key in BLOB_FIELDS:
+            if not self.blobs or key not in self.blobs:
+                raise KeyError(key)
+            return self.store.get(self.blobs[key])
+        if not self.extra or key not in self.extra:
+            raise KeyError(key)
+        return self.extra[key]
+
+    def __setitem__(self, key, value):
+        if key == 'search_keyword':
+            self.search_keyword = _intern(value)
+        elif key == 'basic_info':
+            self._set_basic_info(value or {})
+        elif key in BLOB_FIELDS:
+            self.blobs = self.blobs or {}
+            self.blobs[key] = self.store.put(value)
+        else:
+            self.extra = self.extra or {}
+            # source/hydrated 등 짧은 값도 반복되므로 intern
+            self.extra[sys.intern(key)] = _intern(value)
+
+    def __delitem__(self, key):
+        if key == 'search_keyword' or key == 'basic_info':
+            raise KeyError(f"{key}는 삭제할 수 없습니다")
+        target = self.blobs if key in BLOB_FIELDS else self.extra
+        if not target or key not in target:
+            raise KeyError(key)
+        del target[key]
+
+    def __contains__(self, key) -> bool:
+        if key in ('search_keyword', 'basic_info'):
+            return True
+        if key in BLOB_FIELDS:
+            return bool(self.blobs) and key in self.blobs
+        return bool(self.extra) and key in self.extra
+
+    def __iter__(self):
+        yield 'search_keyword'
+        yield 'basic_info'
+        if self.blobs:
+            yield from self.blobs
+        if self.extra:
+            yield from self.extra
+
+    def __len__(self) -> int:
+        return 2 + len(self.blobs or ()) + len(self.extra or ())
+
+    def to_dict(self) -> Dict:
+        """기존 결과 dict 구조로 변환 (detail_info/api_detail은 저장소에서 읽음)"""
+        return {key: self[key] for key in self}
+
+    def __repr__(self):
+        return f"BidRecord({self.bid_number!r}, keyword={self.search_keyword!r})"
+
+
+def as_dict(record) -> Dict:
+    """BidRecord면 dict로 변환, dict면 그대로 반환"""
+    return record.to_dict() if isinstance(record, BidRecord) else record
+
+
+def to_dicts(records: Iterable) -> List[Dict]:
+    """BidRecord가 섞인 결과 목록을 dict 목록으로 변환 (API/파일 저장 경계에서 사용)"""
+    return [as_dict(record) for record in records]
@@ -0,0 +1,143 @@
+import logging
+import os
+from typing import Dict, List, Optional
+
+import psutil
+from selenium.webdriver.chrome.options import Options
+
+logger = logging.getLogger(__name__)
+
+# lean 프로필에서 차단할 리소스 (CDP Network.setBlockedURLs 패턴)
+# WebSquare 화면 배치가 CSS에 의존하므로 스타일시트는 차단하지 않음
+LEAN_BLOCKED_URLS = [
+    # 이미지
+    "*.png", "*.jpg", "*.jpeg", "*.gif", "*.svg", "*.ico", "*.webp", "*.bmp",
+    # 폰트
+    "*.woff", "*.woff2", "*.ttf", "*.otf", "*.eot",
+    # 미디어
+    "*.mp4", "*.webm", "*.mp3", "*.avi",
+    # 분석/광고 스크립트
+    "*google-analytics.com*", "*googletagmanager.com*", "*doubleclick.net*", "*wcs.naver.net*"
+]
+
+
+class BrowserProfile:
+    """Chrome 실행 옵션 묶음 (페이지 로드 전략, 차단 리소스, 추가 인자)"""
+
+    def __init__(self, name: str, page_load_strategy: str = "normal",
+                 blocked_urls: List[str] = None, extra_arguments: List[str] = None,
+                 prefs: Dict = None):
+        self.name = name
+        self.page_load_strategy = page_load_strategy
+        self.blocked_urls = blocked_urls or []
+        self.extra_arguments = extra_arguments or []
+        self.prefs = prefs or {}
+
+    def build_options(self, user_data_dir: Optional[str] = None) -> Options:
+        """프로필 설정을 반영한 ChromeOptions 생성 (user_data_dir 지정 시 디스크 캐시/쿠키 유지)"""
+        chrome_options = Options()
+        chrome_options.add_argument('--headless=new')
+        chrome_options.add_argument('--disable-gpu')
+        chrome_options.add_argument('--no-sandbox')
+        chrome_options.add_argument('--disable-dev-shm-usage')
+        chrome_options.add_argument('--window-size=1920,1080')
+        for argument in self.extra_arguments:
+            chrome_options.add_argument(argument)
+        if user_data_dir:
+            chrome_options.add_argument(f'--user-data-dir={os.path.abspath(user_data_dir)}')
+            chrome_options.add_argument(f'--disk-cache-dir={os.path.abspath(os.path.join(user_data_dir, "cache"))}')
+        if self.prefs:
+            chrome_options.add_experimental_option("prefs", self.prefs)
+        chrome_options.page_load_strategy = self.page_load_strategy
+        return chrome_options
+
+    def apply(self, driver):
+        """드라이버 생성 후 CDP로 리소스 차단 적용"""
+        if not self.blocked_urls:
+            return
+        try:
+            driver.execute_cdp_cmd("Network.enable", {})
+            driver.execute_cdp_cmd("Network.setBlockedURLs", {"urls": self.blocked_urls})
+            logger.info(f"[{self.name}] 리소스 차단 적용: {len(self.blocked_urls)}개 패턴")
+        except Exception as e:
+            logger.error(f"[{self.name}] 리소스 차단 적용 실패: {str(e)}")
+
+
+BROWSER_PROFILES = {
+    # 기존 setup_driver와 동일한 설정
+    "default": BrowserProfile("default"),
+    # 이미지/폰트/미디어/분석 스크립트를 차단하고 DOMContentLoaded 시점에 제어권을 돌려받는 설정
+    "lean": BrowserProfile(
+        "lean",
+        page_load_strategy="eager",
+        blocked_urls=LEAN_BLOCKED_URLS,
+        extra_arguments=[
+            '--disable-extensions',
+            '--disable-notifications',
+            '--blink-settings=imagesEnabled=false'
+        ],
+        prefs={"profile.managed_default_content_settings.images": 2}
+    ),
+}
+
+
+# 사용자 데이터 디렉터리 점유 표시 파일 (Chrome은 같은 디렉터리를 동시에 둘 이상 쓰지 못함)
+USER_DATA_LOCK_FILE = "crawler.lock"
+MAX_USER_DATA_SLOTS = 8
+
+
+def _is_stale_lock(lock_path: str) -> bool:
+    """비정상 종료로 남은 점유 표시인지 확인 (기록된 프로세스가 더 이상 없음)"""
+    try:
+        with open(lock_path, 'r') as f:
+            pid = int(f.read().strip())
+    except FileNotFoundError:
+        return False
+    except ValueError:
+        return True
+    return not psutil.pid_exists(pid)
+
+
+def claim_user_data_dir(base_dir: str) -> Optional[str]:
+    """base_dir 아래에서 비어 있는 슬롯 디렉터리(slot-0, slot-1, ...)를 점유하여 반환
+
+    같은 슬롯을 다시 쓰면 디스크 캐시(스크립트/CSS)와 쿠키가 그대로 남아 있어
+    드라이버 재시작 후 첫 페이지 로딩이 빨라진다. 동시에 실행되는 드라이버는 서로 다른 슬롯을 쓴다.
+    """
+    for slot in range(MAX_USER_DATA_SLOTS):
+        slot_dir = os.path.join(base_dir, f"slot-{slot}")
+        os.makedirs(slot_dir, exist_ok=True)
+        lock_path = os.path.join(slot_dir, USER_DATA_LOCK_FILE)
+        if _is_stale_lock(lock_path):
+            os.remove(lock_path)
+        try:
+            fd = os.open(lock_path, os.O_CREAT | os.O_EXCL | os.O_WRONLY)
+        except FileExistsError:
+            continue
+        with os.fdopen(fd, 'w') as f:
+            f.write(str(os.getpid()))
+        logger.info(f"사용자 데이터 디렉터리 사용: {slot_dir}")
+        return slot_dir
+    logger.warning(f"사용 가능한 사용자 데이터 슬롯 없음 ({base_dir}), 임시 프로필로 실행")
+    return None
+
+
+def release_user_data_dir(slot_dir: Optional[str]):
+    """claim_user_data_dir로 점유한 슬롯 반환"""
+    if not slot_dir:
+        return
+    try:
+        os.remove(os.path.join(slot_dir, USER_DATA_LOCK_FILE))
+    except FileNotFoundError:
+        pass
+    except Exception as e:
+        logger.error(f"사용자 데이터 슬롯 반환 실패 ({slot_dir}): {str(e)}")
+
+
+def get_browser_profile(name: str = None) -> BrowserProfile:
+    """이름으로 프로필 조회 (미지정 시 CHROME_PROFILE 환경변수, 기본값 default)"""
+    name = name or os.getenv('CHROME_PROFILE', 'default')
+    if name not in BROWSER_PROFILES:
+        logger.warning(f"알 수 없는 브라우저 프로필 '{name}', default 사용")
+        name = "default"
+    return BROWSER_PROFILES[name]
@@ -0,0 +1,105 @@
+import asyncio
+import logging
+import os
+import threading
+import time
+from typing import Awaitable, Optional
+
+logger = logging.getLogger(__name__)
+
+# 취소 여부 확인 주기(초) - 중지 요청 후 부분 결과 반환까지의 지연 상한
+POLL_INTERVAL = 0.2
+
+
+class CrawlCancelled(BaseException):
+    """중지 요청 또는 작업 시간 예산 초과로 수집을 중단할 때 발생
+
+    크롤러 곳곳의 except Exception 처리(행 단위 재시도, 화면 복구)에 걸리지 않고
+    작업 최상단까지 전달되도록 asyncio.CancelledError처럼 BaseException을 상속한다.
+    """
+
+    def __init__(self, reason: str):
+        super().__init__(reason)
+        self.reason = reason
+
+
+def _consume_result(future: asyncio.Future):
+    """중단된 작업의 결과/예외를 읽어 'exception was never retrieved' 경고 방지"""
+    try:
+        future.exception()
+    except BaseException:
+        pass
+
+
+class CancellationToken:
+    """중지 요청과 작업 전체 시간 예산을 행 단위 작업까지 전달하는 취소 토큰
+
+    대기 스레드(PageWaiter)에서도 확인하므로 threading.Event로 상태를 보관한다.
+    """
+
+    def __init__(self, budget_seconds: Optional[float] = None):
+        self.started_at = time.monotonic()
+        self.budget_seconds = budget_seconds or None
+        self.deadline = self.started_at + budget_seconds if budget_seconds else None
+        self.reason: Optional[str] = None
+        self._event = threading.Event()
+
+    @classmethod
+    def from_env(cls, budget_seconds: Optional[float] = None) -> 'CancellationToken':
+        """시간 예산 미지정 시 CRAWL_JOB_BUDGET_SECONDS 환경변수 사용 (0이면 무제한)"""
+        if budget_seconds is None:
+            budget_seconds = float(os.getenv('CRAWL_JOB_BUDGET_SECONDS', '0'))
+        return cls(budget_seconds)
+
+    def cancel(self, reason: str = "stop"):
+        """취소 요청 (먼저 들어온 사유 유지)"""
+        if not self._event.is_set():
+            self.reason = reason
+            self._event.set()
+            logger.info(f"작업 취소 요청: {reason}")
+
+    @property
+    def cancelled(self) -> bool:
+        if not self._event.is_set() and self.deadline and time.monotonic() >= self.deadline:
+            self.cancel("deadline")
+        return self._event.is_set()
+
+    def raise_if_cancelled(self):
+        if self.cancelled:
+            raise CrawlCancelled(self.reason)
+
+    def remaining(self) -> Optional[float]:
+        """남은 시간 예산(초) - 예산이 없으면 None"""
+        if self.deadline is None:
+            return None
+        return max(0.0, self.deadline - time.monotonic())
+
+    async def wait(self):
+        """취소될 때까지 대기"""
+        while not self.cancelled:
+            remaining = self.remaining()
+            await asyncio.sleep(POLL_INTERVAL if remaining is None else min(POLL_INTERVAL, remaining))
+
+    async def run(self, awaitable: Awaitable):
+        """작업과 취소를 경합 - 취소되면 작업을 중단하고 CrawlCancelled 발생"""
+        task = asyncio.ensure_future(awaitable)
+        watcher = asyncio.ensure_future(self.wait())
+        try:
+            await asyncio.wait({task, watcher}, return_when=asyncio.FIRST_COMPLETED)
+        finally:
+            watcher.cancel()
+        if task.done():
+            return task.result()
+        task.cancel()
+        task.add_done_callback(_consume_result)
+        # 작업 쪽 finally 정리가 끝날 때까지 잠시만 기다림 (대기 스레드는 토큰을 보고 스스로 종료)
+        await asyncio.wait({task}, timeout=POLL_INTERVAL)
+        raise CrawlCancelled(self.reason)
+
+    def get_stats(self):
+        return {
+            "cancelled": self._event.is_set(),
+            "reason": self.reason,
+            "budget_seconds": self.budget_seconds,
+            "elapsed_seconds": round(time.monotonic() - self.started_at, 3)
+        }
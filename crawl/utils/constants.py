@@ -3,4 +3,81 @@ SEARCH_KEYWORDS = [
     "VR", "AR", "실감", "가상현실", "증강현실", "혼합현실", "XR", 
     "메타버스", "LMS", "학습관리 시스템", "콘텐츠 개발", "콘텐츠 제작",
     "교재 개발", "교육과정 개발", "교육콘텐츠"
-]       
\ No newline at end of file
+]
+
+# 같은 대상을 가리키는 검색어 묶음 (첫 번째가 대표어) - 매칭은 항상, 크롤링 통합은 KEYWORD_COLLAPSE_SYNONYMS=1일 때
+# 띄어쓰기/대소문자/전각 차이는 utils.keyword_normalizer가 따로 처리하므로 여기에는 뜻이 같은 다른 말만 적는다
+KEYWORD_SYNONYM_GROUPS = [
+    ["가상현실", "VR"],
+    ["증강현실", "AR"],
+    ["혼합현실", "MR"],
+    ["확장현실", "XR"],
+    ["학습관리시스템", "LMS"],
+]
+
+# 표기 변형 -> 표준 표기 (정규화 시 치환, 매칭 시 양쪽 표기 모두 찾음)
+KEYWORD_SPELLING_VARIANTS = {
+    "컨텐츠": "콘텐츠",
+    "컨텐트": "콘텐트",
+    "메타벌스": "메타버스",
+}
+
+# G2B 엔드포인트별 요청 속도 설정
+# rate/min_rate/max_rate: 초당 요청 수, burst: 연속 허용 요청 수, target_latency: 목표 응답 시간(초)
+RATE_LIMITS = {
+    "default": {"rate": 0.5, "min_rate": 0.2, "max_rate": 2.0, "burst": 1, "target_latency": 3.0},
+    "main_page": {"rate": 0.5, "min_rate": 0.1, "max_rate": 1.0, "burst": 1, "target_latency": 5.0},
+    "menu": {"rate": 1.0, "min_rate": 0.3, "max_rate": 5.0, "burst": 3, "target_latency": 2.0},
+    "search": {"rate": 0.33, "min_rate": 0.1, "max_rate": 2.0, "burst": 1, "target_latency": 3.0},
+    "detail_page": {"rate": 0.5, "min_rate": 0.2, "max_rate": 3.0, "burst": 2, "target_latency": 3.0},
+    "api_session": {"rate": 0.5, "min_rate": 0.1, "max_rate": 1.0, "burst": 1, "target_latency": 2.0},
+    "api_detail": {"rate": 2.0, "min_rate": 0.5, "max_rate": 10.0, "burst": 3, "target_latency": 1.0},
+}
+
+# WebSquare 화면이 호출하는 G2B JSON XHR 경로 (CDP 응답 캡처 대상)
+G2B_XHR_PATTERNS = {
+    "list": ["/pn/pnp/pnpe/BidPbac/selectBidPbacScrollTypeList.do"],
+    "detail": ["/pn/pnp/pnpe/commBidPbac/selectPicInfo.do"],
+}
+
+# 목록 XHR 응답 필드 -> basic_info 키 매핑 (앞쪽 필드를 우선 사용)
+G2B_LIST_FIELD_MAP = {
+    "no": ["rowNum", "rnum"],
+    "business_type": ["prcmBsneSeCdNm", "bsneClsfNm"],
+    "business_status": ["frgnDmstSeNm", "dmstFrgnSeNm"],
+    "bid_category": ["pbancKndNm", "pbancKndCdNm"],
+    "title": ["bidPbancNm"],
+    "announce_agency": ["pbancInstNm", "dmstNm"],
+    "agency": ["dmndInstNm", "dmstNm"],
+    "post_date": ["pbancPstgDt", "bidPbancPstgDt"],
+    "progress_stage": ["prgsSttsNm", "pbancPrgsSttsNm"],
+    "detail_process": ["dtlPrcsNm"],
+    "process_status": ["prcsSttsNm"],
+    "bid_progress": ["bidPrgsNm", "bidPrgsSttsNm"],
+}
+
+# 상세 API(selectPicInfo.do) 응답 result 필드 -> 구조화 필드 매핑 (앞쪽 필드를 우선 사용)
+# 금액은 원 단위 정수, 일시는 "YYYY/MM/DD HH:MM"/"YYYY-MM-DD HH:MM:SS"/"YYYYMMDDHHMM" 등을 허용
+G2B_DETAIL_FIELD_MAP = {
+    "budget_amount": ["asignBdgtAmt", "alotBdgtAmt", "bdgtAmt"],          # 배정예산(VAT 포함)
+    "estimated_price": ["presmptPrce", "prspPrce", "estmtPrce"],          # 추정가격(VAT 별도)
+    "vat_amount": ["vatAmt", "VAT"],                                      # 부가가치세
+    "bid_begin": ["bidBeginDt", "bidBgngDt", "bidQlfctRgstBgngDt"],       # 입찰서제출 개시일시
+    "bid_deadline": ["bidClseDt", "bidClsgDt", "bidDocSbmsnClsgDt"],      # 입찰서제출 마감일시
+    "opening": ["opengDt", "onbsDt", "bidOpengDt"],                       # 개찰일시
+    "contract_method": ["cntrctCnclsMthdNm", "ctrtMthdNm", "cntrctMthdNm"],  # 계약방법
+    "bid_method": ["bidMethdNm", "bidMthdNm"],                            # 입찰방식
+    "electronic_bid": ["elctrnBidYn", "ebidYn"],                          # 전자입찰 여부(Y/N)
+    "period_start": ["cntrctPrdBgngDt", "ctrtPrdBgngYmd", "bsnsPrdBgngDt"],  # 사업(계약)기간 시작
+    "period_end": ["cntrctPrdEndDt", "ctrtPrdEndYmd", "bsnsPrdEndDt"],       # 사업(계약)기간 종료
+    "period_text": ["cntrctPrd", "ctrtPrdCn", "bsnsPrdCn"],                  # 사업기간 문구 (예: 계약일로부터 180일)
+}
+
+# 상세 API 응답 result에서 구조화 필드 외에 보관할 필드 (공고 식별/표시용)
+G2B_DETAIL_KEEP_FIELDS = ["bidPbancNo", "bidPbancOrd", "bidPbancNm"]
+
+# 입찰공고 상세 화면 바로가기 URL (탭 풀에서 상세 페이지를 직접 열 때 사용)
+G2B_DETAIL_URL_TEMPLATE = "https://www.g2b.go.kr/link/PNPE027_01/single/?bidPbancNo={bid_no}&bidPbancOrd={bid_ord}"
+
+# 입찰공고목록 화면 바로가기 URL (메뉴 클릭 없이 목록 화면 진입, menuCangVal PNPE001_01 / scrnNo 00941)
+G2B_BID_LIST_URL = "https://www.g2b.go.kr/link/PNPE001_01/single/"
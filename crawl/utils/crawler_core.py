@@ -10,7 +10,8 @@ from selenium.common.exceptions import (
     TimeoutException, 
     ElementClickInterceptedException,
     NoSuchElementException,
-    StaleElementReferenceException
+    StaleElementReferenceException,
+    WebDriverException
 )
     
 
@@ -23,10 +24,31 @@ import chromedriver_autoinstaller
 import requests
 
 import json
+import time
 from datetime import datetime
-from typing import Dict, List
+from typing import Dict, Iterable, List, Optional, Tuple
 
-from utils.constants import SEARCH_KEYWORDS
+from utils.constants import SEARCH_KEYWORDS, G2B_BID_LIST_URL
+from utils.rate_limiter import rate_limiter
+from utils.page_waits import PageWaiter
+from utils.browser_profile import BrowserProfile, get_browser_profile, claim_user_data_dir, release_user_data_dir
+from utils.xhr_capture import XhrCapture, enable_performance_logging
+from utils.tab_pool import DetailTabPool, build_detail_url
+from utils.pipeline import CrawlPipeline
+from utils.page_state import PageState, PageStateMachine
+from utils.driver_lifecycle import DriverLifecycle
+from utils.watchdog import DriverWatchdog, DriverUnresponsiveError, guarded, kill_driver_processes
+from utils.cancellation import CancellationToken
+from utils.parallel_processing import clean_results
+from utils.bid_record import BidRecord, RecordBlobStore, to_dicts
+from utils.detail_projection import api_detail_projector
+from utils.keyword_matcher import KeywordMatcher, get_keyword_matcher
+from utils.keyword_normalizer import KeywordPlan, plan_keyword_crawls
+from utils.session_cookies import (
+    export_driver_cookies, import_driver_cookies,
+    export_session_cookies, import_session_cookies,
+    save_cookies, load_cookies
+)
 
 # 로깅 설정
 logging.basicConfig(
@@ -37,9 +59,11 @@ logger = logging.getLogger(__name__)
 
 
 class SearchValidator:
-    def __init__(self):
+    def __init__(self, keywords: Iterable[str] = None):
         self.seen_bids = set()  # 중복 체크를 위한 bid_number 저장
         self.logger = logging.getLogger(__name__)
+        # 활성 검색어 전체를 한 번에 찾는 매처 (처음 보는 검색어가 들어오면 추가해서 다시 컴파일)
+        self.matcher: KeywordMatcher = get_keyword_matcher(tuple(keywords or SEARCH_KEYWORDS))
         
     def _clean_date(self, date_str: str) -> str:
         """날짜 문자열 정제"""
@@ -67,6 +91,7 @@ class SearchValidator:
         
         return {
             "keyword": raw_data.get("search_keyword", ""),
+            "hydrated": raw_data.get("hydrated", True),
             "bid_info": {
                 "number": basic_info.get("bid_number", ""),
                 "title": basic_info.get("title", ""),
@@ -82,27 +107,32 @@ class SearchValidator:
             }
         }
 
+    def match_keywords(self, bid_data: dict) -> Dict[str, List[Tuple[str, int, int]]]:
+        """제목/공고 본문에 나타난 활성 검색어 -> [(필드, 시작, 끝)] (검색어 전체 또는 그 단어가 나타난 위치)"""
+        matched = {}
+        if not bid_data:
+            return matched
+        texts = {
+            'title': (bid_data.get('basic_info') or {}).get('title') or '',
+            'general_notice': (bid_data.get('detail_info') or {}).get('general_notice') or ''
+        }
+        for field, text in texts.items():
+            for keyword, positions in self.matcher.match(text).items():
+                matched.setdefault(keyword, []).extend((field, start, end) for start, end in positions)
+        return matched
+
     def validate_search_result(self, keyword: str, bid_data: dict) -> bool:
-        """검색어와 입찰 데이터 연관성 검증"""
+        """검색어와 입찰 데이터 연관성 검증 (검색어 전체 또는 공백으로 나눈 단어가 제목/본문에 있으면 통과)"""
         if not bid_data:
             return False
-            
-        # 검색어가 제목이나 내용에 포함되어 있는지 확인
-        keyword_lower = keyword.lower()
-        basic_info = bid_data.get('basic_info', {})
-        detail_info = bid_data.get('detail_info', {})
-        
-        title = basic_info.get('title', '').lower()
-        general_notice = detail_info.get('general_notice', '').lower()
-        
-        # 검색어 포함 여부 확인 (더 유연하게)
-        contains_keyword = (
-            keyword_lower in title or 
-            keyword_lower in general_notice or
-            any(kw in title or kw in general_notice for kw in keyword_lower.split())
-        )
-        
+        if not keyword:
+            return True
+        if keyword not in self.matcher:
+            self.matcher = get_keyword_matcher(self.matcher.keywords + (keyword,))
+
+        contains_keyword = keyword in self.match_keywords(bid_data)
         if contains_keyword:
+            title = bid_data.get('basic_info', {}).get('title', '').lower()
             self.logger.info(f"키워드 '{keyword}' 매칭됨: {title}")
         
         return contains_keyword
@@ -135,7 +165,7 @@ class SearchValidator:
         return is_valid
 
 class NaraMarketCrawler:
-    def __init__(self):
+    def __init__(self, cookies: List[Dict] = None):
         self.base_url = "https://www.g2b.go.kr"
         self.session = requests.Session()
         self.default_headers = {
@@ -143,6 +173,14 @@ class NaraMarketCrawler:
             'Origin': 'https://www.g2b.go.kr',
             'Referer': 'https://www.g2b.go.kr/'
         }
+        if cookies:
+            # 브라우저와 같은 서버 세션(로그인 포함)을 사용
+            count = import_session_cookies(self.session, cookies)
+            logger.info(f"브라우저 쿠키 {count}개를 API 세션에 적용")
+
+    def export_cookies(self) -> List[Dict]:
+        """API 세션 쿠키를 Selenium 쿠키 형식으로 반환"""
+        return export_session_cookies(self.session)
         
     async def initialize_session(self):
         """세션 초기화 및 기본 설정"""
@@ -154,13 +192,26 @@ class NaraMarketCrawler:
                 'menu-info': '{"menuNo":"01175","menuCangVal":"PNPE001_01","bsneClsfCd":"%EC%97%85130026","scrnNo":"00941"}'
             }
             
-            response = self.session.post(url, headers=headers)
+            await rate_limiter.acquire("api_session")
+            start_time = time.monotonic()
+            # 블로킹 HTTP 호출은 스레드에서 실행하여 이벤트 루프(브라우저 작업)를 막지 않음
+            response = await asyncio.to_thread(self.session.post, url, headers=headers)
+            rate_limiter.record(
+                "api_session",
+                latency=time.monotonic() - start_time,
+                success=response.ok,
+                status_code=response.status_code
+            )
             response.raise_for_status()
             
             session_data = response.json()
             logger.info(f"세션 초기화 성공: {json.dumps(session_data, indent=2, ensure_ascii=False)}")
             return True
             
+        except (requests.ConnectionError, requests.Timeout) as e:
+            rate_limiter.record("api_session", success=False)
+            logger.error(f"세션 초기화 실패: {str(e)}")
+            return False
         except Exception as e:
             logger.error(f"세션 초기화 실패: {str(e)}")
             return False
@@ -186,48 +237,267 @@ class NaraMarketCrawler:
             logger.debug(f"상세 정보 요청 - URL: {url}")
             logger.debug(f"상세 정보 Payload: {json.dumps(payload, indent=2, ensure_ascii=False)}")
             
-            response = self.session.post(url, headers=headers, json=payload)
+            await rate_limiter.acquire("api_detail")
+            start_time = time.monotonic()
+            response = await asyncio.to_thread(self.session.post, url, headers=headers, json=payload)
+            rate_limiter.record(
+                "api_detail",
+                latency=time.monotonic() - start_time,
+                success=response.ok,
+                status_code=response.status_code
+            )
             response.raise_for_status()
             
             data = response.json()
             logger.info(f"상세 정보 조회 성공 - 공고번호: {bid_number}")
             return data
             
+        except (requests.ConnectionError, requests.Timeout) as e:
+            rate_limiter.record("api_detail", success=False)
+            logger.error(f"상세 정보 조회 실패 - 공고번호: {bid_number}, 오류: {str(e)}")
+            return {}
         except Exception as e:
             logger.error(f"상세 정보 조회 실패 - 공고번호: {bid_number}, 오류: {str(e)}")
             return {}
 
 
 class BidCrawlerTest:
-    def __init__(self):
-        self.all_results = []  # 클래스 레벨에서 결과 저장
+    def __init__(self, capture_xhr: bool = False, detail_tabs: int = None, user_data_dir: str = None,
+                 list_only: bool = False):
+        # 수집 결과 (BidRecord - 상세 본문/API 응답은 record_store 파일에 두고 접근 시 읽음)
+        self.record_store = RecordBlobStore()
+        self.all_results: List[BidRecord] = []
         self.last_save_time = datetime.now()  # 마지막 저장 시간 추적
         self.save_interval = 300  # 저장 간격 (초 단위, 예: 5분)
         self.driver = None
         self.wait = None
+        self.waiter = None
         self.base_url = "https://www.g2b.go.kr"
         self.processed_keywords = set()  # 처리된 키워드 추적
+        self.keyword_plan: KeywordPlan = None  # 띄어쓰기/표기 변형을 묶은 검색 계획 (run_pipeline에서 생성)
+        self.capture_xhr = capture_xhr  # True면 DOM 대신 XHR JSON 응답에서 데이터 추출
+        self.xhr_capture = None
+        self.captured_details = {}  # 캡처된 상세 XHR 응답 (공고번호 -> 응답)
+        # 상세 페이지용 추가 탭 수 (0이면 기존 클릭 후 뒤로가기 방식)
+        self.detail_tabs = detail_tabs if detail_tabs is not None else int(os.getenv('DETAIL_TAB_POOL_SIZE', '3'))
+        self.tab_pool = None
+        self.pipeline = None
+        self.api_crawler = None  # 상세정보 선요청(prefetch)에 사용하는 API 클라이언트
+        self.prefetch_tasks: Dict[str, asyncio.Task] = {}  # 공고번호 -> 선요청 태스크
+        self.prefetch_stats = {"issued": 0, "ready": 0, "waited": 0, "cancelled": 0}
+        self.navigation_stats = {"reused": 0, "deep_link": 0, "menu": 0}
+        self.state_machine = None
+        self.current_keyword = None  # 현재 검색 중인 키워드 (복구 시 재검색에 사용)
+        # 재사용할 Chrome 사용자 데이터 디렉터리 상위 경로 (미지정 시 매번 새 임시 프로필)
+        self.user_data_base = user_data_dir or os.getenv('CHROME_USER_DATA_DIR')
+        self.user_data_dir = None
+        self.startup_stats = {"driver_start_seconds": None, "first_page_seconds": None, "cookies_restored": 0}
+        self.browser_profile = None
+        self.lifecycle = DriverLifecycle()  # 방문 페이지 수/메모리 기준 드라이버 재시작
+        self.watchdog = DriverWatchdog()  # 작업 마감 초과 시 브라우저 강제 종료
+        self.cancel_token = CancellationToken()  # 중지 요청/작업 시간 예산 (use_cancel_token으로 교체)
+        # True면 목록 그리드 값만 수집하고 상세 페이지/API 상세는 건너뜀 (hydrated=False로 표시)
+        self.list_only = list_only
         
         
-    def setup_driver(self):
-        chrome_options = Options()
-        chrome_options.add_argument('--headless=new')
-        chrome_options.add_argument('--disable-gpu')
-        chrome_options.add_argument('--no-sandbox')
-        chrome_options.add_argument('--disable-dev-shm-usage')
-        chrome_options.add_argument('--window-size=1920,1080')
+    def setup_driver(self, profile: BrowserProfile = None):
+        """Chrome 드라이버 생성 (profile 미지정 시 CHROME_PROFILE 환경변수의 프로필 사용)"""
+        profile = profile or get_browser_profile()
+        self.browser_profile = profile
+        if self.user_data_base and not self.user_data_dir:
+            self.user_data_dir = claim_user_data_dir(self.user_data_base)
+        chrome_options = profile.build_options(self.user_data_dir)
+        self.lifecycle.apply_options(chrome_options)
+        if self.capture_xhr:
+            enable_performance_logging(chrome_options)
         
+        start_time = time.monotonic()
         service = Service(os.getenv('CHROME_DRIVER_PATH'))
         self.driver = webdriver.Chrome(service=service, options=chrome_options)
+        self.startup_stats["driver_start_seconds"] = round(time.monotonic() - start_time, 3)
+        self.lifecycle.on_driver_started()
+        self.driver.set_page_load_timeout(self.watchdog.deadlines["page_load"])
+        self.watchdog.attach(self.driver)
+        profile.apply(self.driver)
+        self._restore_cookies()
+        self._share_api_cookies()
+        if self.capture_xhr:
+            self.xhr_capture = XhrCapture(self.driver)
+        logger.info(
+            f"ChromeDriver 시작 (프로필: {profile.name}, 로드 전략: {profile.page_load_strategy}, "
+            f"사용자 데이터: {self.user_data_dir or '임시'}, {self.startup_stats['driver_start_seconds']}초)"
+        )
         self.wait = WebDriverWait(self.driver, 10)
+        # 드라이버를 다시 띄울 때도 대기 통계와 학습된 전이 비용은 유지
+        if self.waiter:
+            self.waiter.driver = self.driver
+        else:
+            self.waiter = PageWaiter(self.driver)
+            self.waiter.cancel_token = self.cancel_token
+        if not self.state_machine:
+            self.state_machine = PageStateMachine(self)
+        if self.detail_tabs > 0:
+            self.tab_pool = DetailTabPool(
+                self.driver,
+                self.waiter,
+                self._extract_detail_page_data,
+                self._close_popups,
+                size=self.detail_tabs,
+                throttle=self._throttle
+            )
+
+    async def _throttle(self, bucket: str):
+        """브라우저 요청 전 속도 제한 대기 (대기 시간은 워치독 마감에 포함하지 않음)"""
+        with self.watchdog.suspend():
+            await rate_limiter.acquire(bucket)
+
+    def use_cancel_token(self, cancel_token: CancellationToken):
+        """검색/행 수집/상세 조회/화면 대기에서 확인할 취소 토큰 설정"""
+        self.cancel_token = cancel_token
+        if self.waiter:
+            self.waiter.cancel_token = cancel_token
+
+    def _cookie_file(self):
+        return os.path.join(self.user_data_dir, "g2b_cookies.json") if self.user_data_dir else None
+
+    def _restore_cookies(self):
+        """이전 실행에서 저장한 쿠키 복원 (세션 쿠키는 Chrome 종료 시 사라지므로 별도 파일로 유지)"""
+        cookie_file = self._cookie_file()
+        if not cookie_file:
+            return
+        cookies = load_cookies(cookie_file)
+        if cookies:
+            self.startup_stats["cookies_restored"] = import_driver_cookies(self.driver, cookies)
+            logger.info(f"저장된 쿠키 {self.startup_stats['cookies_restored']}개 복원")
+
+    def _share_api_cookies(self):
+        """API 세션이 받은 쿠키를 브라우저에도 적용 (드라이버 재시작 후에도 같은 서버 세션 유지)"""
+        if not self.api_crawler or not self.driver:
+            return
+        count = import_driver_cookies(self.driver, self.api_crawler.export_cookies())
+        if count:
+            self.startup_stats["cookies_shared"] = count
+            logger.info(f"API 세션 쿠키 {count}개를 브라우저에 적용")
+
+    def _persist_cookies(self):
+        """다음 실행에서 재사용하도록 현재 브라우저 쿠키 저장"""
+        cookie_file = self._cookie_file()
+        if cookie_file and self.driver:
+            save_cookies(cookie_file, export_driver_cookies(self.driver))
+
+    async def maybe_recycle_driver(self) -> bool:
+        """페이지 수/메모리 기준을 넘었으면 드라이버 재시작 (키워드 사이에서 호출)"""
+        if not self.driver:
+            return False
+        reason = self.lifecycle.recycle_reason(self.driver)
+        if not reason:
+            return False
+        await self.restart_driver(reason)
+        return True
+
+    async def restart_driver(self, reason: str):
+        """현재 드라이버를 종료하고 같은 프로필/사용자 데이터로 새로 띄운 뒤 목록 화면으로 복귀
+
+        처리한 키워드와 수집 결과는 크롤러에 그대로 남아 있으므로 다음 키워드부터 이어서 진행한다.
+        """
+        logger.info(f"드라이버 재시작: {reason}")
+        start_time = time.monotonic()
+        self._quit_driver()
+        self.driver = None
+        self.setup_driver(self.browser_profile)
+        await self.navigate_to_bid_list()
+        elapsed = time.monotonic() - start_time
+        self.lifecycle.record_recycle(reason, elapsed)
+        logger.info(f"드라이버 재시작 완료 ({elapsed:.2f}초, 누적 {len(self.lifecycle.recycles)}회)")
+
+    def _quit_driver(self):
+        """드라이버 종료 - 응답 없는 드라이버는 quit도 멈출 수 있으므로 프로세스를 바로 정리"""
+        if not self.driver:
+            return
+        if self.watchdog.tripped:
+            kill_driver_processes(self.driver)
+            return
+        self._persist_cookies()
+        try:
+            self.driver.quit()
+        except Exception as e:
+            logger.error(f"드라이버 종료 실패: {str(e)}")
+
+    def _driver_responsive(self) -> bool:
+        """간단한 스크립트 실행으로 브라우저 응답 확인 (멈춘 경우 워치독이 ping 마감 후 종료)"""
+        try:
+            with self.watchdog.guard("ping"):
+                self.driver.execute_script("return 1;")
+            return True
+        except WebDriverException as e:
+            logger.warning(f"브라우저 응답 확인 실패: {str(e)}")
+            return False
+
+    async def ensure_driver_alive(self) -> bool:
+        """브라우저가 멈췄거나 종료되었으면 다시 띄움 - 재시작했으면 True"""
+        if self.driver and not self.watchdog.tripped and self._driver_responsive():
+            return False
+        reason = f"워치독: {self.watchdog.tripped or '브라우저 응답 없음'}"
+        await self.restart_driver(reason)
+        self.watchdog.stats["restarts"] += 1
+        return True
+
+    def create_api_crawler(self) -> 'NaraMarketCrawler':
+        """브라우저 쿠키를 공유하는 API 클라이언트 생성"""
+        return NaraMarketCrawler(cookies=export_driver_cookies(self.driver) if self.driver else None)
         
-        
-    async def navigate_to_bid_list(self):
-        """입찰공고 목록 페이지로 이동"""
+    @guarded("navigate")
+    async def navigate_to_bid_list(self, force_menu: bool = False):
+        """입찰공고 목록 페이지로 이동
+
+        이미 목록 화면이면 그대로 재사용하고, 아니면 바로가기 URL로 진입한다.
+        바로가기가 실패하거나 force_menu=True인 경우에만 메인 페이지 메뉴를 거쳐 이동한다.
+        """
+        start_time = time.monotonic()
+        if not force_menu:
+            if self.waiter.is_list_screen():
+                self.navigation_stats["reused"] += 1
+                logger.debug("입찰공고 목록 화면 재사용")
+                return
+            if await self._open_bid_list_direct():
+                self.navigation_stats["deep_link"] += 1
+                self._record_first_page(start_time)
+                return
+        await self._navigate_via_menu()
+        self.navigation_stats["menu"] += 1
+        self._record_first_page(start_time)
+
+    def _record_first_page(self, start_time: float):
+        """드라이버 시작 후 첫 목록 화면 진입 시간 기록 (디스크 캐시 효과 측정용)"""
+        if self.startup_stats["first_page_seconds"] is None:
+            self.startup_stats["first_page_seconds"] = round(time.monotonic() - start_time, 3)
+            logger.info(f"첫 페이지 로딩 시간: {self.startup_stats['first_page_seconds']}초")
+
+    async def _open_bid_list_direct(self) -> bool:
+        """바로가기 URL로 입찰공고목록 화면 진입 - 실패 시 False"""
         try:
+            await self._throttle("main_page")
+            start_time = time.monotonic()
+            self.driver.get(G2B_BID_LIST_URL)
+            self.lifecycle.record_pages()
+            if await self.waiter.wait_for_list_screen():
+                rate_limiter.record("main_page", latency=time.monotonic() - start_time)
+                logger.info("입찰공고 목록 페이지로 바로 이동 완료")
+                return True
+            logger.warning("바로가기 URL로 목록 화면 진입 실패, 메뉴 이동으로 대체")
+        except Exception as e:
+            logger.warning(f"바로가기 URL 이동 중 오류, 메뉴 이동으로 대체: {str(e)}")
+        return False
+
+    async def _navigate_via_menu(self):
+        """메인 페이지에서 입찰 > 입찰공고 > 입찰공고목록 메뉴를 차례로 클릭하여 이동"""
+        try:
+            await self._throttle("main_page")
+            start_time = time.monotonic()
             self.driver.get(self.base_url)
+            self.lifecycle.record_pages()
+            rate_limiter.record("main_page", latency=time.monotonic() - start_time)
             logger.info("메인 페이지 접속")
-            await asyncio.sleep(2)
             
             parent_menus = [
                 "mf_wfm_gnb_wfm_gnbMenu_genDepth1_1_btn_menuLvl1_span",  # 입찰
@@ -237,18 +507,22 @@ class BidCrawlerTest:
             
             for menu_id in parent_menus:
                 try:
+                    start_time = time.monotonic()
                     menu_element = self.wait.until(
                         EC.presence_of_element_located((By.ID, menu_id))
                     )
+                    rate_limiter.record("menu", latency=time.monotonic() - start_time)
+                    await self._throttle("menu")
                     self.driver.execute_script("arguments[0].click();", menu_element)
                     logger.info(f"메뉴 클릭 완료: {menu_id}")
-                    await asyncio.sleep(1)
                 except Exception as e:
+                    rate_limiter.record("menu", success=False)
                     logger.error(f"메뉴 클릭 실패: {menu_id}, 오류: {str(e)}")
                     raise
                     
+            if not await self.waiter.wait_for_list_screen():
+                raise TimeoutException("입찰공고 목록 화면 로딩 시간 초과")
             logger.info("입찰공고 목록 페이지로 이동 완료")
-            await asyncio.sleep(2)
             
         except Exception as e:
             logger.error(f"페이지 이동 중 오류: {str(e)}")
@@ -258,66 +532,82 @@ class BidCrawlerTest:
     async def navigate_and_analyze(self):
         try:
             await self.navigate_to_bid_list()
-            
-            total_keywords = len(SEARCH_KEYWORDS)
-            for i, keyword in enumerate(SEARCH_KEYWORDS, 1):
-                try:
-                    # 진행 상황 로깅
-                    logger.info(f"\n진행 상황: {i}/{total_keywords} ({(i/total_keywords)*100:.1f}%)")
-                    logger.info(f"\n{'='*30}\n{keyword} 검색 시작\n{'='*30}")
-                    
-                    # 이미 처리된 키워드 확인
-                    if keyword in self.processed_keywords:
-                        logger.warning(f"키워드 '{keyword}' 이미 처리됨, 건너뜀")
-                        continue
-                    
-                    # 페이지 상태 확인
-                    table_id = "mf_wfm_container_tacBidPbancLst_contents_tab2_body_gridView1_dataLayer"
-                    try:
-                        table = self.wait.until(EC.presence_of_element_located((By.ID, table_id)))
-                        if not table.is_displayed():
-                            logger.warning("테이블이 표시되지 않음. 페이지 복구 시도")
-                            if not await self.recover_page_state(keyword):
-                                logger.error("페이지 복구 실패")
-                                await self.navigate_to_bid_list()
-                    except:
-                        logger.error("테이블을 찾을 수 없음. 페이지 복구 시도")
-                        if not await self.recover_page_state(keyword):
-                            logger.error("페이지 복구 실패")
-                            await self.navigate_to_bid_list()
-                    
-                    # 검색 수행
-                    results = await self.perform_search(keyword)
-                    
-                    # 검색 결과 로깅
-                    if results:
-                        logger.info(f"키워드 '{keyword}' 검색 결과: {len(results)}건")
-                    else:
-                        logger.warning(f"키워드 '{keyword}' 검색 결과 없음")
-                    
-                    # 처리 완료 키워드 기록
-                    self.processed_keywords.add(keyword)
-                    
-                    await asyncio.sleep(3)
-                    
-                    # 다음 검색을 위해 입찰공고 목록 페이지로 새로 이동
-                    await self.navigate_to_bid_list()
-                    
-                except Exception as e:
-                    logger.error(f"{keyword} 검색 중 오류 발생: {str(e)}")
-                    # 오류 발생 시 페이지 복구
-                    self.driver.back()
-                    await asyncio.sleep(2)
-                    await self.navigate_to_bid_list()
-                    continue
+            results = await self.run_pipeline(SEARCH_KEYWORDS)
+            logger.info(f"전체 키워드 검색 결과: {len(results)}건")
                     
         except Exception as e:
             logger.error(f"전체 프로세스 중 오류: {str(e)}")
         finally:
-            # 진행 상황 저장
+            # 진행 상황 저장 (브라우저 정리는 호출 측에서 cleanup()으로 한 번만 수행)
             self.save_progress()
-            input("계속하려면 아무 키나 누르세요...")
-            await self.cleanup()
+
+    async def run_pipeline(self, keywords: List[str], enricher_count: int = 3, queue_size: int = 20,
+                           should_stop=None, on_keyword=None,
+                           cancel_token: CancellationToken = None,
+                           collapse_synonyms: bool = None) -> List[Dict]:
+        """목록 수집/상세 보강/저장 단계를 겹쳐 실행하는 파이프라인으로 키워드 처리
+
+        cancel_token이 취소되면(중지 요청, 시간 예산 초과) 그때까지 저장된 결과를 바로 반환한다.
+        """
+        if cancel_token:
+            self.use_cancel_token(cancel_token)
+        # 세션이 시작된 경우에만 API 상세 보강 (실패/목록 전용이면 None으로 넘겨 보강 단계에서 건너뜀)
+        self.api_crawler = None
+        api_crawler = self.create_api_crawler()
+        if self.list_only:
+            logger.info("목록 전용 모드: API 상세정보 조회 생략")
+        elif await api_crawler.initialize_session():
+            self.api_crawler = api_crawler
+            self._share_api_cookies()
+        else:
+            logger.error("API 세션 초기화 실패, API 상세정보 없이 진행")
+
+        # 같은 검색어의 중복 표기는 한 번만 검색 (검증은 원래 검색어 전체로)
+        self.keyword_plan = plan_keyword_crawls(keywords, collapse_synonyms)
+        self.pipeline = CrawlPipeline(
+            self,
+            self.keyword_plan.searches,
+            self.api_crawler,
+            SearchValidator(keywords),
+            enricher_count=enricher_count,
+            queue_size=queue_size,
+            should_stop=should_stop,
+            on_keyword=on_keyword,
+            cancel_token=self.cancel_token
+        )
+        return await self.pipeline.run()
+
+    def mark_keyword_processed(self, keyword: str):
+        """검색한 키워드와 검색 계획상 그 검색으로 처리되는 변형 키워드를 처리 완료로 기록"""
+        self.processed_keywords.add(keyword)
+        if self.keyword_plan:
+            self.processed_keywords.update(self.keyword_plan.covered([keyword]))
+
+    async def ensure_list_ready(self, keyword: str):
+        """검색 전 목록 화면 상태 확인 및 필요 시 복구"""
+        if await self.waiter.wait_for_list_screen(timeout=3):
+            return
+        state = self.state_machine.detect()
+        logger.warning(f"목록 화면이 아님 ({state.value}). 페이지 복구 시도")
+        if not await self.recover_page_state(keyword):
+            logger.error("페이지 복구 실패, 메뉴 이동으로 재시도")
+            await self.navigate_to_bid_list(force_menu=True)
+
+    async def recover_after_error(self) -> bool:
+        """키워드 처리 중 오류 발생 시 목록 화면으로 복귀 (이동 속도는 rate_limiter가 조절)
+
+        브라우저가 멈춰 다시 띄운 경우 True를 반환하여 호출 측이 같은 키워드를 재시도하게 한다.
+        """
+        try:
+            if await self.ensure_driver_alive():
+                return True
+            with self.watchdog.guard("recover"):
+                recovered = await self.state_machine.recover(PageState.LIST)
+            if not recovered:
+                await self.navigate_to_bid_list(force_menu=True)
+        except Exception as e:
+            logger.error(f"오류 후 페이지 복구 실패: {str(e)}")
+        return False
 
     def save_progress(self):
         """진행 상황 저장"""
@@ -331,7 +621,20 @@ class BidCrawlerTest:
                 "total_keywords": len(SEARCH_KEYWORDS),
                 "processed_keywords": list(self.processed_keywords),
                 "remaining_keywords": list(set(SEARCH_KEYWORDS) - self.processed_keywords),
-                "total_results": len(self.all_results)
+                "total_results": len(self.all_results),
+                "rate_limits": rate_limiter.get_stats(),
+                "page_waits": self.waiter.get_stats() if self.waiter else {},
+                "xhr_capture": self.xhr_capture.stats if self.xhr_capture else {},
+                "detail_tabs": self.tab_pool.stats if self.tab_pool else {},
+                "pipeline": self.pipeline.get_stats() if self.pipeline else {},
+                "prefetch": self.prefetch_stats,
+                "navigation": self.navigation_stats,
+                "page_state": self.state_machine.get_stats() if self.state_machine else {},
+                "startup": self.startup_stats,
+                "driver_lifecycle": self.lifecycle.get_stats(),
+                "watchdog": self.watchdog.get_stats(),
+                "keyword_plan": self.keyword_plan.get_stats() if self.keyword_plan else {},
+                "record_store": self.record_store.get_stats()
             }
             
             filename = os.path.join(save_dir, f"crawling_progress_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json")
@@ -343,62 +646,29 @@ class BidCrawlerTest:
         except Exception as e:
             logger.error(f"진행 상황 저장 실패: {str(e)}")
             
-    async def recover_page_state(self, keyword: str, retry_count=0):
-        """페이지 상태 복구 시도"""
-        MAX_RETRIES = 2
-        table_id = "mf_wfm_container_tacBidPbancLst_contents_tab2_body_gridView1_dataLayer"
-        
+    async def recover_page_state(self, keyword: str, target: PageState = PageState.LIST) -> bool:
+        """페이지 상태 복구 - 현재 화면에서 목표 화면까지 가장 비용이 적은 전이 경로로 이동"""
         try:
-            # 첫 번째: 뒤로가기 시도
-            self.driver.back()
-            await asyncio.sleep(2)
-            
-            try:
-                table = self.wait.until(EC.presence_of_element_located((By.ID, table_id)))
-                if table.is_displayed():
-                    logger.info("뒤로가기로 페이지 복구 성공")
-                    return True
-            except:
-                if retry_count < MAX_RETRIES:
-                    logger.warning(f"복구 시도 {retry_count + 1} 실패, 처음부터 다시 시도")
-                    # 입찰공고 목록부터 다시 시작
-                    await self.navigate_to_bid_list()
-                    await asyncio.sleep(2)
-                    # 검색어 다시 입력
-                    await self.perform_search(keyword)
-                    await asyncio.sleep(2)
-                    return await self.recover_page_state(keyword, retry_count + 1)
-                else:
-                    logger.error("최대 복구 시도 횟수 초과")
-                    return False
-                    
+            with self.watchdog.guard("recover"):
+                return await self.state_machine.recover(target, keyword)
         except Exception as e:
             logger.error(f"페이지 복구 중 오류: {str(e)}")
             return False
 
 
     # crawler_core.py의 perform_search 메서드
-    async def perform_search(self, keyword: str):
-        try:
-            logger.info(f"'{keyword}' 검색 시도")
-            search_results = []  # 개별 검색 결과를 위한 리스트
-            
-            # 검색어 입력 및 실행
-            search_input = self.wait.until(EC.presence_of_element_located(
-                (By.XPATH, "/html/body/div[1]/div[3]/div/div[2]/div/div[2]/div[2]/div/div/div[2]/div/div[1]/div[1]/div[1]/div[1]/table/tbody/tr[1]/td[3]/input")
-            ))
-            search_input.clear()
-            search_input.send_keys(keyword)
-            search_input.send_keys(Keys.RETURN)
-            await asyncio.sleep(2)
-
-            # 결과 검증 및 추출
-            if await self._check_no_results():
-                logger.info(f"키워드 '{keyword}'에 대한 검색 결과가 없습니다.")
-                return []
+    async def perform_search(self, keyword: str, cancel_token: CancellationToken = None):
+        """키워드 검색 후 검증/중복 제거된 결과 반환
 
-            if not await self._verify_table_exists():
-                logger.warning(f"키워드 '{keyword}'에 대한 검색 결과 테이블을 찾을 수 없습니다.")
+        cancel_token이 취소되면 CrawlCancelled가 발생하며, 그때까지 수집된 행은 all_results에 남아 있다.
+        """
+        if cancel_token:
+            self.use_cancel_token(cancel_token)
+        self.cancel_token.raise_if_cancelled()
+        try:
+            if not await self.ensure_driver_alive():
+                await self.maybe_recycle_driver()
+            if not await self.submit_search(keyword):
                 return []
 
             # 검색 결과 추출
@@ -426,6 +696,40 @@ class BidCrawlerTest:
         except Exception as e:
             logger.error(f"검색 중 오류 발생: {str(e)}")
             return []
+
+    @guarded("search")
+    async def submit_search(self, keyword: str) -> bool:
+        """검색어 입력 및 실행 - 결과 테이블이 표시되면 True 반환"""
+        logger.info(f"'{keyword}' 검색 시도")
+        self.current_keyword = keyword
+        
+        # 검색어 입력 및 실행
+        search_input = self.wait.until(EC.presence_of_element_located(
+            (By.XPATH, "/html/body/div[1]/div[3]/div/div[2]/div/div[2]/div[2]/div/div/div[2]/div/div[1]/div[1]/div[1]/div[1]/table/tbody/tr[1]/td[3]/input")
+        ))
+        search_input.clear()
+        search_input.send_keys(keyword)
+        previous_first_row = self.waiter.snapshot_grid()
+        if self.xhr_capture:
+            self.xhr_capture.discard()
+        await self._throttle("search")
+        start_time = time.monotonic()
+        search_input.send_keys(Keys.RETURN)
+        self.lifecycle.record_pages()
+        await self.waiter.wait_for_search_results(previous_first_row)
+
+        # 결과 검증
+        if await self._check_no_results():
+            rate_limiter.record("search", latency=time.monotonic() - start_time)
+            logger.info(f"키워드 '{keyword}'에 대한 검색 결과가 없습니다.")
+            return False
+
+        table_found = await self._verify_table_exists()
+        rate_limiter.record("search", latency=time.monotonic() - start_time, success=table_found)
+        if not table_found:
+            logger.warning(f"키워드 '{keyword}'에 대한 검색 결과 테이블을 찾을 수 없습니다.")
+            return False
+        return True
         
     # 1. 검색 결과 없음 확인 부분을 별도 메서드로 분리 제안
     async def _check_no_results(self):
@@ -447,67 +751,218 @@ class BidCrawlerTest:
     async def extract_search_results(self, keyword: str):
         try:
             logger.info(f"\n검색 키워드: {keyword}\n" + "="*50 + "\n검색 결과 추출 시작\n" + "="*50)
-            
-            # 1. 기본 검증 (이전 검증 재사용)
-            if await self._check_no_results():
-                return
-                
-            if not await self._verify_table_exists():
-                return
 
-            # 2. API 클라이언트 초기화
-            api_crawler = NaraMarketCrawler()
+            # 1. API 클라이언트 초기화
+            api_crawler = self.create_api_crawler()
             if not await api_crawler.initialize_session():
                 logger.error("API 세션 초기화 실패")
                 return
+            self.api_crawler = api_crawler
+            self._share_api_cookies()
 
-            # 3. 데이터 추출 시작
-            try:
+            # 2. 목록/상세 페이지 데이터 수집 (브라우저 작업)
+            records = await self.collect_search_rows(keyword)
+
+            # 3. API 상세정보 보강 및 저장
+            for record in records:
+                self.cancel_token.raise_if_cancelled()
+                try:
+                    await self.enrich_with_api_detail(record, api_crawler)
+                    self.all_results.append(self.compact_record(record))
+                    logger.info(f"결과 추가됨: 현재 총 {len(self.all_results)}건")
+
+                    # 주기적 저장 체크
+                    await self._check_and_save_results()
+
+                except Exception as e:
+                    logger.error(f"행 처리 중 오류 ({record['basic_info'].get('bid_number')}): {str(e)}")
+                    continue
+
+        except Exception as e:
+            logger.error(f"전체 프로세스 중 오류: {str(e)}")
+
+    async def collect_search_rows(self, keyword: str) -> List[Dict]:
+        """검색 결과 화면에서 행 기본 정보와 상세 페이지 데이터 수집 (브라우저 작업만 수행)
+
+        워치독 마감은 목록 읽기(collect)와 상세 페이지(detail, 건별)에 따로 건다.
+        """
+        records = []
+
+        with self.watchdog.guard("collect"):
+            # 1. 기본 검증 (이전 검증 재사용)
+            if await self._check_no_results():
+                return records
+
+            if not await self._verify_table_exists():
+                return records
+
+            # 2. XHR 캡처 모드: 목록/상세 JSON 응답에서 바로 추출
+            if self.xhr_capture:
+                records = self._collect_rows_from_xhr(keyword)
+                if records:
+                    return records
+                logger.warning("목록 XHR 응답을 찾지 못함, DOM 추출로 대체")
+
+        # 3. 데이터 추출 시작 (DOM)
+        try:
+            with self.watchdog.guard("collect"):
                 # 행 수 확인
                 total_rows = await self._get_total_rows()
                 logger.info(f"총 {total_rows}개의 행 발견")
 
-                # 각 행 처리
+                # 3.1 기본 데이터 추출 (목록 화면에서 먼저 모두 읽음)
+                rows = []
                 for row_num in range(min(total_rows, 10)):  # 최대 10개로 제한
-                    try:
-                        # 3.1 기본 데이터 추출
-                        basic_data = await self._extract_row_data(row_num)
-                        if not basic_data:
-                            continue
-
-                        # 3.2 데이터 보강
-                        enriched_data = {
-                            'search_keyword': keyword,
-                            'basic_info': basic_data
-                        }
-
-                        # 3.3 API 상세정보 추출
-                        if basic_data.get('bid_number'):
-                            api_detail = await api_crawler.get_bid_detail(basic_data['bid_number'])
-                            if api_detail:
-                                enriched_data['api_detail'] = api_detail
-
-                        # 3.4 상세 페이지 데이터 추출
+                    self.cancel_token.raise_if_cancelled()
+                    basic_data = await self._extract_row_data(row_num)
+                    if basic_data:
+                        rows.append((row_num, basic_data))
+
+            # 목록 전용 모드: 상세 정보는 사용자가 공고를 열 때 hydration으로 조회
+            if self.list_only:
+                return [self._unhydrated_record(keyword, basic_data) for _, basic_data in rows]
+
+            # 목록을 읽은 즉시 API 상세정보 선요청 (상세 페이지 처리와 겹쳐서 진행)
+            self._start_prefetch([basic_data.get('bid_number') for _, basic_data in rows])
+
+            # 3.2 상세 페이지는 탭 풀에서 한 번에 처리 (목록 화면은 그대로 유지)
+            tab_details = {}
+            if self.tab_pool:
+                bid_numbers = [basic_data['bid_number'] for _, basic_data in rows if basic_data.get('bid_number')]
+                # 탭 풀은 한 번에 여러 건을 처리하므로 상세 마감을 건수만큼 늘림
+                with self.watchdog.guard("detail", timeout=self.watchdog.deadlines["detail"] * max(len(bid_numbers), 1)):
+                    tab_details = await self.tab_pool.fetch_many(bid_numbers, cancel_token=self.cancel_token)
+                self.lifecycle.record_pages(len(tab_details))
+
+            # 3.3 행별 결과 구성
+            for row_num, basic_data in rows:
+                if self.watchdog.tripped:
+                    break
+                self.cancel_token.raise_if_cancelled()
+                try:
+                    record = {
+                        'search_keyword': keyword,
+                        'basic_info': basic_data
+                    }
+
+                    # 탭 풀 실패 시 클릭 후 뒤로가기 방식으로 상세 페이지 추출 (건별로 detail 마감 적용)
+                    detail_data = tab_details.get(basic_data.get('bid_number'))
+                    if detail_data is None:
                         detail_data = await self._safely_navigate_and_extract_detail(row_num)
-                        if detail_data:
-                            enriched_data['detail_info'] = detail_data
+                    if detail_data:
+                        record['detail_info'] = detail_data
 
-                        # 3.5 결과 저장
-                        self.all_results.append(enriched_data)
-                        logger.info(f"결과 추가됨: 현재 총 {len(self.all_results)}건")
-                        
-                        # 3.6 주기적 저장 체크
-                        await self._check_and_save_results()
+                    records.append(record)
 
-                    except Exception as e:
-                        logger.error(f"{row_num + 1}번째 행 처리 중 오류: {str(e)}")
-                        continue
+                except Exception as e:
+                    logger.error(f"{row_num + 1}번째 행 처리 중 오류: {str(e)}")
+                    continue
 
-            except Exception as e:
-                logger.error(f"데이터 추출 중 오류: {str(e)}")
+        except Exception as e:
+            logger.error(f"데이터 추출 중 오류: {str(e)}")
 
+        # 수집 도중 브라우저가 강제 종료되었으면 일부 결과 대신 재시도하도록 알림
+        if self.watchdog.tripped:
+            raise DriverUnresponsiveError(f"브라우저 응답 없음: {self.watchdog.tripped}")
+        return records
+
+    def _collect_rows_from_xhr(self, keyword: str) -> List[Dict]:
+        """캡처된 목록 XHR 응답으로 결과 구성 - 목록 응답이 없거나 읽지 못하면 빈 리스트 (DOM 추출로 대체)"""
+        try:
+            captured = self.xhr_capture.drain()
+            # 상세 XHR 응답도 필요한 필드만 남겨 보관
+            self.captured_details.update(
+                (bid_number, api_detail_projector.project(bid_number, detail))
+                for bid_number, detail in self.xhr_capture.extract_details(captured).items()
+            )
+            rows = self.xhr_capture.extract_list_rows(captured)
         except Exception as e:
-            logger.error(f"전체 프로세스 중 오류: {str(e)}")
+            logger.error(f"XHR 응답 처리 중 오류: {str(e)}")
+            return []
+        if rows:
+            logger.info(f"목록 XHR에서 {len(rows)}개의 행 발견")
+
+        if self.list_only:
+            return [self._unhydrated_record(keyword, basic_data, source='xhr') for basic_data in rows[:10]]
+
+        records = []
+        for basic_data in rows[:10]:  # DOM 방식과 동일하게 최대 10개로 제한
+            record = {
+                'search_keyword': keyword,
+                'basic_info': basic_data,
+                'source': 'xhr'
+            }
+            # 화면에서 이미 호출된 상세 XHR이 있으면 재사용
+            captured_detail = self.captured_details.get(basic_data.get('bid_number'))
+            if captured_detail:
+                record['api_detail'] = captured_detail
+            records.append(record)
+
+        self._start_prefetch([r['basic_info'].get('bid_number') for r in records if 'api_detail' not in r])
+        return records
+
+    @staticmethod
+    def _unhydrated_record(keyword: str, basic_data: Dict, source: str = None) -> Dict:
+        """목록 그리드 값만 담은 결과 (detail_info/api_detail은 hydration에서 채움)"""
+        record = {
+            'search_keyword': keyword,
+            'basic_info': basic_data,
+            'hydrated': False
+        }
+        if source:
+            record['source'] = source
+        return record
+
+    def _start_prefetch(self, bid_numbers: List[str]):
+        """목록에서 읽은 공고번호들의 API 상세정보를 미리 요청 (요청 속도는 rate_limiter가 조절)"""
+        if not self.api_crawler:
+            return
+        for bid_number in bid_numbers:
+            if bid_number and bid_number not in self.prefetch_tasks:
+                self.prefetch_tasks[bid_number] = asyncio.create_task(
+                    self.api_crawler.get_bid_detail(bid_number)
+                )
+                self.prefetch_stats["issued"] += 1
+
+    def cancel_prefetches(self):
+        """실행 중지 시 남은 선요청 취소"""
+        for task in self.prefetch_tasks.values():
+            if not task.done():
+                task.cancel()
+                self.prefetch_stats["cancelled"] += 1
+        self.prefetch_tasks.clear()
+
+    async def _take_prefetched(self, bid_number: str):
+        """선요청 결과 반환 - 선요청이 없으면 None, 취소된 경우 빈 dict"""
+        task = self.prefetch_tasks.pop(bid_number, None)
+        if task is None:
+            return None
+        self.prefetch_stats["ready" if task.done() else "waited"] += 1
+        try:
+            return await task
+        except asyncio.CancelledError:
+            if task.cancelled():
+                return {}
+            raise
+
+    def compact_record(self, record: Dict) -> BidRecord:
+        """all_results에 보관할 BidRecord로 변환"""
+        return BidRecord.from_dict(record, self.record_store)
+
+    async def enrich_with_api_detail(self, record: Dict, api_crawler: Optional['NaraMarketCrawler']) -> Dict:
+        """API 상세정보 추가 (XHR 캡처로 이미 확보한 경우, 목록 전용 결과, API 세션이 없는 경우는 생략)"""
+        self.cancel_token.raise_if_cancelled()
+        if record.get('hydrated') is False:
+            return record
+        bid_number = record['basic_info'].get('bid_number')
+        if bid_number and 'api_detail' not in record:
+            api_detail = await self._take_prefetched(bid_number)
+            if api_detail is None and api_crawler is not None:
+                api_detail = await api_crawler.get_bid_detail(bid_number)
+            if api_detail:
+                # 구조화 추출에 쓰는 필드만 남김 (원본 보관은 API_DETAIL_ARCHIVE_DIR)
+                record['api_detail'] = api_detail_projector.project(bid_number, api_detail)
+        return record
 
     async def _get_total_rows(self):
         """테이블의 총 행 수 확인"""
@@ -526,6 +981,7 @@ class BidCrawlerTest:
             logger.error(f"행 수 확인 중 오류: {str(e)}")
         return row_count
 
+    @guarded("detail")
     async def _safely_navigate_and_extract_detail(self, row_num):
         """안전한 상세 페이지 탐색 및 데이터 추출"""
         try:
@@ -534,49 +990,74 @@ class BidCrawlerTest:
             title_element = WebDriverWait(self.driver, 10).until(
                 EC.element_to_be_clickable((By.ID, title_cell_id))
             )
+            await self._throttle("detail_page")
+            start_time = time.monotonic()
             self.driver.execute_script("arguments[0].click();", title_element)
-            await asyncio.sleep(2)
+            self.lifecycle.record_pages()
+            await self.waiter.wait_for_overlay_gone()
 
-            # 2. 팝업창 처리 (단순화된 방식)
-            try:
-                # 방법 1: 직접 close 버튼의 ID로 접근
-                close_button = self.driver.find_element(
-                    By.XPATH, 
-                    "//div[contains(@id, '_close') and contains(@class, 'w2window_close')]"
-                )
-                if close_button:
-                    self.driver.execute_script("arguments[0].click();", close_button)
-                    logger.info("팝업창 닫기 성공 (close 버튼)")
-                    await asyncio.sleep(1)
-            except:
-                # 방법 2: 확인 버튼이 있는 경우
-                try:
-                    confirm_button = self.driver.find_element(
-                        By.XPATH, 
-                        "//input[@type='button' and @value='확인']"
-                    )
-                    if confirm_button:
-                        self.driver.execute_script("arguments[0].click();", confirm_button)
-                        logger.info("팝업창 닫기 성공 (확인 버튼)")
-                        await asyncio.sleep(1)
-                except:
-                    logger.debug("팝업창 없음 또는 처리 불필요")
+            # 2. 팝업창 처리
+            await self._close_popups()
 
             # 3. 상세 데이터 추출
+            if not await self.waiter.wait_for_detail_page():
+                logger.warning("상세 페이지 섹션이 표시되지 않음")
             detail_data = await self._extract_detail_page_data()
+            rate_limiter.record("detail_page", latency=time.monotonic() - start_time, success=bool(detail_data))
 
             # 4. 목록으로 복귀
+            await self._throttle("detail_page")
             self.driver.back()
-            await asyncio.sleep(2)
-            await self._verify_table_exists()
+            await self.waiter.wait_for_grid()
 
             return detail_data
 
         except Exception as e:
             logger.error(f"상세 페이지 처리 중 오류: {str(e)}")
-            self.driver.back()
-            await asyncio.sleep(2)
+            rate_limiter.record("detail_page", success=False)
+            if not self.watchdog.tripped:
+                await self.recover_page_state(self.current_keyword, PageState.LIST_RESULTS)
+            return None
+
+    @guarded("detail")
+    async def open_detail_page(self, bid_number: str) -> Optional[Dict]:
+        """공고번호로 상세 화면을 직접 열어 데이터 추출 (목록 화면을 거치지 않음)"""
+        await self._throttle("detail_page")
+        start_time = time.monotonic()
+        await asyncio.to_thread(self.driver.get, build_detail_url(bid_number))
+        self.lifecycle.record_pages()
+        if not await self.waiter.wait_for_detail_page():
+            logger.warning(f"상세 페이지 로딩 실패: {bid_number}")
+            rate_limiter.record("detail_page", success=False)
             return None
+        await self._close_popups()
+        detail_data = await self._extract_detail_page_data()
+        rate_limiter.record("detail_page", latency=time.monotonic() - start_time, success=bool(detail_data))
+        return detail_data
+
+    async def _close_popups(self):
+        """상세 페이지 진입 시 뜨는 팝업창 닫기 (단순화된 방식)"""
+        try:
+            # 방법 1: 직접 close 버튼의 ID로 접근
+            close_button = self.driver.find_element(
+                By.XPATH, 
+                "//div[contains(@id, '_close') and contains(@class, 'w2window_close')]"
+            )
+            if close_button:
+                self.driver.execute_script("arguments[0].click();", close_button)
+                logger.info("팝업창 닫기 성공 (close 버튼)")
+        except:
+            # 방법 2: 확인 버튼이 있는 경우
+            try:
+                confirm_button = self.driver.find_element(
+                    By.XPATH, 
+                    "//input[@type='button' and @value='확인']"
+                )
+                if confirm_button:
+                    self.driver.execute_script("arguments[0].click();", confirm_button)
+                    logger.info("팝업창 닫기 성공 (확인 버튼)")
+            except:
+                logger.debug("팝업창 없음 또는 처리 불필요")
 
     async def _check_and_save_results(self):
         current_time = datetime.now()
@@ -749,7 +1230,6 @@ class BidCrawlerTest:
                     if checkbox and not checkbox.is_selected():
                         # JavaScript로 클릭 실행
                         self.driver.execute_script("arguments[0].click();", checkbox)
-                        await asyncio.sleep(1)
                         logger.info("체크박스 선택 성공")
                         
                         # 다운로드 버튼 찾기 - 버튼 ID가 동적으로 변하므로 더 일반적인 속성으로 검색
@@ -762,7 +1242,7 @@ class BidCrawlerTest:
                         
                         if download_button:
                             self.driver.execute_script("arguments[0].click();", download_button)
-                            await asyncio.sleep(2)
+                            await self.waiter.wait_for_overlay_gone()
                             logger.info(f"입찰공고문 다운로드 시작: {file_info['name']}")
                             
                 except Exception as e:
@@ -858,7 +1338,7 @@ class BidCrawlerTest:
                 "total_keywords": len(SEARCH_KEYWORDS),
                 "processed_keywords": list(self.processed_keywords),
                 "total_results": len(all_results),
-                "results": all_results,  # 실제 크롤링된 데이터
+                "results": to_dicts(all_results),  # 실제 크롤링된 데이터
                 "metadata": {
                     "version": "1.0",
                     "completion_status": "success",
@@ -877,14 +1357,24 @@ class BidCrawlerTest:
             logger.error(f"전체 결과 저장 실패: {str(e)}")
             return None
             
-    async def cleanup(self):
+    def close_records(self):
+        """수집 결과 저장소(임시 파일) 닫기 - 이후에는 결과의 detail_info/api_detail을 읽을 수 없음"""
+        self.record_store.close()
+
+    async def cleanup(self, save_results: bool = True, keep_records: bool = False):
+        """수집 결과(정제본) 저장 후 브라우저 종료 - 저장한 파일 경로 반환 (결과가 없으면 None)
+
+        save_results=False면 결과 저장 없이 브라우저만 정리한다 (결과를 직접 내보내는 배치 실행용).
+        keep_records=True면 수집 결과 저장소를 열어 두므로, 결과를 내보낸 뒤 close_records()를 호출한다.
+        """
+        self.cancel_prefetches()
+        filename = None
         try:
-            if self.all_results:
+            if save_results and self.all_results:
                 logger.info(f"전체 크롤링 결과 저장 시작 (총 {len(self.all_results)}건)")
                 
                 # 데이터 정제
-                validator = SearchValidator()
-                cleaned_results = [validator.clean_bid_data(result) for result in self.all_results]
+                cleaned_results = clean_results(self.all_results)
                 
                 # 저장 경로 및 파일명 설정
                 save_dir = "your_data_path"
@@ -911,8 +1401,15 @@ class BidCrawlerTest:
                 
         finally:
             if self.driver:
-                self.driver.quit()
+                self._quit_driver()
+                self.driver = None
                 logger.info("ChromeDriver 브라우저 종료")
+            self.watchdog.stop()
+            release_user_data_dir(self.user_data_dir)
+            self.user_data_dir = None
+            if not keep_records:
+                self.close_records()
+        return filename
 
 async def main():
     crawler = BidCrawlerTest()
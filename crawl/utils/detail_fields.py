@@ -0,0 +1,121 @@
+import logging
+import re
+from typing import Dict, List, Optional
+
+import pandas as pd
+
+from utils.constants import G2B_DETAIL_FIELD_MAP
+
+logger = logging.getLogger(__name__)
+
+AMOUNT_FIELDS = ["budget_amount", "estimated_price", "vat_amount"]
+DATETIME_FIELDS = ["bid_begin", "bid_deadline", "opening"]
+DATE_FIELDS = ["period_start", "period_end"]  # 시각 없이 자정(datetime64)으로 보관
+TEXT_FIELDS = ["contract_method", "bid_method", "period_text"]
+_EMPTY = (None, "", "-")
+_AFTER_FIRST_LINE = re.compile(r"\n.*", re.DOTALL)
+_DECIMALS = re.compile(r"\..*", re.DOTALL)
+_NON_DIGIT = re.compile(r"[^\d]")
+
+
+def detail_result(api_detail: Optional[Dict]) -> Optional[Dict]:
+    """상세 API 응답(get_bid_detail/XHR 캡처)의 result (조회 실패/빈 응답이면 None)"""
+    if not isinstance(api_detail, dict):
+        return None
+    result = api_detail.get("result")
+    if isinstance(result, list):
+        result = result[0] if result else None
+    if not isinstance(result, dict) or not result:
+        return None
+    return result
+
+
+def raw_detail_values(api_detail: Optional[Dict]) -> Optional[Dict]:
+    """상세 API 응답의 result에서 구조화 필드별 원본 값을 찾음 (result가 없으면 None)"""
+    result = detail_result(api_detail)
+    if result is None:
+        return None
+
+    values = {}
+    get = result.get
+    for name, candidates in G2B_DETAIL_FIELD_MAP.items():
+        for field in candidates:
+            value = get(field)
+            if value not in _EMPTY:
+                values[name] = value
+                break
+    return values
+
+
+def _digits(series: pd.Series) -> pd.Series:
+    """첫 줄의 숫자만 남긴 문자열 ("2025/02/10 16:14\n(...)" -> "202502101614")"""
+    return series.astype(str).str.replace(_AFTER_FIRST_LINE, "", regex=True).str.replace(_NON_DIGIT, "", regex=True)
+
+
+def _to_amount(series: pd.Series) -> pd.Series:
+    """금액 값("1,234,000원", 1234000.0 등)을 원 단위 정수(Int64)로 변환 (값이 있는 행만 변환)"""
+    amounts = pd.Series(pd.NA, index=series.index, dtype="Int64")
+    present = series.dropna()
+    if len(present):
+        text = present.astype(str).str.replace(_DECIMALS, "", regex=True).str.replace(_NON_DIGIT, "", regex=True)
+        amounts[present.index] = pd.to_numeric(text.where(text != ""), errors="coerce").astype("Int64")
+    return amounts
+
+
+def _to_datetime(series: pd.Series) -> pd.Series:
+    """일시 값을 datetime64로 변환 - 구분자를 떼고 자릿수(8/12/14)로 판단하여 한 번에 파싱 (값이 있는 행만 변환)
+
+    "2025/02/10 16:14", "2025-02-10 16:14:00", "202502101614", "20250210" 모두 허용한다.
+    """
+    stamps = pd.Series(pd.NaT, index=series.index, dtype="datetime64[s]")
+    present = series.dropna()
+    if len(present):
+        digits = _digits(present)
+        digits = digits.where(digits.str.len().isin([8, 12, 14]))
+        stamps[present.index] = pd.to_datetime(digits.str.pad(14, side="right", fillchar="0"),
+                                               format="%Y%m%d%H%M%S", errors="coerce")
+    return stamps
+
+
+def extract_detail_frame(api_details: List[Optional[Dict]]) -> pd.DataFrame:
+    """상세 API 응답 목록을 금액/일시/계약방법/기간 컬럼의 타입이 있는 DataFrame으로 변환
+
+    레코드별로는 후보 필드 조회만 하고 타입 변환은 컬럼 단위로 한 번에 한다.
+    응답에 없는 값은 결측(<NA>/NaT/None)으로 두며, 호출하는 쪽에서 본문 정규식 추출로 보완한다.
+    """
+    rows = []
+    for api_detail in api_details:
+        try:
+            rows.append(raw_detail_values(api_detail) or {})
+        except Exception as e:
+            logger.error(f"상세 API 필드 추출 중 오류: {str(e)}")
+            rows.append({})
+    raw = pd.DataFrame(rows, columns=list(G2B_DETAIL_FIELD_MAP), dtype=object)
+
+    fields = pd.DataFrame(index=raw.index)
+    for name in AMOUNT_FIELDS:
+        fields[name] = _to_amount(raw[name])
+    # 배정예산이 없으면 추정가격 + 부가세로 VAT 포함 금액 계산
+    fields["budget_amount"] = fields["budget_amount"].fillna(fields["estimated_price"] + fields["vat_amount"])
+    for name in DATETIME_FIELDS:
+        fields[name] = _to_datetime(raw[name])
+    for name in DATE_FIELDS:
+        fields[name] = _to_datetime(raw[name]).dt.normalize()
+    for name in TEXT_FIELDS:
+        present = raw[name].dropna()
+        fields[name] = present.astype(str).str.strip().reindex(raw.index)
+    present = raw["electronic_bid"].dropna()
+    fields["electronic_bid"] = (present.astype(str).str.upper() == "Y").astype(object).reindex(raw.index)
+    return fields
+
+
+def format_periods(fields: pd.DataFrame) -> pd.Series:
+    """사업기간 표시 문자열 (시작~종료일, 없으면 기간 문구, 둘 다 없으면 빈 문자열)"""
+    periods = fields["period_text"].fillna("").astype(object)
+    has_range = fields["period_start"].notna() | fields["period_end"].notna()
+    if has_range.any():
+        ranged = fields.loc[has_range, ["period_start", "period_end"]]
+        start = ranged["period_start"].dt.strftime("%Y-%m-%d").fillna("")
+        end = ranged["period_end"].dt.strftime("%Y-%m-%d").fillna("")
+        periods[has_range] = (start + " ~ " + end).str.strip()
+    return periods
@@ -0,0 +1,117 @@
+import gzip
+import json
+import logging
+import os
+import threading
+from datetime import datetime
+from typing import Dict, Iterable, Optional
+
+from utils.constants import G2B_DETAIL_FIELD_MAP, G2B_DETAIL_KEEP_FIELDS
+
+logger = logging.getLogger(__name__)
+
+
+def default_detail_fields() -> frozenset:
+    """구조화 추출(G2B_DETAIL_FIELD_MAP)에 쓰는 후보 필드와 식별 필드"""
+    fields = set(G2B_DETAIL_KEEP_FIELDS)
+    for candidates in G2B_DETAIL_FIELD_MAP.values():
+        fields.update(candidates)
+    return frozenset(fields)
+
+
+# 응답 상태 필드 - 조회 실패 응답도 실패로 구분되도록 항상 남김
+STATUS_FIELDS = ("ErrorCode", "ErrorMsg")
+# 크기 통계(json.dumps)는 이 건수마다 한 건만 계산
+STATS_SAMPLE_EVERY = 20
+
+
+class ApiDetailProjector:
+    """상세 API 응답(selectPicInfo.do)을 수집 시점에 필요한 필드만 남기도록 축소
+
+    - 남기는 구조: {"ErrorCode", "ErrorMsg", "result": {필드: 값}} (사용하지 않는 result 필드는 버림)
+    - API_DETAIL_FIELDS 환경변수: 추가로 남길 result 필드 (쉼표 구분, "*"이면 축소하지 않음)
+    - API_DETAIL_ARCHIVE_DIR 환경변수: 지정하면 축소 전 원본 응답을 날짜별 gzip JSONL로 보관
+    - 환경변수는 모듈 import 이후 load_dotenv()로 읽은 값도 반영되도록 처음 축소할 때 읽는다.
+    - 축소 전후 크기는 stats_every건마다 한 건씩 표본으로 계산한다.
+    """
+
+    def __init__(self, fields: Optional[Iterable[str]] = None, archive_dir: Optional[str] = None,
+                 stats_every: int = STATS_SAMPLE_EVERY):
+        self._fields_arg = None if fields is None else list(fields)
+        self._archive_dir_arg = archive_dir
+        self.configured = False
+        self.keep_all = False
+        self.fields = default_detail_fields()
+        self.archive_dir: Optional[str] = None
+        self.stats_every = max(1, stats_every)
+        self.stats = {"projected": 0, "sampled": 0, "raw_bytes": 0, "projected_bytes": 0, "archived": 0}
+        self._lock = threading.Lock()
+
+    def configure(self):
+        """남길 필드/보관 디렉터리 설정 (생성자 인자가 없으면 환경변수)"""
+        extra = os.getenv('API_DETAIL_FIELDS', '') if self._fields_arg is None else ','.join(self._fields_arg)
+        self.keep_all = extra.strip() == '*'
+        self.fields = default_detail_fields() | {field.strip() for field in extra.split(',') if field.strip()}
+        archive_dir = self._archive_dir_arg
+        self.archive_dir = archive_dir if archive_dir is not None else os.getenv('API_DETAIL_ARCHIVE_DIR') or None
+        self.configured = True
+
+    def _project_result(self, result):
+        if isinstance(result, dict):
+            return {key: value for key, value in result.items() if key in self.fields}
+        if isinstance(result, list):
+            return [self._project_result(item) for item in result]
+        return result
+
+    def _archive(self, bid_number: str, api_detail: Dict):
+        """원본 응답을 archive_dir/api_detail_YYYYMMDD.jsonl.gz에 한 줄씩 추가"""
+        line = json.dumps({
+            "bid_number": bid_number,
+            "fetched_at": datetime.now().strftime('%Y-%m-%d %H:%M:%S'),
+            "api_detail": api_detail
+        }, ensure_ascii=False)
+        path = os.path.join(self.archive_dir, f"api_detail_{datetime.now().strftime('%Y%m%d')}.jsonl.gz")
+        try:
+            with self._lock:
+                os.makedirs(self.archive_dir, exist_ok=True)
+                with gzip.open(path, 'at', encoding='utf-8') as f:
+                    f.write(line + "\n")
+            self.stats["archived"] += 1
+        except Exception as e:
+            logger.error(f"상세 API 원본 보관 실패 ({bid_number}): {str(e)}")
+
+    def project(self, bid_number: str, api_detail: Optional[Dict]) -> Optional[Dict]:
+        """필요한 필드만 남긴 상세 응답 반환 (조회 실패로 빈 응답이면 그대로)"""
+        if not isinstance(api_detail, dict) or not api_detail:
+            return api_detail
+        if not self.configured:
+            self.configure()
+        if self.archive_dir:
+            self._archive(bid_number, api_detail)
+        if self.keep_all:
+            return api_detail
+        projected = {key: api_detail[key] for key in STATUS_FIELDS if key in api_detail}
+        if "result" in api_detail:
+            projected["result"] = self._project_result(api_detail["result"] or {})
+        self.stats["projected"] += 1
+        if (self.stats["projected"] - 1) % self.stats_every == 0:
+            self.stats["sampled"] += 1
+            self.stats["raw_bytes"] += len(json.dumps(api_detail, ensure_ascii=False).encode('utf-8'))
+            self.stats["projected_bytes"] += len(json.dumps(projected, ensure_ascii=False).encode('utf-8'))
+        return projected
+
+    def get_stats(self) -> Dict:
+        """축소 건수와 표본 기준 크기 감소율"""
+        if not self.configured:
+            self.configure()
+        raw_bytes = self.stats["raw_bytes"]
+        return {
+            **self.stats,
+            "keep_all": self.keep_all,
+            "fields": len(self.fields),
+            "archive_dir": self.archive_dir,
+            "reduction": round(1 - self.stats["projected_bytes"] / raw_bytes, 3) if raw_bytes else 0.0
+        }
+
+
+api_detail_projector = ApiDetailProjector()
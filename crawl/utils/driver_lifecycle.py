@@ -0,0 +1,106 @@
+import logging
+import os
+import time
+from typing import Dict, List, Optional
+
+import psutil
+
+logger = logging.getLogger(__name__)
+
+# 드라이버 재시작 기준 기본값 (환경변수로 조정)
+DEFAULT_MAX_PAGES = 300       # DRIVER_MAX_PAGES: 드라이버 하나로 방문할 최대 페이지 수
+DEFAULT_MAX_RSS_MB = 1500     # DRIVER_MAX_RSS_MB: chromedriver + Chrome 프로세스 RSS 상한
+DEFAULT_JS_HEAP_MB = 512      # CHROME_JS_HEAP_MB: V8 old space 상한 (0이면 지정 안 함)
+
+
+def get_browser_rss(driver) -> int:
+    """chromedriver 및 하위 Chrome 프로세스의 RSS 합계 (bytes)"""
+    try:
+        root = psutil.Process(driver.service.process.pid)
+        processes = [root] + root.children(recursive=True)
+        total = 0
+        for process in processes:
+            try:
+                total += process.memory_info().rss
+            except psutil.NoSuchProcess:
+                continue
+        return total
+    except Exception as e:
+        logger.error(f"RSS 측정 실패: {str(e)}")
+        return 0
+
+
+class DriverLifecycle:
+    """드라이버별 방문 페이지 수와 브라우저 메모리를 추적하여 재시작 시점 판단
+
+    긴 수집에서 Chrome 메모리가 계속 늘어나므로 페이지 수나 RSS가 기준을 넘으면
+    키워드 사이에서 드라이버를 새로 띄운다 (수집 위치는 크롤러가 유지).
+    """
+
+    def __init__(self, max_pages: int = None, max_rss_mb: int = None, js_heap_mb: int = None):
+        self.max_pages = max_pages if max_pages is not None else int(os.getenv('DRIVER_MAX_PAGES', DEFAULT_MAX_PAGES))
+        self.max_rss_mb = max_rss_mb if max_rss_mb is not None else int(os.getenv('DRIVER_MAX_RSS_MB', DEFAULT_MAX_RSS_MB))
+        self.js_heap_mb = js_heap_mb if js_heap_mb is not None else int(os.getenv('CHROME_JS_HEAP_MB', DEFAULT_JS_HEAP_MB))
+        self.pages = 0          # 현재 드라이버의 방문 페이지 수
+        self.total_pages = 0
+        self.last_rss_mb = 0.0
+        self.peak_rss_mb = 0.0
+        self.started_at: Optional[float] = None
+        self.recycles: List[Dict] = []
+
+    def apply_options(self, chrome_options):
+        """JS 힙 상한을 Chrome 실행 인자로 추가"""
+        if self.js_heap_mb > 0:
+            chrome_options.add_argument(f'--js-flags=--max-old-space-size={self.js_heap_mb}')
+        return chrome_options
+
+    def on_driver_started(self):
+        """새 드라이버 시작 시 페이지 카운터 초기화"""
+        self.pages = 0
+        self.started_at = time.monotonic()
+
+    def record_pages(self, count: int = 1):
+        """페이지 로드/화면 전환 횟수 기록"""
+        self.pages += count
+        self.total_pages += count
+
+    def sample_rss(self, driver) -> float:
+        """브라우저 RSS(MB) 측정 및 최대값 갱신"""
+        rss_mb = get_browser_rss(driver) / 1024 / 1024
+        if rss_mb:
+            self.last_rss_mb = rss_mb
+            self.peak_rss_mb = max(self.peak_rss_mb, rss_mb)
+        return rss_mb
+
+    def recycle_reason(self, driver) -> Optional[str]:
+        """재시작이 필요하면 사유 반환, 아니면 None"""
+        if self.max_pages > 0 and self.pages >= self.max_pages:
+            return f"방문 페이지 {self.pages}개 (기준 {self.max_pages})"
+        if self.max_rss_mb > 0:
+            rss_mb = self.sample_rss(driver)
+            if rss_mb >= self.max_rss_mb:
+                return f"브라우저 메모리 {rss_mb:.0f}MB (기준 {self.max_rss_mb}MB)"
+        return None
+
+    def record_recycle(self, reason: str, seconds: float):
+        """재시작 이력 기록"""
+        self.recycles.append({
+            "reason": reason,
+            "pages": self.pages,
+            "rss_mb": round(self.last_rss_mb, 1),
+            "seconds": round(seconds, 3)
+        })
+
+    def get_stats(self) -> Dict:
+        """페이지 수, RSS, 재시작 횟수/이력 반환"""
+        return {
+            "max_pages": self.max_pages,
+            "max_rss_mb": self.max_rss_mb,
+            "js_heap_mb": self.js_heap_mb,
+            "pages": self.pages,
+            "total_pages": self.total_pages,
+            "last_rss_mb": round(self.last_rss_mb, 1),
+            "peak_rss_mb": round(self.peak_rss_mb, 1),
+            "recycle_count": len(self.recycles),
+            "recycles": self.recycles[-10:]
+        }
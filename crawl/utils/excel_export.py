@@ -0,0 +1,154 @@
+import asyncio
+import hashlib
+import logging
+import os
+import re
+from concurrent.futures import ProcessPoolExecutor
+from datetime import date
+from typing import Dict, Optional, Tuple
+
+from data_processor import DataProcessor, iter_result_file
+
+logger = logging.getLogger(__name__)
+
+SNAPSHOT_DIR = "your_data_path"
+DEFAULT_CACHE_DIR = os.path.join("your_data_path", "excel_cache")
+MAX_CACHED_FILES = 20
+# 분석표 형식을 바꾸면 올려서 이전 캐시 무효화
+EXPORT_FORMAT_VERSION = "1"
+# /api/download-excel/{filename}으로 받을 수 있는 결과 스냅샷 파일명
+SNAPSHOT_PATTERN = re.compile(r"^(all_crawling_results|batch_results)_[\w-]+\.(json|jsonl)$")
+
+
+def build_excel(snapshot_path: str, output_path: str) -> str:
+    """스냅샷 파일로 분석표 Excel 생성 (프로세스 풀에서 실행 - 모듈 최상위 함수여야 함)
+
+    임시 파일에 쓴 뒤 이름을 바꾸므로 다른 요청이 만들다 만 파일을 받는 일은 없다.
+    """
+    output_dir = os.path.dirname(output_path)
+    tmp_name = f"{os.path.basename(output_path)}.{os.getpid()}.tmp.xlsx"
+    processor = DataProcessor(export_path=output_dir)
+    tmp_path = processor.export_results_to_excel(iter_result_file(snapshot_path), tmp_name)
+    os.replace(tmp_path, output_path)
+    return output_path
+
+
+def _hash_file(path: str) -> str:
+    digest = hashlib.sha256(EXPORT_FORMAT_VERSION.encode())
+    with open(path, 'rb') as f:
+        for block in iter(lambda: f.read(1024 * 1024), b''):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+class ExcelExportCache:
+    """결과 스냅샷별 분석표 Excel을 이벤트 루프 밖에서 만들고 내용 해시로 캐시
+
+    - 스냅샷 내용(sha256)과 생성일이 같으면 이미 만든 파일을 그대로 반환한다.
+      (분석표의 공고검색일 컬럼이 생성일이므로 날짜가 바뀌면 다시 만든다)
+    - 같은 스냅샷에 대한 동시 요청은 한 번의 생성을 공유한다.
+    - 생성은 CPU 작업이므로 프로세스 풀에서 실행하여 크롤링/API 응답을 막지 않는다.
+    """
+
+    def __init__(self, cache_dir: str = DEFAULT_CACHE_DIR, snapshot_dir: str = SNAPSHOT_DIR,
+                 max_workers: int = None, max_files: int = MAX_CACHED_FILES):
+        self.cache_dir = cache_dir
+        self.snapshot_dir = snapshot_dir
+        self.max_workers = max_workers  # None이면 처음 생성할 때 EXCEL_EXPORT_WORKERS 환경변수로 결정
+        self.max_files = max_files
+        self.executor: Optional[ProcessPoolExecutor] = None
+        self.inflight: Dict[str, asyncio.Future] = {}
+        self.hashes: Dict[str, Tuple[float, int, str]] = {}  # 경로 -> (mtime, 크기, 해시)
+        self.stats = {"hits": 0, "builds": 0, "shared": 0, "failed": 0, "build_seconds": 0.0}
+
+    @property
+    def workers(self) -> int:
+        """프로세스 풀 크기 (모듈 import 이후 load_dotenv()로 읽은 설정도 반영되도록 처음 쓸 때 확인)"""
+        if self.max_workers is None:
+            self.max_workers = int(os.getenv('EXCEL_EXPORT_WORKERS', '2'))
+        return self.max_workers
+
+    def resolve_snapshot(self, filename: str) -> Optional[str]:
+        """요청 파일명(.json/.jsonl 또는 같은 이름의 .xlsx)을 스냅샷 경로로 변환 (없거나 허용되지 않으면 None)"""
+        name = os.path.basename(filename)
+        candidates = [name]
+        if name.endswith('.xlsx'):
+            stem = name[:-len('.xlsx')]
+            candidates = [f"{stem}.json", f"{stem}.jsonl"]
+        for candidate in candidates:
+            path = os.path.join(self.snapshot_dir, candidate)
+            if SNAPSHOT_PATTERN.match(candidate) and os.path.isfile(path):
+                return path
+        return None
+
+    async def _content_hash(self, snapshot_path: str) -> str:
+        """스냅샷 내용 해시 (파일이 바뀌지 않았으면 이전 계산값 재사용)"""
+        stat = os.stat(snapshot_path)
+        cached = self.hashes.get(snapshot_path)
+        if cached and cached[:2] == (stat.st_mtime, stat.st_size):
+            return cached[2]
+        content_hash = await asyncio.to_thread(_hash_file, snapshot_path)
+        self.hashes[snapshot_path] = (stat.st_mtime, stat.st_size, content_hash)
+        return content_hash
+
+    def _prune(self):
+        """오래된 캐시 파일 정리 (max_files개 유지)"""
+        try:
+            files = [
+                os.path.join(self.cache_dir, name) for name in os.listdir(self.cache_dir)
+                if name.endswith('.xlsx') and '.tmp.' not in name
+            ]
+            for path in sorted(files, key=os.path.getmtime)[:-self.max_files]:
+                os.remove(path)
+        except Exception as e:
+            logger.error(f"Excel 캐시 정리 실패: {str(e)}")
+
+    async def _build(self, snapshot_path: str, output_path: str) -> str:
+        if self.executor is None:
+            self.executor = ProcessPoolExecutor(max_workers=self.workers)
+        loop = asyncio.get_running_loop()
+        start_time = loop.time()
+        try:
+            await loop.run_in_executor(self.executor, build_excel, snapshot_path, output_path)
+        except Exception as e:
+            self.stats["failed"] += 1
+            logger.error(f"Excel 생성 실패 ({snapshot_path}): {str(e)}")
+            raise
+        elapsed = loop.time() - start_time
+        self.stats["builds"] += 1
+        self.stats["build_seconds"] = round(self.stats["build_seconds"] + elapsed, 3)
+        logger.info(f"Excel 생성 완료: {output_path} ({elapsed:.2f}초)")
+        self._prune()
+        return output_path
+
+    async def get_or_build(self, snapshot_path: str) -> str:
+        """스냅샷의 분석표 Excel 경로 반환 (캐시에 없으면 생성)"""
+        content_hash = await self._content_hash(snapshot_path)
+        cache_key = f"{date.today().strftime('%Y%m%d')}_{content_hash[:32]}"
+        output_path = os.path.join(self.cache_dir, f"{cache_key}.xlsx")
+        if os.path.exists(output_path):
+            self.stats["hits"] += 1
+            return output_path
+
+        future = self.inflight.get(cache_key)
+        if future is not None:
+            self.stats["shared"] += 1
+        else:
+            os.makedirs(self.cache_dir, exist_ok=True)
+            future = asyncio.ensure_future(self._build(snapshot_path, output_path))
+            self.inflight[cache_key] = future
+            future.add_done_callback(lambda _: self.inflight.pop(cache_key, None))
+        # 요청 하나가 끊겨도 다른 대기자를 위해 생성은 계속 진행
+        return await asyncio.shield(future)
+
+    def get_stats(self) -> Dict:
+        return {**self.stats, "inflight": len(self.inflight), "workers": self.workers}
+
+    def close(self):
+        """프로세스 풀 종료"""
+        if self.executor:
+            self.executor.shutdown(wait=False, cancel_futures=True)
+            self.executor = None
+
+
+excel_export_cache = ExcelExportCache()
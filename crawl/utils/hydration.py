@@ -0,0 +1,163 @@
+import asyncio
+import json
+import logging
+import os
+import re
+from collections import OrderedDict
+from datetime import datetime
+from typing import Dict, Optional
+
+from utils.crawler_core import BidCrawlerTest, NaraMarketCrawler
+from utils.detail_fields import detail_result
+from utils.detail_projection import api_detail_projector
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_CACHE_DIR = os.path.join("your_data_path", "hydration_cache")
+MEMORY_CACHE_SIZE = 1000
+
+
+class DetailHydrator:
+    """목록 전용 결과의 상세 정보(detail_info/api_detail)를 공고를 열 때 조회하고 캐시
+
+    - 메모리(LRU) → 디스크(JSON) → 조회 순서로 찾는다.
+    - 같은 공고에 대한 동시 요청은 한 번의 조회 결과를 공유한다.
+    - 상세 페이지용 브라우저는 첫 요청 시 한 번 띄워 재사용하며, 한 번에 한 페이지만 연다.
+    """
+
+    def __init__(self, cache_dir: str = DEFAULT_CACHE_DIR, memory_size: int = MEMORY_CACHE_SIZE):
+        self.cache_dir = cache_dir
+        self.memory_size = memory_size
+        self.cache: "OrderedDict[str, Dict]" = OrderedDict()
+        self.inflight: Dict[str, asyncio.Future] = {}
+        self.crawler: Optional[BidCrawlerTest] = None
+        self.api_crawler: Optional[NaraMarketCrawler] = None
+        self.browser_lock = asyncio.Lock()
+        self.stats = {"memory_hits": 0, "disk_hits": 0, "fetched": 0, "shared": 0, "failed": 0}
+
+    @staticmethod
+    def _has_api_detail(entry: Dict) -> bool:
+        """조회 실패({"ErrorCode", "ErrorMsg", "result": {}})가 아닌 실제 상세 API 결과가 있는지"""
+        return detail_result(entry.get("api_detail")) is not None
+
+    def _cache_path(self, bid_number: str) -> str:
+        return os.path.join(self.cache_dir, f"{re.sub(r'[^0-9A-Za-z_-]', '_', bid_number)}.json")
+
+    def _remember(self, bid_number: str, entry: Dict):
+        self.cache[bid_number] = entry
+        self.cache.move_to_end(bid_number)
+        while len(self.cache) > self.memory_size:
+            self.cache.popitem(last=False)
+
+    def _load_cached(self, bid_number: str) -> Optional[Dict]:
+        if bid_number in self.cache:
+            self.cache.move_to_end(bid_number)
+            self.stats["memory_hits"] += 1
+            return self.cache[bid_number]
+        path = self._cache_path(bid_number)
+        if os.path.exists(path):
+            try:
+                with open(path, 'r', encoding='utf-8') as f:
+                    entry = json.load(f)
+                self._remember(bid_number, entry)
+                self.stats["disk_hits"] += 1
+                return entry
+            except Exception as e:
+                logger.error(f"상세 캐시 읽기 실패 ({bid_number}): {str(e)}")
+        return None
+
+    def _store(self, bid_number: str, entry: Dict):
+        self._remember(bid_number, entry)
+        try:
+            os.makedirs(self.cache_dir, exist_ok=True)
+            with open(self._cache_path(bid_number), 'w', encoding='utf-8') as f:
+                json.dump(entry, f, ensure_ascii=False)
+        except Exception as e:
+            logger.error(f"상세 캐시 저장 실패 ({bid_number}): {str(e)}")
+
+    async def _fetch_api_detail(self, bid_number: str) -> Optional[Dict]:
+        if self.api_crawler is None:
+            api_crawler = NaraMarketCrawler()
+            if not await api_crawler.initialize_session():
+                return None
+            self.api_crawler = api_crawler
+        api_detail = api_detail_projector.project(bid_number, await self.api_crawler.get_bid_detail(bid_number))
+        if detail_result(api_detail) is None:
+            logger.warning(f"상세 API 결과 없음 ({bid_number}): {api_detail.get('ErrorMsg', '')}")
+            return None
+        return api_detail
+
+    async def _fetch_detail_page(self, bid_number: str) -> Optional[Dict]:
+        async with self.browser_lock:
+            if self.crawler is None:
+                self.crawler = BidCrawlerTest(detail_tabs=0)
+            if self.crawler.driver is None:
+                self.crawler.setup_driver()
+            else:
+                await self.crawler.ensure_driver_alive()
+            return await self.crawler.open_detail_page(bid_number)
+
+    async def _fetch(self, bid_number: str, detail_page: bool, cached: Optional[Dict]) -> Dict:
+        entry = dict(cached or {"bid_number": bid_number})
+        tasks = {}
+        if not self._has_api_detail(entry):
+            entry.pop("api_detail", None)
+            tasks["api_detail"] = asyncio.create_task(self._fetch_api_detail(bid_number))
+        if detail_page and not entry.get("detail_info"):
+            tasks["detail_info"] = asyncio.create_task(self._fetch_detail_page(bid_number))
+        # API 조회와 상세 페이지 로딩을 동시에 진행
+        for name, task in tasks.items():
+            try:
+                value = await task
+            except Exception as e:
+                logger.error(f"상세 정보 조회 실패 ({bid_number}, {name}): {str(e)}")
+                value = None
+            if value:
+                entry[name] = value
+        entry["hydrated_at"] = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+        if self._has_api_detail(entry) or entry.get("detail_info"):
+            self._store(bid_number, entry)
+            self.stats["fetched"] += 1
+        else:
+            self.stats["failed"] += 1
+        return entry
+
+    async def hydrate(self, bid_number: str, detail_page: bool = True) -> Dict:
+        """공고번호의 상세 정보 반환 ({"bid_number", "api_detail", "detail_info", "hydrated_at"})"""
+        cached = self._load_cached(bid_number)
+        if cached and self._has_api_detail(cached) and (not detail_page or cached.get("detail_info")):
+            return {**cached, "cached": True}
+
+        key = f"{bid_number}:{int(detail_page)}"
+        future = self.inflight.get(key)
+        if future is not None:
+            self.stats["shared"] += 1
+        else:
+            future = asyncio.ensure_future(self._fetch(bid_number, detail_page, cached))
+            self.inflight[key] = future
+            future.add_done_callback(lambda _: self.inflight.pop(key, None))
+        # 요청 하나가 끊겨도 다른 대기자를 위해 조회는 계속 진행
+        return {**await asyncio.shield(future), "cached": False}
+
+    @staticmethod
+    def apply(record: Dict, entry: Dict) -> Dict:
+        """수집 결과에 hydration 결과를 합쳐 hydrated=True로 표시"""
+        if entry.get("detail_info"):
+            record["detail_info"] = entry["detail_info"]
+        has_api_detail = DetailHydrator._has_api_detail(entry)
+        if has_api_detail:
+            record["api_detail"] = entry["api_detail"]
+        record["hydrated"] = bool(entry.get("detail_info") or has_api_detail)
+        return record
+
+    def get_stats(self) -> Dict:
+        return {**self.stats, "memory_entries": len(self.cache), "inflight": len(self.inflight)}
+
+    async def close(self):
+        """상세 페이지용 브라우저 종료"""
+        if self.crawler:
+            await self.crawler.cleanup(save_results=False)
+            self.crawler = None
+
+
+detail_hydrator = DetailHydrator()
@@ -0,0 +1,138 @@
+import logging
+import re
+from functools import lru_cache
+from typing import Dict, Iterable, List, Tuple
+
+from utils.keyword_normalizer import fold_text, keyword_forms, normalize_keyword, spelling_forms
+
+logger = logging.getLogger(__name__)
+
+# 한글 글자 사이에 허용하는 공백 ("학습관리시스템"이 "학습관리 시스템"에도 매칭)
+# 영문은 띄어쓰기가 단어 경계이므로 허용하지 않음 ("ar"이 "data room"에 매칭되지 않도록)
+_GAP = r"\s*"
+_WHITESPACE = re.compile(r"\s")
+# 영문/숫자로만 된 매칭 문자열(VR, AR, LMS 등 약어)은 앞뒤에 영문자가 없을 때만 매칭
+# ("ar"이 "cartridge", "arcgis"에 매칭되지 않도록, "vr360"처럼 숫자가 붙는 경우는 허용)
+_ASCII_WORD = re.compile(r"[a-z0-9]+")
+_ASCII_LETTER = re.compile(r"[A-Za-z]")
+
+
+def _is_hangul(char: str) -> bool:
+    """한글 음절/자모 여부 (fold_text의 NFKC로 호환 자모는 자모로 바뀜)"""
+    return '\uac00' <= char <= '\ud7a3' or '\u1100' <= char <= '\u11ff' or '\u3130' <= char <= '\u318f'
+
+
+def _is_word_bounded(text: str, start: int, end: int) -> bool:
+    """text[start:end]의 앞뒤가 영문자가 아닌지"""
+    return ((start == 0 or not _ASCII_LETTER.match(text[start - 1]))
+            and (end >= len(text) or not _ASCII_LETTER.match(text[end])))
+
+
+def keyword_patterns(keyword: str) -> List[str]:
+    """검색어 하나가 매칭되는 정규화 문자열 (검색어 전체/동의어/표기 변형과 공백으로 나눈 각 단어)"""
+    patterns = keyword_forms(keyword)
+    tokens = keyword.split()
+    if len(tokens) > 1:
+        for token in tokens:
+            patterns.extend(spelling_forms(normalize_keyword(token)))
+    return list(dict.fromkeys(pattern for pattern in patterns if pattern))
+
+
+def _trie_regex(patterns: Iterable[str]) -> str:
+    """문자열 목록을 접두어 트리 모양의 정규식으로 변환 ("콘텐츠", "콘텐츠개발" -> "콘\\s*텐\\s*츠(?:\\s*개\\s*발)?")
+
+    공백은 한글 글자 사이에만 허용한다.
+    """
+    trie: Dict = {}
+    for pattern in patterns:
+        node = trie
+        for char in pattern:
+            node = node.setdefault(char, {})
+        node[''] = True
+
+    def build(node: Dict, previous: str) -> str:
+        branches = [
+            (_GAP if previous and _is_hangul(previous) and _is_hangul(char) else '') + re.escape(char) + build(child, char)
+            for char, child in sorted(node.items()) if char
+        ]
+        if not branches:
+            return ''
+        body = branches[0] if len(branches) == 1 else f"(?:{'|'.join(branches)})"
+        return f"(?:{body})?" if '' in node else body
+
+    return build(trie, '')
+
+
+def _span_end(matched: str, start: int, length: int) -> int:
+    """공백을 뺀 length 글자가 끝나는 본문 위치"""
+    count = 0
+    for index, char in enumerate(matched):
+        if not _WHITESPACE.match(char):
+            count += 1
+            if count == length:
+                return start + index + 1
+    return start + len(matched)
+
+
+class KeywordMatcher:
+    """활성 검색어 전체를 한 번에 찾는 매처
+
+    검색어와 그 단어들을 접두어 트리로 묶은 정규식 하나로 컴파일하여, 본문을 한 번 훑으면서
+    위치마다 트리를 따라가 가장 긴 일치를 찾고, 같은 위치에서 시작하는 더 짧은 일치는
+    미리 계산한 접두어 목록으로 채운다. 본문 길이에 비례하고 검색어 수와는 거의 무관하다.
+    띄어쓰기/대소문자/전각 차이와 동의어, 표기 변형은 utils.keyword_normalizer 기준으로 함께 매칭한다.
+    영문 약어(VR, AR, LMS 등)는 단어 단위로만 매칭한다.
+    (순수 파이썬 Aho-Corasick 자동자는 글자마다 인터프리터 루프를 돌아 이 방식보다 느리다.)
+    """
+
+    def __init__(self, keywords: Iterable[str]):
+        self.keywords: Tuple[str, ...] = tuple(dict.fromkeys(keywords))
+        # 매칭 문자열 -> 해당 문자열로 매칭되는 검색어들
+        self.owners: Dict[str, List[str]] = {}
+        for keyword in self.keywords:
+            for pattern in keyword_patterns(keyword):
+                owners = self.owners.setdefault(pattern, [])
+                if keyword not in owners:
+                    owners.append(keyword)
+        patterns = sorted(self.owners)
+        # 단어 경계를 확인할 영문/숫자 매칭 문자열
+        self.ascii_words = frozenset(pattern for pattern in patterns if _ASCII_WORD.fullmatch(pattern))
+        # 가장 긴 일치 -> 같은 위치에서 시작하는 모든 매칭 문자열 (자기 자신 포함)
+        self.prefixes = {pattern: [other for other in patterns if pattern.startswith(other)] for pattern in patterns}
+        self.regex = re.compile(f"(?=({_trie_regex(patterns)}))") if patterns else None
+
+    def __contains__(self, keyword: str) -> bool:
+        return keyword in self.keywords
+
+    def find(self, text: str) -> List[Tuple[int, int, str]]:
+        """fold_text(text)에서 겹치는 것을 포함한 모든 (시작, 끝, 매칭 문자열)"""
+        if not text or self.regex is None:
+            return []
+        hits = []
+        folded = fold_text(text)
+        for match in self.regex.finditer(folded):
+            start = match.start(1)
+            matched = match.group(1)
+            spaced = _WHITESPACE.search(matched) is not None
+            for pattern in self.prefixes[_WHITESPACE.sub('', matched) if spaced else matched]:
+                end = _span_end(matched, start, len(pattern)) if spaced else start + len(pattern)
+                if pattern in self.ascii_words and not _is_word_bounded(folded, start, end):
+                    continue
+                hits.append((start, end, pattern))
+        return hits
+
+    def match(self, text: str) -> Dict[str, List[Tuple[int, int]]]:
+        """text에 나타난 검색어 -> 일치 위치 목록 (검색어 전체 또는 그 단어 중 하나가 나타난 위치)"""
+        matched: Dict[str, List[Tuple[int, int]]] = {}
+        for start, end, pattern in self.find(text):
+            for keyword in self.owners[pattern]:
+                matched.setdefault(keyword, []).append((start, end))
+        return matched
+
+
+@lru_cache(maxsize=32)
+def get_keyword_matcher(keywords: Tuple[str, ...]) -> KeywordMatcher:
+    """검색어 조합별로 한 번만 컴파일한 매처"""
+    matcher = KeywordMatcher(keywords)
+    logger.debug(f"검색어 매처 컴파일: 검색어 {len(matcher.keywords)}개, 매칭 문자열 {len(matcher.owners)}개")
+    return matcher
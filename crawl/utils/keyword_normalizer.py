@@ -0,0 +1,115 @@
+import logging
+import os
+import re
+import unicodedata
+from typing import Dict, Iterable, List, Optional
+
+from utils.constants import KEYWORD_SPELLING_VARIANTS, KEYWORD_SYNONYM_GROUPS
+
+logger = logging.getLogger(__name__)
+
+_WHITESPACE = re.compile(r"\s+")
+_VARIANTS = re.compile("|".join(sorted(map(re.escape, KEYWORD_SPELLING_VARIANTS), key=len, reverse=True)))
+# 표준 표기 -> 표준 표기를 포함한 변형 표기들 (매칭 시 본문의 변형 표기도 찾기 위함)
+_ALTERNATE_SPELLINGS: Dict[str, List[str]] = {}
+for _variant, _standard in KEYWORD_SPELLING_VARIANTS.items():
+    _ALTERNATE_SPELLINGS.setdefault(_standard, []).append(_variant)
+
+
+def fold_text(text: str) -> str:
+    """NFKC(전각 영숫자/호환 자모 -> 표준 문자) 후 소문자 변환 - 본문 매칭 전에 적용"""
+    return unicodedata.normalize('NFKC', text or '').lower()
+
+
+def normalize_keyword(keyword: str) -> str:
+    """검색어 정규화: fold_text + 공백 제거 + 표기 변형 통일 ("교육 컨텐츠" -> "교육콘텐츠", "ＶＲ" -> "vr")"""
+    normalized = _WHITESPACE.sub('', fold_text(keyword))
+    if KEYWORD_SPELLING_VARIANTS:
+        normalized = _VARIANTS.sub(lambda match: KEYWORD_SPELLING_VARIANTS[match.group(0)], normalized)
+    return normalized
+
+
+# 정규화한 동의어 -> 묶음의 대표어(정규화), 대표어 -> 묶음 전체
+_SYNONYM_CANONICAL: Dict[str, str] = {}
+_SYNONYM_MEMBERS: Dict[str, List[str]] = {}
+for _group in KEYWORD_SYNONYM_GROUPS:
+    _members = list(dict.fromkeys(normalize_keyword(term) for term in _group))
+    for _member in _members:
+        _SYNONYM_CANONICAL[_member] = _members[0]
+    _SYNONYM_MEMBERS[_members[0]] = _members
+
+
+def canonical_keyword(keyword: str, synonyms: bool = True) -> str:
+    """같은 검색어로 취급할 대표형 (synonyms=False면 띄어쓰기/대소문자/표기 변형까지만 통일)"""
+    normalized = normalize_keyword(keyword)
+    return _SYNONYM_CANONICAL.get(normalized, normalized) if synonyms else normalized
+
+
+def spelling_forms(normalized: str) -> List[str]:
+    """정규화한 문자열과, 표준 표기를 변형 표기로 바꾼 문자열들 ("교육콘텐츠" -> ["교육콘텐츠", "교육컨텐츠"])"""
+    forms = [normalized]
+    for standard, variants in _ALTERNATE_SPELLINGS.items():
+        if standard in normalized:
+            forms.extend(normalized.replace(standard, variant) for variant in variants)
+    return forms
+
+
+def keyword_forms(keyword: str) -> List[str]:
+    """검색어가 본문에서 매칭될 정규화 문자열들 (동의어, 표기 변형 포함)"""
+    normalized = normalize_keyword(keyword)
+    members = _SYNONYM_MEMBERS.get(_SYNONYM_CANONICAL.get(normalized, normalized), [normalized])
+    forms = []
+    for member in dict.fromkeys([normalized] + members):
+        forms.extend(spelling_forms(member))
+    return list(dict.fromkeys(form for form in forms if form))
+
+
+class KeywordPlan:
+    """검색어 목록을 대표형별로 묶어 검색(크롤링) 횟수를 줄인 계획
+
+    G2B 검색은 글자 그대로 일치하는 공고만 돌려주므로 기본으로는 대소문자/전각/앞뒤 공백만 다른
+    검색어("VR"/"ＶＲ")만 합치고, 띄어쓰기/표기 변형("교육 컨텐츠")과 동의어(VR/가상현실)는 따로 검색한다.
+    collapse_synonyms(KEYWORD_COLLAPSE_SYNONYMS=1)일 때만 띄어쓰기/표기 변형과 동의어 묶음까지 합친다.
+    묶음마다 처음 나온 검색어로 검색한다.
+    """
+
+    def __init__(self, keywords: Iterable[str], collapse_synonyms: Optional[bool] = None):
+        if collapse_synonyms is None:
+            collapse_synonyms = os.getenv('KEYWORD_COLLAPSE_SYNONYMS', '0') == '1'
+        self.collapse_synonyms = collapse_synonyms
+        self.keywords = list(dict.fromkeys(keywords))
+        self.groups: Dict[str, List[str]] = {}  # 검색할 검색어 -> 그 검색으로 처리되는 검색어들
+        searches: Dict[str, str] = {}  # 대표형 -> 검색할 검색어
+        for keyword in self.keywords:
+            if collapse_synonyms:
+                canonical = canonical_keyword(keyword) or keyword
+            else:
+                canonical = fold_text(keyword).strip() or keyword
+            search = searches.setdefault(canonical, keyword)
+            self.groups.setdefault(search, []).append(keyword)
+        self.searches = list(self.groups)
+
+    def covered(self, searched: Iterable[str]) -> List[str]:
+        """검색을 마친 검색어들로 처리된 원래 검색어 목록"""
+        return [keyword for search in searched for keyword in self.groups.get(search, [])]
+
+    def get_stats(self) -> Dict:
+        saved = len(self.keywords) - len(self.searches)
+        return {
+            "requested": len(self.keywords),
+            "crawls": len(self.searches),
+            "saved": saved,
+            "reduction": round(saved / len(self.keywords), 3) if self.keywords else 0.0,
+            "collapse_synonyms": self.collapse_synonyms,
+            "merged": {search: keywords for search, keywords in self.groups.items() if len(keywords) > 1}
+        }
+
+
+def plan_keyword_crawls(keywords: Iterable[str], collapse_synonyms: Optional[bool] = None) -> KeywordPlan:
+    """검색어 목록의 크롤링 계획을 만들고 줄어든 검색 횟수를 로깅"""
+    plan = KeywordPlan(keywords, collapse_synonyms)
+    stats = plan.get_stats()
+    if stats["saved"]:
+        logger.info(f"검색어 통합: {stats['requested']}개 -> 검색 {stats['crawls']}회 "
+                    f"({stats['saved']}회 절약, 통합: {stats['merged']})")
+    return plan
@@ -0,0 +1,197 @@
+import heapq
+import logging
+import time
+from enum import Enum
+from typing import Dict, List, Optional, Tuple
+
+from selenium.webdriver.common.by import By
+from selenium.common.exceptions import WebDriverException
+
+from utils.page_waits import DETAIL_SECTION_XPATH, NO_RESULT_XPATH, FIRST_ROW_CELL_ID
+
+logger = logging.getLogger(__name__)
+
+# 메인 페이지 상단 메뉴 (입찰)
+HOME_MENU_ID = "mf_wfm_gnb_wfm_gnbMenu_genDepth1_1_btn_menuLvl1_span"
+# 상세 페이지 진입 시 뜨는 WebSquare 팝업의 닫기 버튼
+POPUP_CLOSE_XPATH = "//div[contains(@id, '_close') and contains(@class, 'w2window_close')]"
+
+MAX_RECOVERY_STEPS = 4
+
+
+class PageState(str, Enum):
+    HOME = "home"
+    LIST = "list"
+    LIST_RESULTS = "list_results"
+    DETAIL = "detail"
+    POPUP = "popup"
+    UNKNOWN = "unknown"
+
+
+# (출발 상태, 도착 상태, 동작, 초기 예상 비용(초)) - 비용은 실제 소요 시간으로 갱신됨
+TRANSITIONS: List[Tuple[PageState, PageState, str, float]] = [
+    (PageState.POPUP, PageState.DETAIL, "close_popup", 0.3),
+    (PageState.DETAIL, PageState.LIST_RESULTS, "back", 1.5),
+    (PageState.LIST, PageState.LIST_RESULTS, "search", 2.0),
+    (PageState.HOME, PageState.LIST, "menu", 4.0),
+    (PageState.HOME, PageState.LIST, "deep_link", 3.0),
+    (PageState.DETAIL, PageState.LIST, "deep_link", 3.0),
+    (PageState.POPUP, PageState.LIST, "deep_link", 3.0),
+    (PageState.UNKNOWN, PageState.LIST, "deep_link", 3.0),
+    (PageState.UNKNOWN, PageState.HOME, "home", 3.0),
+    (PageState.DETAIL, PageState.HOME, "home", 3.0),
+]
+
+
+class PageStateMachine:
+    """브라우저 화면 상태 판별과 목표 상태까지의 최소 비용 복구"""
+
+    def __init__(self, crawler):
+        self.crawler = crawler
+        self.costs: Dict[Tuple[PageState, str], float] = {
+            (source, action): cost for source, _, action, cost in TRANSITIONS
+        }
+        self.transition_stats: Dict[str, Dict] = {}
+        self.recovery_stats = {"count": 0, "succeeded": 0, "failed": 0, "total_seconds": 0.0}
+
+    @property
+    def driver(self):
+        return self.crawler.driver
+
+    def _displayed(self, by: str, value: str) -> bool:
+        elements = self.driver.find_elements(by, value)
+        return bool(elements) and elements[0].is_displayed()
+
+    def detect(self) -> PageState:
+        """대기 없이 현재 화면 상태 판별"""
+        try:
+            if self._displayed(By.XPATH, POPUP_CLOSE_XPATH):
+                return PageState.POPUP
+            if self._displayed(By.XPATH, DETAIL_SECTION_XPATH):
+                return PageState.DETAIL
+            if self.crawler.waiter.is_list_screen():
+                if self._displayed(By.XPATH, NO_RESULT_XPATH) or self._displayed(By.ID, FIRST_ROW_CELL_ID):
+                    return PageState.LIST_RESULTS
+                return PageState.LIST
+            if self._displayed(By.ID, HOME_MENU_ID):
+                return PageState.HOME
+        except WebDriverException as e:
+            logger.debug(f"화면 상태 판별 실패: {str(e)}")
+        return PageState.UNKNOWN
+
+    @staticmethod
+    def _satisfies(state: PageState, target: PageState) -> bool:
+        # 결과가 표시된 목록 화면도 검색 가능한 목록 화면이다
+        return state == target or (target == PageState.LIST and state == PageState.LIST_RESULTS)
+
+    def plan(self, source: PageState, target: PageState, excluded=()) -> Optional[List[Tuple[PageState, str]]]:
+        """다익스트라로 최소 비용 경로 계산 - [(다음 상태, 동작), ...]"""
+        queue = [(0.0, 0, source, [])]
+        visited = set()
+        counter = 1
+        while queue:
+            cost, _, state, path = heapq.heappop(queue)
+            if self._satisfies(state, target):
+                return path
+            if state in visited:
+                continue
+            visited.add(state)
+            for edge_source, edge_target, action, _ in TRANSITIONS:
+                if edge_source != state or (edge_source, action) in excluded:
+                    continue
+                heapq.heappush(queue, (
+                    cost + self.costs[(edge_source, action)],
+                    counter,
+                    edge_target,
+                    path + [(edge_target, action)]
+                ))
+                counter += 1
+        return None
+
+    async def _run_action(self, action: str, keyword: Optional[str]) -> bool:
+        crawler = self.crawler
+        if action == "close_popup":
+            await crawler._close_popups()
+            return await crawler.waiter.wait_for_overlay_gone()
+        if action == "back":
+            self.driver.back()
+            return await crawler.waiter.wait_for_grid()
+        if action == "search":
+            if not keyword:
+                return False
+            await crawler.submit_search(keyword)
+            return True
+        if action == "deep_link":
+            return await crawler._open_bid_list_direct()
+        if action == "menu":
+            await crawler._navigate_via_menu()
+            return True
+        if action == "home":
+            self.driver.get(crawler.base_url)
+            return True
+        return False
+
+    def _record_transition(self, source: PageState, action: str, elapsed: float, success: bool):
+        name = f"{source.value}:{action}"
+        stat = self.transition_stats.setdefault(name, {"count": 0, "failures": 0, "total_seconds": 0.0})
+        stat["count"] += 1
+        stat["total_seconds"] += elapsed
+        if success:
+            # 관측된 소요 시간으로 예상 비용 갱신 (지수 이동 평균)
+            key = (source, action)
+            self.costs[key] = 0.7 * self.costs[key] + 0.3 * elapsed
+        else:
+            stat["failures"] += 1
+
+    async def recover(self, target: PageState, keyword: Optional[str] = None) -> bool:
+        """현재 상태에서 목표 상태까지 최소 비용 경로로 이동 - 성공 여부 반환"""
+        start_time = time.monotonic()
+        self.recovery_stats["count"] += 1
+        excluded = set()
+        success = False
+
+        for _ in range(MAX_RECOVERY_STEPS):
+            state = self.detect()
+            if self._satisfies(state, target):
+                success = True
+                break
+
+            path = self.plan(state, target, excluded)
+            if not path:
+                logger.error(f"복구 경로 없음: {state.value} -> {target.value}")
+                break
+
+            next_state, action = path[0]
+            logger.info(f"화면 복구: {state.value} -[{action}]-> {next_state.value} (목표: {target.value})")
+            step_start = time.monotonic()
+            try:
+                step_ok = await self._run_action(action, keyword)
+            except Exception as e:
+                logger.error(f"복구 동작 실패 ({action}): {str(e)}")
+                step_ok = False
+            self._record_transition(state, action, time.monotonic() - step_start, step_ok)
+            if not step_ok:
+                excluded.add((state, action))
+
+        if not success:
+            success = self._satisfies(self.detect(), target)
+
+        elapsed = time.monotonic() - start_time
+        self.recovery_stats["total_seconds"] += elapsed
+        self.recovery_stats["succeeded" if success else "failed"] += 1
+        logger.info(f"화면 복구 {'성공' if success else '실패'} ({target.value}, {elapsed:.2f}초)")
+        return success
+
+    def get_stats(self) -> Dict:
+        """복구 횟수와 전이별 횟수/실패/평균 소요 시간 반환"""
+        return {
+            "recoveries": {**self.recovery_stats, "total_seconds": round(self.recovery_stats["total_seconds"], 3)},
+            "transitions": {
+                name: {
+                    **stat,
+                    "total_seconds": round(stat["total_seconds"], 3),
+                    "avg_seconds": round(stat["total_seconds"] / stat["count"], 3) if stat["count"] else 0.0
+                }
+                for name, stat in self.transition_stats.items()
+            }
+        }
@@ -0,0 +1,175 @@
+import asyncio
+import logging
+import time
+from typing import Dict, Optional
+
+from selenium.webdriver.common.by import By
+from selenium.webdriver.support.ui import WebDriverWait
+from selenium.webdriver.support import expected_conditions as EC
+from selenium.common.exceptions import (
+    TimeoutException,
+    NoSuchElementException,
+    StaleElementReferenceException
+)
+
+from utils.cancellation import CancellationToken
+
+logger = logging.getLogger(__name__)
+
+# 입찰공고목록 화면 요소
+GRID_PREFIX = "mf_wfm_container_tacBidPbancLst_contents_tab2_body_gridView1"
+GRID_DATA_LAYER_ID = f"{GRID_PREFIX}_dataLayer"
+FIRST_ROW_CELL_ID = f"{GRID_PREFIX}_cell_0_5"  # 첫 행의 입찰공고번호 셀
+SEARCH_INPUT_XPATH = "/html/body/div[1]/div[3]/div/div[2]/div/div[2]/div[2]/div/div/div[2]/div/div[1]/div[1]/div[1]/div[1]/table/tbody/tr[1]/td[3]/input"
+NO_RESULT_XPATH = "//td[contains(text(), '검색된 데이터가 없습니다')]"
+
+# 상세 화면 요소 (공고일반 섹션)
+DETAIL_SECTION_XPATH = "/html/body/div[1]/div[3]/div/div[2]/div/div[2]/div[4]/div[1]/div[3]"
+
+# WebSquare 로딩 표시(processbar)가 화면에 보이는지 확인하는 스크립트
+LOADING_OVERLAY_SCRIPT = """
+return Array.from(document.querySelectorAll("[id^='___processbar'], .w2processbar")).some(
+    el => el.offsetParent !== null && getComputedStyle(el).visibility !== 'hidden'
+);
+"""
+
+DEFAULT_TIMEOUT = 10
+POLL_FREQUENCY = 0.1
+
+
+class PageWaiter:
+    """고정 sleep 대신 화면 준비 신호를 기다리고 실제 대기 시간을 기록
+
+    대기는 스레드에서 실행하여 이벤트 루프(중지 요청, API 상세 조회)를 막지 않고,
+    cancel_token이 취소되면 다음 폴링 시점에 CrawlCancelled로 빠져나온다.
+    """
+
+    def __init__(self, driver, timeout: float = DEFAULT_TIMEOUT):
+        self.driver = driver
+        self.timeout = timeout
+        self.cancel_token = CancellationToken()
+        self.stats: Dict[str, Dict] = {}
+
+    def _record(self, name: str, elapsed: float, success: bool):
+        stat = self.stats.setdefault(name, {"count": 0, "timeouts": 0, "total_seconds": 0.0, "max_seconds": 0.0})
+        stat["count"] += 1
+        stat["total_seconds"] += elapsed
+        stat["max_seconds"] = max(stat["max_seconds"], elapsed)
+        if not success:
+            stat["timeouts"] += 1
+
+    def _wait(self, name: str, condition, timeout: Optional[float] = None, warn: bool = True) -> bool:
+        """조건이 참이 될 때까지 대기 - 성공 여부 반환, 소요 시간은 stats에 기록"""
+        self.cancel_token.raise_if_cancelled()
+
+        def cancellable(d):
+            self.cancel_token.raise_if_cancelled()
+            return condition(d)
+
+        start_time = time.monotonic()
+        try:
+            WebDriverWait(
+                self.driver,
+                timeout or self.timeout,
+                poll_frequency=POLL_FREQUENCY,
+                ignored_exceptions=(NoSuchElementException, StaleElementReferenceException)
+            ).until(cancellable)
+            success = True
+        except TimeoutException:
+            if warn:
+                logger.warning(f"대기 시간 초과: {name} ({timeout or self.timeout}초)")
+            success = False
+        elapsed = time.monotonic() - start_time
+        self._record(name, elapsed, success)
+        logger.debug(f"대기 완료: {name} - {elapsed:.2f}초")
+        return success
+
+    async def _wait_async(self, name: str, condition, timeout: Optional[float] = None, warn: bool = True) -> bool:
+        """_wait를 스레드에서 실행 (대기 중에도 이벤트 루프가 다른 작업을 처리)"""
+        return await asyncio.to_thread(self._wait, name, condition, timeout, warn)
+
+    def _overlay_gone(self, driver) -> bool:
+        return not driver.execute_script(LOADING_OVERLAY_SCRIPT)
+
+    def _first_row_text(self) -> Optional[str]:
+        try:
+            return self.driver.find_element(By.ID, FIRST_ROW_CELL_ID).text.strip()
+        except (NoSuchElementException, StaleElementReferenceException):
+            return None
+
+    def _grid_populated(self, driver) -> bool:
+        if driver.find_elements(By.XPATH, NO_RESULT_XPATH):
+            return True
+        cell = driver.find_element(By.ID, FIRST_ROW_CELL_ID)
+        return bool(cell.text.strip())
+
+    def is_list_screen(self) -> bool:
+        """대기 없이 현재 화면이 입찰공고목록(검색창 표시)인지 확인"""
+        try:
+            inputs = self.driver.find_elements(By.XPATH, SEARCH_INPUT_XPATH)
+            return bool(inputs) and inputs[0].is_displayed() and self._overlay_gone(self.driver)
+        except StaleElementReferenceException:
+            return False
+
+    async def wait_for_overlay_gone(self, timeout: Optional[float] = None) -> bool:
+        """WebSquare 로딩 표시가 사라질 때까지 대기"""
+        return await self._wait_async("overlay_gone", self._overlay_gone, timeout)
+
+    async def wait_for_list_screen(self, timeout: Optional[float] = None) -> bool:
+        """입찰공고목록 화면(검색창)이 준비될 때까지 대기"""
+        return await self._wait_async(
+            "list_screen",
+            lambda d: EC.presence_of_element_located((By.XPATH, SEARCH_INPUT_XPATH))(d) and self._overlay_gone(d),
+            timeout
+        )
+
+    async def wait_for_grid(self, timeout: Optional[float] = None) -> bool:
+        """목록 그리드의 데이터 레이어가 채워질 때까지 대기 (검색 결과 없음 포함)"""
+        return await self._wait_async(
+            "grid_data",
+            lambda d: d.find_element(By.ID, GRID_DATA_LAYER_ID).is_displayed()
+            and self._overlay_gone(d)
+            and self._grid_populated(d),
+            timeout
+        )
+
+    def snapshot_grid(self) -> Optional[str]:
+        """검색 전 그리드 첫 행 값 - wait_for_search_results에서 변경 여부 판단에 사용"""
+        return self._first_row_text()
+
+    async def wait_for_search_results(self, previous_first_row: Optional[str],
+                                change_timeout: float = 3.0, timeout: Optional[float] = None) -> bool:
+        """검색 제출 후 그리드가 새 결과로 갱신될 때까지 대기
+
+        검색 결과의 첫 행이 이전과 같을 수도 있으므로, change_timeout 동안 변화가
+        없으면 로딩 표시가 사라지고 그리드가 채워진 상태를 준비 완료로 본다.
+        """
+        def results_changed(d):
+            if d.find_elements(By.XPATH, NO_RESULT_XPATH):
+                return True
+            current = self._first_row_text()
+            return bool(current) and current != previous_first_row and self._overlay_gone(d)
+
+        if previous_first_row and await self._wait_async("search_results", results_changed, change_timeout, warn=False):
+            return True
+        return await self.wait_for_grid(timeout)
+
+    async def wait_for_detail_page(self, timeout: Optional[float] = None) -> bool:
+        """상세 화면의 공고일반 섹션이 표시될 때까지 대기"""
+        return await self._wait_async(
+            "detail_page",
+            lambda d: d.find_element(By.XPATH, DETAIL_SECTION_XPATH).is_displayed() and self._overlay_gone(d),
+            timeout
+        )
+
+    def get_stats(self) -> Dict:
+        """대기 종류별 횟수, 시간 초과 횟수, 평균/최대 대기 시간 반환"""
+        return {
+            name: {
+                **stat,
+                "total_seconds": round(stat["total_seconds"], 3),
+                "max_seconds": round(stat["max_seconds"], 3),
+                "avg_seconds": round(stat["total_seconds"] / stat["count"], 3) if stat["count"] else 0.0
+            }
+            for name, stat in self.stats.items()
+        }
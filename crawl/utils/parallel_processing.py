@@ -0,0 +1,121 @@
+import logging
+import os
+import tempfile
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from itertools import islice
+from typing import Callable, Dict, Iterable, Iterator, List, Optional
+
+import pandas as pd
+
+from utils.bid_record import to_dicts
+
+logger = logging.getLogger(__name__)
+
+# 청크 크기 기본 범위 - 작으면 프로세스 간 전달 비용이, 크면 마지막 청크 대기(꼬리 지연)가 커짐
+MIN_CHUNK_SIZE = 500
+MAX_CHUNK_SIZE = 10000
+CHUNKS_PER_WORKER = 4
+# 이보다 적은 결과는 프로세스 풀을 띄우는 비용이 더 크므로 현재 프로세스에서 처리
+PARALLEL_MIN_RECORDS = 5000
+
+_worker_processor = None
+
+
+def resolve_workers(workers: Optional[int] = None) -> int:
+    """작업 프로세스 수 (미지정 시 POSTPROCESS_WORKERS 환경변수, 0이면 CPU 코어 수)
+
+    기본값은 1(병렬 처리 안 함)이다. 프로세스 풀은 시작/전달 비용이 있어 코어 수와 결과 건수에 따라
+    오히려 느릴 수 있으므로, bench_data_processor.py --workers로 측정한 뒤 켠다.
+    """
+    if workers is None:
+        workers = int(os.getenv('POSTPROCESS_WORKERS', '1'))
+    if workers <= 0:
+        workers = os.cpu_count() or 1
+    return workers
+
+
+def tune_chunk_size(total: int, workers: int, chunk_size: Optional[int] = None) -> int:
+    """작업 프로세스마다 청크가 CHUNKS_PER_WORKER개쯤 돌아가도록 청크 크기 결정
+
+    POSTPROCESS_CHUNK_SIZE 환경변수나 chunk_size를 주면 그 값을 그대로 사용한다
+    (bench_data_processor.py --workers N --chunk-sizes ...로 측정해 정함).
+    """
+    chunk_size = chunk_size or int(os.getenv('POSTPROCESS_CHUNK_SIZE', '0'))
+    if chunk_size > 0:
+        return chunk_size
+    return max(MIN_CHUNK_SIZE, min(MAX_CHUNK_SIZE, -(-total // (workers * CHUNKS_PER_WORKER))))
+
+
+def iter_chunks(records: Iterable, chunk_size: int) -> Iterator[List]:
+    """chunk_size건씩 나누어 반환 (BidRecord는 프로세스 간 전달을 위해 청크 단위로 dict로 변환)"""
+    iterator = iter(records)
+    while True:
+        chunk = to_dicts(islice(iterator, chunk_size))
+        if not chunk:
+            break
+        yield chunk
+
+
+def imap_ordered(func: Callable, chunks: Iterable, workers: int, window: Optional[int] = None) -> Iterator:
+    """청크를 프로세스 풀에서 처리하고 입력 순서대로 결과 반환
+
+    동시에 넘기는 청크 수를 window(기본 작업 프로세스 수의 2배)로 제한하여
+    입력이 스트림(제너레이터)이어도 메모리에 올라가는 청크 수가 일정하다.
+    workers가 1이면 프로세스 풀 없이 현재 프로세스에서 차례로 처리한다.
+    """
+    if workers <= 1:
+        for chunk in chunks:
+            yield func(chunk)
+        return
+
+    window = window or workers * 2
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        pending = deque()
+        for chunk in chunks:
+            pending.append(executor.submit(func, chunk))
+            if len(pending) >= window:
+                yield pending.popleft().result()
+        while pending:
+            yield pending.popleft().result()
+
+
+def _get_worker_processor():
+    """작업 프로세스별 DataProcessor (순환 import를 피해 처음 사용할 때 생성)"""
+    global _worker_processor
+    if _worker_processor is None:
+        from data_processor import DataProcessor
+        _worker_processor = DataProcessor(export_path=tempfile.gettempdir(), workers=1)
+    return _worker_processor
+
+
+def process_chunk(chunk: List[Dict]) -> pd.DataFrame:
+    """DataProcessor.process_crawling_results 청크 처리 (프로세스 풀 작업 - 모듈 최상위 함수여야 함)"""
+    return _get_worker_processor().process_crawling_results(chunk)
+
+
+def process_export_chunk(chunk: List[Dict]) -> pd.DataFrame:
+    """내보내기용(공고번호/게시일 등 추가 컬럼, 타입 변환) 청크 처리"""
+    processor = _get_worker_processor()
+    return processor.to_typed_frame(processor.process_crawling_results(chunk, export_columns=True))
+
+
+def clean_chunk(chunk: List[Dict]) -> List[Dict]:
+    """SearchValidator.clean_bid_data 청크 처리"""
+    from utils.crawler_core import SearchValidator
+    validator = SearchValidator()
+    return [validator.clean_bid_data(record) for record in chunk]
+
+
+def clean_results(records: List[Dict], workers: Optional[int] = None, chunk_size: Optional[int] = None) -> List[Dict]:
+    """결과 목록 전체를 정제본(clean_bid_data)으로 변환 - 결과가 많으면 프로세스 풀에서 나누어 처리"""
+    workers = resolve_workers(workers)
+    if len(records) < PARALLEL_MIN_RECORDS:
+        workers = 1
+    chunk_size = tune_chunk_size(len(records), workers, chunk_size)
+    cleaned = []
+    for chunk in imap_ordered(clean_chunk, iter_chunks(records, chunk_size), workers):
+        cleaned.extend(chunk)
+    if workers > 1:
+        logger.info(f"결과 정제 완료: {len(cleaned)}건 (프로세스 {workers}개, 청크 {chunk_size}건)")
+    return cleaned
@@ -0,0 +1,263 @@
+import asyncio
+import logging
+import time
+from typing import Awaitable, Callable, Dict, List, Optional
+
+from utils.cancellation import CancellationToken, CrawlCancelled
+
+logger = logging.getLogger(__name__)
+
+# 단계 사이 큐의 끝을 알리는 표시
+_END = None
+# 브라우저 재시작 시 같은 키워드 최대 시도 횟수
+KEYWORD_ATTEMPTS = 2
+
+
+class StageStats:
+    """파이프라인 단계별 처리 건수와 실제 작업 시간(큐 대기 제외)"""
+
+    def __init__(self, name: str, workers: int = 1):
+        self.name = name
+        self.workers = workers
+        self.items = 0
+        self.busy_seconds = 0.0
+
+    def to_dict(self, elapsed: float) -> Dict:
+        capacity = elapsed * self.workers
+        return {
+            "workers": self.workers,
+            "items": self.items,
+            "busy_seconds": round(self.busy_seconds, 3),
+            "utilization": round(self.busy_seconds / capacity, 3) if capacity else 0.0
+        }
+
+
+class QueueStats:
+    """큐 깊이 샘플 (put/get 시점에 기록)"""
+
+    def __init__(self, queue: asyncio.Queue):
+        self.queue = queue
+        self.samples = 0
+        self.total_depth = 0
+        self.max_depth = 0
+
+    def sample(self):
+        depth = self.queue.qsize()
+        self.samples += 1
+        self.total_depth += depth
+        self.max_depth = max(self.max_depth, depth)
+
+    def to_dict(self) -> Dict:
+        return {
+            "maxsize": self.queue.maxsize,
+            "depth": self.queue.qsize(),
+            "max_depth": self.max_depth,
+            "avg_depth": round(self.total_depth / self.samples, 2) if self.samples else 0.0
+        }
+
+
+class CrawlPipeline:
+    """목록 수집(브라우저) → 상세 보강(API) → 저장 단계를 bounded 큐로 연결한 파이프라인
+
+    브라우저가 다음 키워드를 검색하는 동안 이전 키워드의 API 상세 조회가 진행되므로
+    브라우저와 네트워크가 서로를 기다리지 않는다.
+    """
+
+    def __init__(self, crawler, keywords: List[str], api_crawler, validator,
+                 enricher_count: int = 3, queue_size: int = 20,
+                 should_stop: Callable[[], bool] = None,
+                 on_keyword: Callable[[str, int], Awaitable[None]] = None,
+                 monitor_interval: float = 5.0,
+                 cancel_token: CancellationToken = None):
+        self.crawler = crawler
+        self.keywords = keywords
+        self.api_crawler = api_crawler
+        self.validator = validator
+        self.enricher_count = enricher_count
+        self.should_stop = should_stop or (lambda: False)
+        self.on_keyword = on_keyword
+        self.monitor_interval = monitor_interval
+        self.cancel_token = cancel_token or CancellationToken()
+        self.cancelled_reason: Optional[str] = None
+
+        self.detail_queue: asyncio.Queue = asyncio.Queue(maxsize=queue_size)
+        self.sink_queue: asyncio.Queue = asyncio.Queue(maxsize=queue_size)
+        self.queue_stats = {
+            "detail": QueueStats(self.detail_queue),
+            "sink": QueueStats(self.sink_queue)
+        }
+        self.stage_stats = {
+            "list": StageStats("list"),
+            "enrich": StageStats("enrich", enricher_count),
+            "sink": StageStats("sink")
+        }
+        self.results: List[Dict] = []
+        self.started_at: Optional[float] = None
+        self.finished_at: Optional[float] = None
+
+    async def _put(self, name: str, item):
+        queue = self.queue_stats[name].queue
+        await queue.put(item)
+        self.queue_stats[name].sample()
+
+    async def _get(self, name: str):
+        item = await self.queue_stats[name].queue.get()
+        self.queue_stats[name].sample()
+        return item
+
+    async def _list_producer(self):
+        """키워드별 검색 후 목록/상세 페이지 데이터를 다음 단계로 전달 (브라우저 단계)"""
+        stats = self.stage_stats["list"]
+        aborted = False
+        try:
+            total_keywords = len(self.keywords)
+            for index, keyword in enumerate(self.keywords):
+                if self.should_stop() or self.cancel_token.cancelled:
+                    logger.info("파이프라인 중지 요청으로 목록 수집 종료")
+                    self.crawler.cancel_prefetches()
+                    break
+                if keyword in self.crawler.processed_keywords:
+                    logger.warning(f"키워드 '{keyword}' 이미 처리됨, 건너뜀")
+                    continue
+                if self.on_keyword:
+                    await self.on_keyword(keyword, index)
+                logger.info(f"\n진행 상황: {index + 1}/{total_keywords} ({((index + 1)/total_keywords)*100:.1f}%)")
+                logger.info(f"\n{'='*30}\n{keyword} 검색 시작\n{'='*30}")
+
+                start_time = time.monotonic()
+                records = []
+                for attempt in range(KEYWORD_ATTEMPTS):
+                    try:
+                        # 페이지 수/메모리 기준을 넘었으면 이 키워드부터 새 드라이버로 진행
+                        await self.crawler.maybe_recycle_driver()
+                        await self.crawler.ensure_list_ready(keyword)
+                        if await self.crawler.submit_search(keyword):
+                            records = await self.crawler.collect_search_rows(keyword)
+                        self.crawler.mark_keyword_processed(keyword)
+                        logger.info(f"키워드 '{keyword}' 목록 수집 완료: {len(records)}건")
+                        # 다음 키워드는 같은 목록 화면에서 검색창만 다시 제출
+                        break
+                    except Exception as e:
+                        logger.error(f"{keyword} 목록 수집 중 오류 발생: {str(e)}")
+                        records = []
+                        # 브라우저가 멈춰 다시 띄운 경우 같은 키워드를 처음부터 재시도
+                        if not await self.crawler.recover_after_error() or attempt + 1 >= KEYWORD_ATTEMPTS:
+                            break
+                        self.crawler.watchdog.stats["resumed_keywords"] += 1
+                        logger.info(f"드라이버 재시작 후 키워드 '{keyword}' 재시도")
+                stats.busy_seconds += time.monotonic() - start_time
+
+                for record in records:
+                    stats.items += 1
+                    await self._put("detail", record)
+        except (asyncio.CancelledError, CrawlCancelled):
+            # 중단 시에는 종료 표시를 넣지 않음 (다음 단계도 함께 취소되므로 큐가 비워지지 않음)
+            aborted = True
+            self.crawler.cancel_prefetches()
+            raise
+        finally:
+            if not aborted:
+                for _ in range(self.enricher_count):
+                    await self._put("detail", _END)
+
+    async def _detail_enricher(self):
+        """API 상세정보 보강 (네트워크 단계)"""
+        stats = self.stage_stats["enrich"]
+        while True:
+            record = await self._get("detail")
+            if record is _END:
+                break
+            start_time = time.monotonic()
+            try:
+                await self.crawler.enrich_with_api_detail(record, self.api_crawler)
+            except Exception as e:
+                logger.error(f"상세 보강 중 오류 ({record['basic_info'].get('bid_number')}): {str(e)}")
+            stats.busy_seconds += time.monotonic() - start_time
+            stats.items += 1
+            await self._put("sink", record)
+
+    async def _store(self, record: Dict):
+        """검증/중복 제거 후 결과 저장"""
+        stats = self.stage_stats["sink"]
+        validator = self.validator
+        start_time = time.monotonic()
+        try:
+            keyword = record.get('search_keyword', '')
+            if validator.validate_required_fields(record) and validator.validate_search_result(keyword, record):
+                if validator.remove_duplicates([record]):
+                    record = self.crawler.compact_record(record)
+                    self.crawler.all_results.append(record)
+                    self.results.append(record)
+                    await self.crawler._check_and_save_results()
+        except Exception as e:
+            logger.error(f"결과 저장 중 오류: {str(e)}")
+        stats.busy_seconds += time.monotonic() - start_time
+        stats.items += 1
+
+    async def _storage_sink(self):
+        """저장 단계 - 종료 표시를 받을 때까지 결과 저장"""
+        while True:
+            record = await self._get("sink")
+            if record is _END:
+                break
+            await self._store(record)
+
+    async def _drain_sink(self):
+        """중단 시 저장 큐에 남아 있는 (상세 보강까지 끝난) 결과를 마저 저장"""
+        while not self.sink_queue.empty():
+            record = self.sink_queue.get_nowait()
+            if record is not _END:
+                await self._store(record)
+
+    async def _monitor(self):
+        """큐 깊이와 단계 사용률을 주기적으로 로깅"""
+        while True:
+            await asyncio.sleep(self.monitor_interval)
+            stats = self.get_stats()
+            logger.info(
+                "파이프라인 상태 - "
+                + ", ".join(f"{name} 큐 {q['depth']}/{q['maxsize']}" for name, q in stats["queues"].items())
+                + " | "
+                + ", ".join(f"{name} {s['utilization']*100:.0f}%" for name, s in stats["stages"].items())
+            )
+
+    async def run(self) -> List[Dict]:
+        """파이프라인 실행 후 검증된 결과 반환 (취소 시 그때까지 저장된 결과 반환)"""
+        self.started_at = time.monotonic()
+        monitor_task = asyncio.create_task(self._monitor())
+        sink_task = asyncio.create_task(self._storage_sink())
+        work = asyncio.gather(
+            self._list_producer(),
+            *(self._detail_enricher() for _ in range(self.enricher_count))
+        )
+        try:
+            await self.cancel_token.run(work)
+            await self._put("sink", _END)
+            await sink_task
+        except CrawlCancelled as e:
+            work.cancel()
+            sink_task.cancel()
+            self.cancelled_reason = e.reason
+            await self._drain_sink()
+            logger.info(f"파이프라인 중단 ({e.reason}): 지금까지 저장된 {len(self.results)}건 반환")
+        finally:
+            monitor_task.cancel()
+            if not sink_task.done():
+                sink_task.cancel()
+            self.finished_at = time.monotonic()
+            logger.info(f"파이프라인 완료: {len(self.results)}건, 상태: {self.get_stats()}")
+        return self.results
+
+    def get_stats(self) -> Dict:
+        """단계별 사용률과 큐 깊이 반환"""
+        if self.started_at is None:
+            elapsed = 0.0
+        else:
+            elapsed = (self.finished_at or time.monotonic()) - self.started_at
+        return {
+            "elapsed_seconds": round(elapsed, 3),
+            "results": len(self.results),
+            "cancelled": self.cancelled_reason,
+            "stages": {name: stats.to_dict(elapsed) for name, stats in self.stage_stats.items()},
+            "queues": {name: stats.to_dict() for name, stats in self.queue_stats.items()}
+        }
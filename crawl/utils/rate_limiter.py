@@ -0,0 +1,125 @@
+import asyncio
+import logging
+import threading
+import time
+from typing import Dict, Optional
+
+from utils.constants import RATE_LIMITS
+
+logger = logging.getLogger(__name__)
+
+# 서버가 요청 제한을 걸었다고 판단하는 HTTP 상태 코드
+THROTTLE_STATUS_CODES = {429, 503}
+
+
+class TokenBucket:
+    """엔드포인트 하나의 토큰 버킷 (속도는 관측 결과에 따라 조정됨)"""
+
+    def __init__(self, name: str, config: Dict):
+        self.name = name
+        self.rate = config["rate"]  # 초당 허용 요청 수
+        self.min_rate = config.get("min_rate", self.rate)
+        self.max_rate = config.get("max_rate", self.rate)
+        self.capacity = config.get("burst", 1)
+        self.target_latency = config.get("target_latency", 2.0)
+        self.increase_step = config.get("increase_step", self.rate * 0.1)
+        self.tokens = float(self.capacity)
+        self.last_refill = time.monotonic()
+        self.avg_latency = None  # 지수 이동 평균 응답 시간
+        self.stats = {
+            "requests": 0,
+            "errors": 0,
+            "throttled": 0,
+            "waited_seconds": 0.0
+        }
+
+    def _refill(self, now: float):
+        elapsed = now - self.last_refill
+        self.tokens = min(self.capacity, self.tokens + elapsed * self.rate)
+        self.last_refill = now
+
+    def reserve(self) -> float:
+        """토큰 하나를 예약하고 사용 가능해질 때까지의 대기 시간(초) 반환"""
+        now = time.monotonic()
+        self._refill(now)
+        self.tokens -= 1
+        self.stats["requests"] += 1
+        if self.tokens >= 0:
+            return 0.0
+        return -self.tokens / self.rate
+
+    def adapt(self, latency: Optional[float], success: bool, throttled: bool):
+        """AIMD 방식으로 속도 조정 (정상 응답은 가산 증가, 지연/오류는 곱셈 감소)"""
+        if latency is not None:
+            if self.avg_latency is None:
+                self.avg_latency = latency
+            else:
+                self.avg_latency = 0.8 * self.avg_latency + 0.2 * latency
+
+        if throttled:
+            self.stats["throttled"] += 1
+            self.rate = self.min_rate
+            self.tokens = min(self.tokens, 0.0)
+        elif not success:
+            self.stats["errors"] += 1
+            self.rate = max(self.min_rate, self.rate * 0.5)
+        elif self.avg_latency is not None and self.avg_latency > self.target_latency:
+            self.rate = max(self.min_rate, self.rate * 0.8)
+        else:
+            self.rate = min(self.max_rate, self.rate + self.increase_step)
+
+
+class AdaptiveRateLimiter:
+    """Selenium/HTTP 경로가 공유하는 엔드포인트별 적응형 요청 속도 제한기"""
+
+    def __init__(self, limits: Dict = None):
+        self.limits = limits or RATE_LIMITS
+        self.buckets: Dict[str, TokenBucket] = {}
+        self._lock = threading.Lock()  # HTTP 요청이 스레드에서 실행될 수 있으므로 스레드 락 사용
+
+    def _get_bucket(self, endpoint: str) -> TokenBucket:
+        bucket = self.buckets.get(endpoint)
+        if bucket is None:
+            config = self.limits.get(endpoint, self.limits["default"])
+            bucket = TokenBucket(endpoint, config)
+            self.buckets[endpoint] = bucket
+        return bucket
+
+    async def acquire(self, endpoint: str):
+        """엔드포인트 요청 전 호출 - 허용 속도를 넘지 않도록 필요한 만큼만 대기"""
+        with self._lock:
+            bucket = self._get_bucket(endpoint)
+            delay = bucket.reserve()
+            bucket.stats["waited_seconds"] += delay
+        if delay > 0:
+            logger.debug(f"[{endpoint}] 요청 속도 제한 대기: {delay:.2f}초")
+            await asyncio.sleep(delay)
+
+    def record(self, endpoint: str, latency: Optional[float] = None,
+               success: bool = True, status_code: Optional[int] = None):
+        """요청 결과(응답 시간, 성공 여부, 상태 코드)를 반영하여 속도 조정"""
+        throttled = status_code in THROTTLE_STATUS_CODES
+        with self._lock:
+            bucket = self._get_bucket(endpoint)
+            previous_rate = bucket.rate
+            bucket.adapt(latency, success and not throttled, throttled)
+            if bucket.rate < previous_rate:
+                logger.info(
+                    f"[{endpoint}] 요청 속도 감소: {previous_rate:.2f} -> {bucket.rate:.2f} req/s "
+                    f"(응답시간: {latency if latency is not None else '-'}, 상태코드: {status_code})"
+                )
+
+    def get_stats(self) -> Dict:
+        """엔드포인트별 현재 속도와 누적 통계 반환"""
+        with self._lock:
+            return {
+                name: {
+                    **bucket.stats,
+                    "rate": round(bucket.rate, 3),
+                    "avg_latency": round(bucket.avg_latency, 3) if bucket.avg_latency is not None else None
+                }
+                for name, bucket in self.buckets.items()
+            }
+
+
+rate_limiter = AdaptiveRateLimiter()
@@ -0,0 +1,97 @@
+import json
+import logging
+import os
+from typing import Dict, List
+
+import requests
+
+logger = logging.getLogger(__name__)
+
+COOKIE_FIELDS = ("name", "value", "domain", "path", "secure", "httpOnly", "expiry")
+
+
+def export_driver_cookies(driver) -> List[Dict]:
+    """Selenium 드라이버의 현재 쿠키 목록 반환"""
+    try:
+        return [
+            {key: cookie[key] for key in COOKIE_FIELDS if key in cookie}
+            for cookie in driver.get_cookies()
+        ]
+    except Exception as e:
+        logger.error(f"드라이버 쿠키 내보내기 실패: {str(e)}")
+        return []
+
+
+def import_driver_cookies(driver, cookies: List[Dict]) -> int:
+    """CDP Network.setCookies로 쿠키 주입 (해당 도메인 페이지를 먼저 열 필요 없음)"""
+    if not cookies:
+        return 0
+    try:
+        cdp_cookies = []
+        for cookie in cookies:
+            cdp_cookie = {
+                "name": cookie["name"],
+                "value": cookie["value"],
+                "domain": cookie.get("domain", ".g2b.go.kr"),
+                "path": cookie.get("path", "/"),
+                "secure": cookie.get("secure", False),
+                "httpOnly": cookie.get("httpOnly", False)
+            }
+            if cookie.get("expiry"):
+                cdp_cookie["expires"] = cookie["expiry"]
+            cdp_cookies.append(cdp_cookie)
+        driver.execute_cdp_cmd("Network.setCookies", {"cookies": cdp_cookies})
+        return len(cdp_cookies)
+    except Exception as e:
+        logger.error(f"드라이버 쿠키 가져오기 실패: {str(e)}")
+        return 0
+
+
+def export_session_cookies(session: requests.Session) -> List[Dict]:
+    """requests 세션 쿠키를 Selenium 쿠키 형식으로 변환"""
+    return [
+        {
+            "name": cookie.name,
+            "value": cookie.value,
+            "domain": cookie.domain,
+            "path": cookie.path,
+            "secure": cookie.secure,
+            **({"expiry": cookie.expires} if cookie.expires else {})
+        }
+        for cookie in session.cookies
+    ]
+
+
+def import_session_cookies(session: requests.Session, cookies: List[Dict]) -> int:
+    """Selenium 형식 쿠키를 requests 세션에 설정"""
+    for cookie in cookies:
+        session.cookies.set(
+            cookie["name"],
+            cookie["value"],
+            domain=cookie.get("domain", ""),
+            path=cookie.get("path", "/")
+        )
+    return len(cookies)
+
+
+def save_cookies(path: str, cookies: List[Dict]):
+    """쿠키를 JSON 파일로 저장"""
+    try:
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump(cookies, f, ensure_ascii=False, indent=2)
+        logger.info(f"쿠키 저장 완료: {path} ({len(cookies)}개)")
+    except Exception as e:
+        logger.error(f"쿠키 저장 실패: {str(e)}")
+
+
+def load_cookies(path: str) -> List[Dict]:
+    """저장된 쿠키 JSON 파일 읽기 (없으면 빈 리스트)"""
+    if not os.path.exists(path):
+        return []
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            return json.load(f)
+    except Exception as e:
+        logger.error(f"쿠키 파일 읽기 실패: {str(e)}")
+        return []
@@ -0,0 +1,124 @@
+import logging
+import time
+from typing import Awaitable, Callable, Dict, List, Optional
+
+from utils.cancellation import CancellationToken
+from utils.constants import G2B_DETAIL_URL_TEMPLATE
+from utils.page_waits import PageWaiter
+from utils.rate_limiter import rate_limiter
+
+logger = logging.getLogger(__name__)
+
+
+def build_detail_url(bid_number: str) -> str:
+    """공고번호(예: R25BK00630352-000)로 상세 화면 URL 생성"""
+    bid_no, _, bid_ord = bid_number.partition("-")
+    return G2B_DETAIL_URL_TEMPLATE.format(bid_no=bid_no, bid_ord=bid_ord or "000")
+
+
+class DetailTabPool:
+    """같은 브라우저의 추가 탭에서 상세 페이지를 열어 목록 화면을 유지한 채 상세 정보 추출
+
+    한 배치의 탭들에 동시에 페이지 로드를 걸어두고 순서대로 전환하며 추출하므로
+    여러 상세 페이지의 로딩이 겹쳐서 진행된다.
+    """
+
+    def __init__(self, driver, waiter: PageWaiter,
+                 extract_detail: Callable[[], Awaitable[Dict]],
+                 close_popups: Callable[[], Awaitable[None]],
+                 size: int = 3,
+                 throttle: Callable[[str], Awaitable[None]] = None):
+        self.driver = driver
+        self.waiter = waiter
+        self.extract_detail = extract_detail
+        self.close_popups = close_popups
+        self.size = size
+        # 요청 속도 제한 대기 (크롤러는 워치독 마감에서 대기 시간을 빼는 함수를 넘김)
+        self.throttle = throttle or rate_limiter.acquire
+        self.list_handle = None
+        self.tab_handles: List[str] = []
+        self.stats = {"opened": 0, "extracted": 0, "failed": 0}
+
+    def _ensure_tabs(self):
+        """목록 창 핸들을 기억하고 부족한 탭을 생성"""
+        if self.list_handle is None or self.list_handle not in self.driver.window_handles:
+            self.list_handle = self.driver.current_window_handle
+        self.tab_handles = [handle for handle in self.tab_handles if handle in self.driver.window_handles]
+        while len(self.tab_handles) < self.size:
+            self.driver.switch_to.new_window('tab')
+            self.tab_handles.append(self.driver.current_window_handle)
+        self.driver.switch_to.window(self.list_handle)
+
+    async def _extract_in_tab(self, handle: str, bid_number: str, start_time: float) -> Optional[Dict]:
+        self.driver.switch_to.window(handle)
+        if not await self.waiter.wait_for_detail_page():
+            logger.warning(f"상세 탭 로딩 실패: {bid_number}")
+            rate_limiter.record("detail_page", success=False)
+            return None
+        await self.close_popups()
+        detail_data = await self.extract_detail()
+        rate_limiter.record("detail_page", latency=time.monotonic() - start_time, success=bool(detail_data))
+        return detail_data
+
+    async def fetch_many(self, bid_numbers: List[str],
+                         cancel_token: CancellationToken = None) -> Dict[str, Optional[Dict]]:
+        """공고번호별 상세 데이터 반환 - 실패한 항목은 None (호출 측에서 기존 방식으로 대체)
+
+        cancel_token이 취소되면 탭 사이에서 CrawlCancelled가 발생한다 (목록 창 복귀는 유지).
+        """
+        cancel_token = cancel_token or CancellationToken()
+        results: Dict[str, Optional[Dict]] = {}
+        if not bid_numbers:
+            return results
+
+        try:
+            self._ensure_tabs()
+            for batch_start in range(0, len(bid_numbers), self.size):
+                batch = bid_numbers[batch_start:batch_start + self.size]
+
+                # 1. 배치의 모든 탭에 페이지 로드 시작 (완료를 기다리지 않음)
+                started = []
+                for handle, bid_number in zip(self.tab_handles, batch):
+                    cancel_token.raise_if_cancelled()
+                    await self.throttle("detail_page")
+                    self.driver.switch_to.window(handle)
+                    self.driver.execute_script("window.location.href = arguments[0];", build_detail_url(bid_number))
+                    started.append((handle, bid_number, time.monotonic()))
+                    self.stats["opened"] += 1
+
+                # 2. 탭을 순서대로 전환하며 추출
+                for handle, bid_number, start_time in started:
+                    cancel_token.raise_if_cancelled()
+                    try:
+                        detail_data = await self._extract_in_tab(handle, bid_number, start_time)
+                    except Exception as e:
+                        logger.error(f"상세 탭 처리 중 오류 ({bid_number}): {str(e)}")
+                        detail_data = None
+                    results[bid_number] = detail_data
+                    self.stats["extracted" if detail_data else "failed"] += 1
+
+        except Exception as e:
+            logger.error(f"상세 탭 풀 처리 중 오류: {str(e)}")
+        finally:
+            try:
+                if self.list_handle:
+                    self.driver.switch_to.window(self.list_handle)
+            except Exception as e:
+                logger.error(f"목록 창 복귀 실패: {str(e)}")
+
+        return results
+
+    def close(self):
+        """추가 탭 정리 후 목록 창으로 복귀"""
+        for handle in self.tab_handles:
+            try:
+                self.driver.switch_to.window(handle)
+                self.driver.close()
+            except Exception:
+                continue
+        self.tab_handles = []
+        if self.list_handle:
+            try:
+                self.driver.switch_to.window(self.list_handle)
+            except Exception as e:
+                logger.error(f"목록 창 복귀 실패: {str(e)}")
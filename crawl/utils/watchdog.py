@@ -0,0 +1,165 @@
+import functools
+import itertools
+import logging
+import threading
+import time
+from contextlib import contextmanager
+from typing import Dict, Optional, Tuple
+
+import psutil
+from selenium.common.exceptions import WebDriverException
+
+logger = logging.getLogger(__name__)
+
+# 작업별 최대 허용 시간(초) - 넘으면 브라우저가 멈춘 것으로 보고 강제 종료
+DEFAULT_DEADLINES = {
+    "page_load": 30,   # driver.set_page_load_timeout
+    "navigate": 60,
+    "search": 30,
+    "collect": 60,     # 목록 행 읽기 (상세 페이지는 detail 마감으로 따로 감시)
+    "detail": 60,      # 상세 페이지 1건: 클릭/상세 화면/목록 복귀 대기 (탭 풀은 건수만큼 늘림)
+    "recover": 60,
+    "ping": 10,
+}
+CHECK_INTERVAL = 1.0
+
+
+class DriverUnresponsiveError(WebDriverException):
+    """워치독이 브라우저를 강제 종료한 뒤 이어지는 드라이버 작업에서 발생"""
+
+
+def kill_driver_processes(driver) -> int:
+    """chromedriver와 하위 Chrome 프로세스를 강제 종료 - 종료한 프로세스 수 반환"""
+    try:
+        root = psutil.Process(driver.service.process.pid)
+    except Exception as e:
+        logger.error(f"드라이버 프로세스 조회 실패: {str(e)}")
+        return 0
+    processes = root.children(recursive=True) + [root]
+    for process in processes:
+        try:
+            process.kill()
+        except psutil.NoSuchProcess:
+            continue
+    psutil.wait_procs(processes, timeout=5)
+    return len(processes)
+
+
+def guarded(operation: str):
+    """크롤러의 async 메서드를 워치독 마감 시간 안에서 실행하는 데코레이터"""
+    def decorator(func):
+        @functools.wraps(func)
+        async def wrapper(self, *args, **kwargs):
+            with self.watchdog.guard(operation):
+                return await func(self, *args, **kwargs)
+        return wrapper
+    return decorator
+
+
+class DriverWatchdog:
+    """브라우저 작업 마감 시간 감시
+
+    이벤트 루프는 멈춘 Selenium 호출에 묶여 있으므로 감시는 별도 스레드에서 한다.
+    마감을 넘긴 작업이 있으면 브라우저 프로세스를 종료하여 막힌 호출이 예외로 빠져나오게 하고,
+    크롤러는 tripped를 보고 드라이버를 다시 띄운다.
+    """
+
+    def __init__(self, deadlines: Dict[str, float] = None, check_interval: float = CHECK_INTERVAL):
+        self.deadlines = {**DEFAULT_DEADLINES, **(deadlines or {})}
+        self.check_interval = check_interval
+        self.driver = None
+        self.tripped: Optional[str] = None  # 강제 종료 사유 (새 드라이버 연결 시 초기화)
+        self.active: Dict[int, Tuple[str, float, float]] = {}  # 토큰 -> (작업, 시작, 마감)
+        self.stats = {"trips": {}, "kills": 0, "restarts": 0, "resumed_keywords": 0}
+        self._suspended = 0  # 요청 속도 제한 대기 중인 작업 수 (대기 시간은 마감에서 제외)
+        self._lock = threading.Lock()
+        self._tokens = itertools.count()
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def attach(self, driver):
+        """감시할 드라이버 연결 (드라이버를 새로 띄울 때마다 호출)"""
+        with self._lock:
+            self.driver = driver
+            self.tripped = None
+            self.active.clear()
+        if self._thread is None or not self._thread.is_alive():
+            self._stop.clear()
+            self._thread = threading.Thread(target=self._run, name="driver-watchdog", daemon=True)
+            self._thread.start()
+
+    @contextmanager
+    def guard(self, operation: str, timeout: float = None):
+        """블록 실행 시간이 마감을 넘으면 브라우저 강제 종료"""
+        if self.tripped:
+            raise DriverUnresponsiveError(f"브라우저 응답 없음: {self.tripped}")
+        token = next(self._tokens)
+        now = time.monotonic()
+        with self._lock:
+            self.active[token] = (operation, now, now + (timeout or self.deadlines.get(operation, 60)))
+        try:
+            yield
+        finally:
+            with self._lock:
+                self.active.pop(token, None)
+
+    @contextmanager
+    def suspend(self):
+        """블록 실행 동안 마감 검사를 멈추고, 끝나면 진행 중인 작업의 마감을 그 시간만큼 늦춤
+
+        브라우저가 아닌 요청 속도 제한(rate_limiter) 대기가 작업 시간에 포함되지 않도록 한다.
+        """
+        started = time.monotonic()
+        with self._lock:
+            self._suspended += 1
+        try:
+            yield
+        finally:
+            elapsed = time.monotonic() - started
+            with self._lock:
+                self._suspended -= 1
+                self.active = {
+                    token: (operation, start, deadline + elapsed)
+                    for token, (operation, start, deadline) in self.active.items()
+                }
+
+    def _expired(self) -> Optional[Tuple[str, float]]:
+        now = time.monotonic()
+        with self._lock:
+            if self._suspended:
+                return None
+            for operation, started, deadline in self.active.values():
+                if now >= deadline:
+                    return operation, now - started
+        return None
+
+    def _run(self):
+        while not self._stop.wait(self.check_interval):
+            if self.tripped or self.driver is None:
+                continue
+            expired = self._expired()
+            if not expired:
+                continue
+            operation, elapsed = expired
+            self.tripped = f"{operation} {elapsed:.0f}초 초과"
+            self.stats["trips"][operation] = self.stats["trips"].get(operation, 0) + 1
+            logger.error(f"워치독: 브라우저 응답 없음 ({self.tripped}), 강제 종료")
+            if kill_driver_processes(self.driver):
+                self.stats["kills"] += 1
+
+    def stop(self):
+        """감시 스레드 종료"""
+        self._stop.set()
+        if self._thread:
+            self._thread.join(timeout=self.check_interval * 2)
+            self._thread = None
+
+    def get_stats(self) -> Dict:
+        """작업별 마감 초과 횟수, 강제 종료/재시작 횟수 반환"""
+        now = time.monotonic()
+        with self._lock:
+            active = [
+                {"operation": operation, "elapsed_seconds": round(now - started, 1)}
+                for operation, started, _ in self.active.values()
+            ]
+        return {**self.stats, "tripped": self.tripped, "active": active}
@@ -0,0 +1,129 @@
+import base64
+import json
+import logging
+from typing import Dict, List
+
+from utils.constants import G2B_XHR_PATTERNS, G2B_LIST_FIELD_MAP
+
+logger = logging.getLogger(__name__)
+
+# ChromeOptions에 설정하는 성능 로그 capability
+PERFORMANCE_LOG_CAPABILITY = ("goog:loggingPrefs", {"performance": "ALL"})
+
+
+def enable_performance_logging(chrome_options):
+    """CDP Network 이벤트를 performance 로그로 받을 수 있도록 옵션 설정"""
+    chrome_options.set_capability(*PERFORMANCE_LOG_CAPABILITY)
+    return chrome_options
+
+
+def build_bid_number(item: Dict) -> str:
+    """bidPbancNo/bidPbancOrd로 화면과 같은 형식의 공고번호 생성 (예: R25BK00630352-000)"""
+    bid_number = item.get("bidPbancNo", "")
+    order = item.get("bidPbancOrd")
+    if bid_number and order and "-" not in bid_number:
+        return f"{bid_number}-{order}"
+    return bid_number
+
+
+def list_item_to_basic_info(item: Dict) -> Dict:
+    """목록 XHR 응답 한 건을 _extract_row_data와 같은 basic_info 구조로 변환"""
+    basic_info = {}
+    for name, fields in G2B_LIST_FIELD_MAP.items():
+        basic_info[name] = next(
+            (str(item[field]).strip() for field in fields if item.get(field) not in (None, "")),
+            None
+        )
+    basic_info["bid_number"] = build_bid_number(item)
+    return basic_info
+
+
+class XhrCapture:
+    """performance 로그에서 G2B 목록/상세 XHR의 JSON 응답 본문을 수집"""
+
+    def __init__(self, driver, patterns: Dict[str, List[str]] = None):
+        self.driver = driver
+        self.patterns = patterns or G2B_XHR_PATTERNS
+        self.pending: Dict[str, Dict] = {}  # requestId -> {"kind", "url"}
+        self.stats = {"captured": 0, "failed": 0}
+        try:
+            self.driver.execute_cdp_cmd("Network.enable", {})
+        except Exception as e:
+            logger.error(f"CDP Network 활성화 실패: {str(e)}")
+
+    def _match_kind(self, url: str):
+        for kind, patterns in self.patterns.items():
+            if any(pattern in url for pattern in patterns):
+                return kind
+        return None
+
+    def _get_body(self, request_id: str):
+        response = self.driver.execute_cdp_cmd("Network.getResponseBody", {"requestId": request_id})
+        body = response.get("body", "")
+        if response.get("base64Encoded"):
+            body = base64.b64decode(body).decode("utf-8")
+        return json.loads(body)
+
+    def drain(self) -> List[Dict]:
+        """지금까지 쌓인 로그를 읽어 완료된 대상 XHR의 응답을 반환 ([{"kind", "url", "data"}])"""
+        captured = []
+        try:
+            entries = self.driver.get_log("performance")
+        except Exception as e:
+            logger.error(f"performance 로그 조회 실패: {str(e)}")
+            return captured
+
+        for entry in entries:
+            try:
+                message = json.loads(entry["message"])["message"]
+                method = message.get("method")
+                params = message.get("params", {})
+
+                if method == "Network.responseReceived":
+                    url = params.get("response", {}).get("url", "")
+                    kind = self._match_kind(url)
+                    if kind:
+                        self.pending[params["requestId"]] = {"kind": kind, "url": url}
+
+                elif method == "Network.loadingFinished" and params.get("requestId") in self.pending:
+                    request = self.pending.pop(params["requestId"])
+                    try:
+                        captured.append({**request, "data": self._get_body(params["requestId"])})
+                        self.stats["captured"] += 1
+                    except Exception as e:
+                        self.stats["failed"] += 1
+                        logger.error(f"XHR 응답 본문 조회 실패 ({request['url']}): {str(e)}")
+
+            except Exception as e:
+                logger.debug(f"performance 로그 항목 처리 실패: {str(e)}")
+
+        return captured
+
+    def discard(self):
+        """이전 화면에서 쌓인 로그 폐기 (검색 제출 직전 호출)"""
+        self.drain()
+        self.pending.clear()
+
+    def extract_list_rows(self, captured: List[Dict]) -> List[Dict]:
+        """목록 XHR 응답에서 basic_info 목록 추출 (본문이 dict가 아니거나 result가 목록이 아닌 응답은 건너뜀)"""
+        rows = []
+        for response in captured:
+            if response["kind"] != "list" or not isinstance(response["data"], dict):
+                continue
+            items = response["data"].get("result")
+            if not isinstance(items, list):
+                continue
+            rows.extend(list_item_to_basic_info(item) for item in items if isinstance(item, dict))
+        return rows
+
+    def extract_details(self, captured: List[Dict]) -> Dict[str, Dict]:
+        """상세 XHR 응답을 공고번호별로 정리 (get_bid_detail 응답과 같은 구조)"""
+        details = {}
+        for response in captured:
+            if response["kind"] != "detail" or not isinstance(response["data"], dict):
+                continue
+            result = response["data"].get("result") or {}
+            bid_number = build_bid_number(result) if isinstance(result, dict) else ""
+            if bid_number:
+                details[bid_number] = response["data"]
+        return details